@@ -0,0 +1,81 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+try:
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=W0611
+    import __init__
+except ImportError:
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+    pass
+
+
+import timeit
+import argparse
+
+from gdtype import binaryapiv4
+from gdtype import commontypes as ct
+from gdtype.commontypes import Vector3
+
+
+## nested dict/list payload -- returns pair (value, number of values inside)
+def prepare_payload( depth: int, width: int ):
+    if depth < 1:
+        return ( [ 1, 2.5, "abc", Vector3( [1.0, 2.0, 3.0] ), None, True ], 7 )
+    ret_dict = {}
+    counter  = 1
+    for i in range( width ):
+        sub_value, sub_count = prepare_payload( depth - 1, width )
+        ret_dict[ f"key{i}" ] = [ i, sub_value ]
+        counter += 3 + sub_count
+    return ( ret_dict, counter )
+
+
+def measure( label, function, repeats, values_num ):
+    duration = min( timeit.repeat( function, number=repeats, repeat=5 ) ) / repeats
+    print( f"{label:<40} {duration * 1000:8.3f} ms    {duration / values_num * 1e9:8.1f} ns/value" )
+
+
+## ============================= main section ===================================
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Per-value dispatch overhead benchmark')
+    parser.add_argument('--depth', action='store', type=int, default=5, help='Nesting depth of payload' )
+    parser.add_argument('--width', action='store', type=int, default=4, help='Number of entries in each dict' )
+    parser.add_argument('--repeats', action='store', type=int, default=10, help='Number of repeats' )
+
+    args = parser.parse_args()
+
+    payload, values_number = prepare_payload( args.depth, args.width )
+    message = binaryapiv4.serialize( payload )
+    print( f"payload: {values_number} values, {len( message )} bytes" )
+
+    ## 'commontypes' functions called without codec use global configuration
+    measure( "deserialize (global configuration)", lambda: ct.deserialize( message ), args.repeats, values_number )
+    measure( "deserialize (codec dispatch table)", lambda: binaryapiv4.deserialize( message ),
+             args.repeats, values_number )
+    measure( "serialize (global configuration)", lambda: ct.serialize( payload ), args.repeats, values_number )
+    measure( "serialize (codec dispatch table)", lambda: binaryapiv4.serialize( payload ), args.repeats, values_number )
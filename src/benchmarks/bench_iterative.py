@@ -0,0 +1,93 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+try:
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=W0611
+    import __init__
+except ImportError:
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+    pass
+
+
+import timeit
+import argparse
+
+from gdtype import binaryapiv4
+from gdtype.commontypes import Vector3
+
+
+## chain of nested containers -- returns pair (value, number of values inside)
+def prepare_deep( depth: int ):
+    value = [ 1, "abc" ]
+    for i in range( depth ):
+        if i % 2 == 0:
+            value = [ value, i ]
+        else:
+            value = { "child": value }
+    return ( value, 2 + depth * 2 )
+
+
+## flat dict of small lists -- returns pair (value, number of values inside)
+def prepare_wide( width: int ):
+    value = { f"key{i}": [ i, 2.5, Vector3( [1.0, 2.0, 3.0] ) ] for i in range( width ) }
+    return ( value, 1 + width * 5 )
+
+
+def measure( label, function, repeats, values_num ):
+    try:
+        duration = min( timeit.repeat( function, number=repeats, repeat=5 ) ) / repeats
+    except RecursionError:
+        print( f"{label:<40} RecursionError" )
+        return
+    print( f"{label:<40} {duration * 1000:8.3f} ms    {duration / values_num * 1e9:8.1f} ns/value" )
+
+
+def compare( label, payload, values_number, repeats ):
+    message = binaryapiv4.serialize_iterative( payload )
+    print( f"{label}: {values_number} values, {len( message )} bytes" )
+    measure( "  deserialize (recursive)", lambda: binaryapiv4.deserialize( message ), repeats, values_number )
+    measure( "  deserialize (iterative)", lambda: binaryapiv4.deserialize_iterative( message ), repeats, values_number )
+    measure( "  serialize (recursive)", lambda: binaryapiv4.serialize( payload ), repeats, values_number )
+    measure( "  serialize (iterative)", lambda: binaryapiv4.serialize_iterative( payload ), repeats, values_number )
+
+
+## ============================= main section ===================================
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Recursive vs iterative (explicit stack) decoding '
+                                                 'and encoding benchmark')
+    parser.add_argument('--depth', action='store', type=int, default=200, help='Nesting depth of deep payload' )
+    parser.add_argument('--maxdepth', action='store', type=int, default=20000,
+                        help='Nesting depth of very deep payload' )
+    parser.add_argument('--width', action='store', type=int, default=10000, help='Number of entries of wide payload' )
+    parser.add_argument('--repeats', action='store', type=int, default=10, help='Number of repeats' )
+
+    args = parser.parse_args()
+
+    compare( "deep", *prepare_deep( args.depth ), args.repeats )
+    compare( "very deep", *prepare_deep( args.maxdepth ), args.repeats )
+    compare( "wide", *prepare_wide( args.width ), args.repeats )
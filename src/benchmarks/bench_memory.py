@@ -0,0 +1,98 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+try:
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=W0611
+    import __init__
+except ImportError:
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+    pass
+
+
+import struct
+import tracemalloc
+import argparse
+from dataclasses import dataclass
+
+from gdtype import binaryapiv4
+from gdtype.commontypes import Vector3
+
+
+## Vector3 keeping components in instance '__dict__' (layout of regular dataclass) -- reference for comparison
+@dataclass
+class DictVector3():
+    x: float = 0.0
+    y: float = 0.0
+    z: float = 0.0
+
+
+## measure memory allocated by 'function' -- returns pair (allocated bytes, result)
+def measure_memory( function ):
+    tracemalloc.start()
+    try:
+        result = function()
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return ( allocated, result )
+
+
+def report( label, allocated, items ):
+    print( f"{label:<40} {allocated / 1024:10.1f} KiB    {allocated / items:8.1f} bytes/Vector3" )
+
+
+## ============================= main section ===================================
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Memory taken by decoded Vector3 values')
+    parser.add_argument('--items', action='store', type=int, default=100000, help='Number of Vector3 values' )
+
+    args = parser.parse_args()
+
+    payload = [ Vector3( [1.0, 2.0, float(i)] ) for i in range( args.items ) ]
+    message = binaryapiv4.serialize( payload )
+    print( f"Array of {args.items} Vector3, {len( message )} bytes" )
+
+    allocated, decoded = measure_memory( lambda: binaryapiv4.deserialize( message ) )
+    report( "  decoded Array (slots)", allocated, args.items )
+    del decoded
+
+    ## the same values (including float objects) built by unpacking Array items
+    body = message[ 12: ]
+    allocated, decoded = measure_memory( lambda: [ Vector3.fromComponents( *item[1:] )
+                                                   for item in struct.iter_unpack( "<I3f", body ) ] )
+    report( "  unpacked Array (slots)", allocated, args.items )
+    del decoded
+    allocated, decoded = measure_memory( lambda: [ DictVector3( *item[1:] )
+                                                   for item in struct.iter_unpack( "<I3f", body ) ] )
+    report( "  unpacked Array (dict-based)", allocated, args.items )
+    del decoded
+
+    allocated, decoded = measure_memory( lambda: Vector3.fromComponents( 1.0, 2.0, 3.0 ) )
+    report( "  single Vector3 (slots)", allocated, 1 )
+    allocated, decoded = measure_memory( lambda: DictVector3( 1.0, 2.0, 3.0 ) )
+    report( "  single dict-based Vector3", allocated, 1 )
@@ -0,0 +1,95 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+try:
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=W0611
+    import __init__
+except ImportError:
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+    pass
+
+
+import timeit
+import argparse
+
+from gdtype import binaryapiv4
+from gdtype import commontypes as ct
+from gdtype.commontypes import Vector3
+
+
+## snapshot of entities -- Array of Dictionaries with the same 12 keys
+def prepare_snapshot( entities: int ):
+    snapshot = []
+    for i in range( entities ):
+        entity = { "id": i, "name": f"entity{i}", "position": Vector3( [1.0, 2.0, float(i)] ), "rotation": 0.5,
+                   "velocity": Vector3( [0.0, 0.0, 1.0] ), "health": 100, "team": i % 2, "alive": True,
+                   "state": "idle", "target": -1, "ammo": 30, "score": i * 10 }
+        snapshot.append( entity )
+    return snapshot
+
+
+def measure( label, function, repeats, entities ):
+    duration = min( timeit.repeat( function, number=repeats, repeat=5 ) ) / repeats
+    print( f"{label:<40} {duration * 1000:8.3f} ms    {duration / entities * 1e9:8.1f} ns/entity" )
+
+
+def report_shapes( label, message, shapes: ct.ShapeCache ):
+    binaryapiv4.deserialize( message, shapes=shapes )
+    print( f"{label:<40} hits: {shapes.hits} misses: {shapes.misses} hit rate: {shapes.hitRate() * 100:.2f}%" )
+
+
+## ============================= main section ===================================
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Decoding Array of same-keyed Dictionaries '
+                                                 'with and without shapes cache')
+    parser.add_argument('--entities', action='store', type=int, default=10000, help='Number of entities in snapshot' )
+    parser.add_argument('--repeats', action='store', type=int, default=5, help='Number of repeats' )
+
+    args = parser.parse_args()
+
+    payload = prepare_snapshot( args.entities )
+    message = binaryapiv4.serialize( payload )
+    print( f"snapshot: {args.entities} entities, {len( message )} bytes" )
+
+    codec = binaryapiv4.CODEC
+    measure( "  deserialize (no shapes)",
+             lambda: ct.deserialize_custom( message, ct.deserialize_type, codec ), args.repeats, args.entities )
+    measure( "  deserialize (shapes)",
+             lambda: binaryapiv4.deserialize( message, shapes=ct.ShapeCache() ), args.repeats, args.entities )
+    measure( "  deserialize (shapes, records)",
+             lambda: binaryapiv4.deserialize( message, shapes=ct.ShapeCache( record=True ) ),
+             args.repeats, args.entities )
+    measure( "  deserialize_trusted (shapes)",
+             lambda: binaryapiv4.deserialize_trusted( message, shapes=ct.ShapeCache() ), args.repeats, args.entities )
+
+    report_shapes( "  single message", message, ct.ShapeCache() )
+    shared = ct.ShapeCache()
+    for _ in range( 10 ):
+        binaryapiv4.deserialize( message, shapes=shared )
+    print( f"{'  10 messages (shared cache)':<40} hits: {shared.hits} misses: {shared.misses}"
+           f" hit rate: {shared.hitRate() * 100:.2f}%" )
@@ -0,0 +1,221 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+import asyncio
+
+from . import binaryapiv4
+from .deserializationstream import DeserializationStream
+from .serializationstream import SerializationStream
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+## default limit of received and not consumed data
+MAX_BUFFERED = 1024 * 1024
+
+## default size of single read
+READ_SIZE = 64 * 1024
+
+
+## iterate over messages received by 'asyncio.StreamReader'
+async def iter_messages( reader: asyncio.StreamReader, codec=binaryapiv4.CODEC, read_size: int = READ_SIZE,
+                         limits=None ):
+    stream = DeserializationStream( codec, limits=limits )
+    while True:
+        data = await reader.read( read_size )
+        if not data:
+            break
+        stream.appendData( data )
+        for message in stream.receiveList():
+            yield message
+    if stream.size() > 0:
+        _LOGGER.warning( "connection closed with incomplete message: %s bytes", stream.size() )
+
+
+## ===================================================================
+
+
+##
+## Protocol receiving messages directly into buffer of deserialization stream.
+##
+## Received messages are consumed by 'receive()' or by 'async for'. Reading from transport
+## is paused when more than 'max_buffered' bytes is waiting for consumption. Message announcing
+## size over 'max_buffered' (or over limit of 'limits') is rejected as soon as its header arrives:
+## transport is closed and the error is raised by 'receive()'.
+##
+class MessageProtocol( asyncio.BufferedProtocol ):
+
+    def __init__(self, codec=binaryapiv4.CODEC, max_buffered: int = MAX_BUFFERED, limits=None):
+        self.codec        = codec
+        self.max_buffered = max_buffered
+        self.stream       = DeserializationStream( codec, limits=limits )
+        self.transport    = None
+        self.paused       = False
+        self.closed       = False
+        self._exception   = None
+        self._error       = None       ## error of received data (raised by 'receive()')
+        self._waiter: asyncio.Future = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint):
+        if sizehint < 1:
+            sizehint = READ_SIZE
+        return self.stream.getWriteBuffer( sizehint )
+
+    def buffer_updated(self, nbytes):
+        ## raising from callback would close transport without notifying consumer
+        try:
+            self.stream.commitWrite( nbytes )
+        except ValueError as exc:
+            self._fail( exc )
+        self._updateReading()
+        self._wakeup()
+
+    def eof_received(self):
+        self.closed = True
+        self._wakeup()
+        return False                ## close transport
+
+    def connection_lost(self, exc):
+        self.closed     = True
+        self._exception = exc
+        self._wakeup()
+
+    ## =====================================================
+
+    ## return next received message
+    ## raises 'EOFError' if connection is closed, 'ValueError' if invalid data was received
+    async def receive(self):
+        while True:
+            if self._error is not None:
+                raise self._error
+            if self.stream.containsMessage():
+                message = self.stream.receive()[1]
+                self._updateReading()
+                return message
+            if self.closed:
+                if self._exception is not None:
+                    raise self._exception
+                raise EOFError( f"connection closed, remaining data: {self.stream.size()} bytes" )
+            ## message is incomplete -- reading can not be blocked
+            self._updateReading()
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.receive()
+        except EOFError as exc:
+            raise StopAsyncIteration from exc
+
+    ## =====================================================
+
+    def _updateReading(self):
+        if self.transport is None or self.closed:
+            return
+        try:
+            ## reject huge message before receiving it
+            message_size = self.stream.messageSize()
+            if message_size > self.max_buffered:
+                raise ValueError( f"message exceeds buffer limit: {message_size} > {self.max_buffered}" )
+            ## checks size of message against 'limits' as well
+            complete = self.stream.containsMessage()
+            overflow = complete and self.stream.size() > self.max_buffered
+        except ValueError as exc:
+            self._fail( exc )
+            return
+        if overflow and not self.paused:
+            self.paused = True
+            self.transport.pause_reading()
+        elif not overflow and self.paused:
+            self.paused = False
+            self.transport.resume_reading()
+
+    ## store error of received data (raised by 'receive()') and close connection
+    def _fail(self, exc: ValueError):
+        _LOGGER.error( "invalid data received: %s", exc )
+        self._error = exc
+        self.closed = True
+        if self.transport is not None:
+            self.transport.close()
+
+    def _wakeup(self):
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result( None )
+
+
+## ===================================================================
+
+
+##
+## Writer batching messages written in one iteration of event loop.
+##
+## 'writer' is 'asyncio.StreamWriter' or transport (object with 'write(bytes)' method).
+## Values are encoded into one buffer and passed to 'writer' by single 'write()' call
+## scheduled to next iteration of event loop (or by explicit 'flush()' or 'drain()').
+##
+class MessageWriter:
+
+    def __init__(self, writer, codec=binaryapiv4.CODEC):
+        self.writer = writer
+        self.stream = SerializationStream( codec )
+        self._flush_handle: asyncio.Handle = None
+
+    def write(self, value):
+        self.stream.appendValue( value )
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon( self.flush )
+
+    def writeList(self, values):
+        for item in values:
+            self.write( item )
+
+    ## pass encoded messages to writer
+    def flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self.stream.size() > 0:
+            self.writer.write( self.stream.popData() )
+
+    ## flush messages and wait for underlying writer
+    async def drain(self):
+        self.flush()
+        drain = getattr( self.writer, "drain", None )
+        if drain is not None:
+            await drain()
+
+    def close(self):
+        self.flush()
+        self.writer.close()
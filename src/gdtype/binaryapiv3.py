@@ -25,6 +25,7 @@ import logging
 from enum import IntEnum, unique
 
 from . import commontypes as ct
+from .codec import Codec
 
 from .commontypes import Vector2, Rect2,\
     Vector3, Transform2D, Plane, Quaternion, AABB,\
@@ -37,18 +38,6 @@ from .commontypes import ByteArray,\
 _LOGGER = logging.getLogger(__name__)
 
 
-##
-## interface functions
-##
-deserialize        = ct.deserialize
-serialize          = ct.serialize
-get_message_length = ct.get_message_length
-check_message_size = ct.check_message_size
-
-
-## ============================================================
-
-
 @unique
 class GodotType( IntEnum ):
     NULL                = 0
@@ -130,11 +119,36 @@ CONFIG_LIST = [
 ## ======================================================================
 
 
+## codec of Godot 3 binary API
+CODEC = Codec( CONFIG_LIST, ct )
+
 ##
 ## DESERIALIZATION_MAP: Dict[ Godot_Type_Id, <deserialize_function> ]
 ## SERIALIZATION_MAP:   Dict[ Python_Type, (Godot_Type_Id, <serialize_function>) ]
 ##
-DESERIALIZATION_MAP, SERIALIZATION_MAP = ct.prepare_config_dicts( CONFIG_LIST, ct )
+DESERIALIZATION_MAP = CODEC.deserialization_map
+SERIALIZATION_MAP   = CODEC.serialization_map
+
+
+##
+## interface functions
+##
+deserialize           = CODEC.deserialize
+deserialize_iterative = CODEC.deserialize_iterative
+serialize_iterative   = CODEC.serialize_iterative
+deserialize_trusted   = CODEC.deserialize_trusted
+deserialize_lazy      = CODEC.deserialize_lazy
+extract               = CODEC.extract
+iter_events           = CODEC.iter_events
+serialize             = CODEC.serialize
+serialize_into        = CODEC.serialize_into
+encoded_size          = CODEC.encoded_size
+validate              = CODEC.validate
+get_message_length    = ct.get_message_length
+check_message_size    = ct.check_message_size
+
+
+## ============================================================
 
 
 def get_deserialization_function_v3( gd_type_id: int ):
@@ -149,5 +163,7 @@ def get_serialization_config_v3( py_type: type ):
 
 
 ## override 'abstract' functions
+## used only by functions called without codec (e.g. 'commontypes.deserialize()'),
+## in such case configuration of last imported module is used
 ct.get_deserialization_function = get_deserialization_function_v3
 ct.get_serialization_config     = get_serialization_config_v3
@@ -25,6 +25,7 @@ import logging
 from enum import IntEnum, unique
 
 from . import commontypes as ct
+from .codec import Codec
 
 from .commontypes import Vector2, Vector2i, Rect2, Rect2i,\
     Vector3, Vector3i, Transform2D, Vector4, Vector4i, Plane, Quaternion, AABB,\
@@ -37,18 +38,6 @@ from .commontypes import ByteArray,\
 _LOGGER = logging.getLogger(__name__)
 
 
-##
-## interface functions
-##
-deserialize        = ct.deserialize
-serialize          = ct.serialize
-get_message_length = ct.get_message_length
-check_message_size = ct.check_message_size
-
-
-## ============================================================
-
-
 @unique
 class GodotType( IntEnum ):
     NULL                = 0
@@ -150,11 +139,36 @@ CONFIG_LIST = [
 ## ======================================================================
 
 
+## codec of Godot 4 binary API
+CODEC = Codec( CONFIG_LIST, ct )
+
 ##
 ## DESERIALIZATION_MAP: Dict[ Godot_Type_Id, <deserialize_function> ]
 ## SERIALIZATION_MAP:   Dict[ Python_Type, (Godot_Type_Id, <serialize_function>) ]
 ##
-DESERIALIZATION_MAP, SERIALIZATION_MAP = ct.prepare_config_dicts( CONFIG_LIST, ct )
+DESERIALIZATION_MAP = CODEC.deserialization_map
+SERIALIZATION_MAP   = CODEC.serialization_map
+
+
+##
+## interface functions
+##
+deserialize           = CODEC.deserialize
+deserialize_iterative = CODEC.deserialize_iterative
+serialize_iterative   = CODEC.serialize_iterative
+deserialize_trusted   = CODEC.deserialize_trusted
+deserialize_lazy      = CODEC.deserialize_lazy
+extract               = CODEC.extract
+iter_events           = CODEC.iter_events
+serialize             = CODEC.serialize
+serialize_into        = CODEC.serialize_into
+encoded_size          = CODEC.encoded_size
+validate              = CODEC.validate
+get_message_length    = ct.get_message_length
+check_message_size    = ct.check_message_size
+
+
+## ============================================================
 
 
 def get_deserialization_function_v4( gd_type_id: int ):
@@ -169,5 +183,7 @@ def get_serialization_config_v4( py_type: type ):
 
 
 ## override 'abstract' functions
+## used only by functions called without codec (e.g. 'commontypes.deserialize()'),
+## in such case configuration of last imported module is used
 ct.get_deserialization_function = get_deserialization_function_v4
 ct.get_serialization_config     = get_serialization_config_v4
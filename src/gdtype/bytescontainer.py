@@ -22,7 +22,9 @@
 #
 
 import logging
+import sys
 import struct
+import array
 from typing import List
 
 
@@ -32,10 +34,14 @@ _LOGGER = logging.getLogger(__name__)
 ## mutable wrapper for bytes
 class BytesContainer:
 
-    def __init__(self, data: bytes = None):
+    def __init__(self, data: bytes = None, codec=None):
         self.data = data
         if self.data is None:
             self.data = bytes()
+        self.codec  = codec         ## configuration used for nested types (None means global configuration)
+        self.guard  = None          ## decode limits state (see 'commontypes.LimitsGuard')
+        self.shapes = None          ## cache of Dictionary shapes (see 'commontypes.ShapeCache')
+        self.intern = None          ## table of interned strings (see 'commontypes.InternTable')
 
     def __len__(self):
         return len( self.data )
@@ -51,6 +57,14 @@ class BytesContainer:
         self.data = self.data[ size: ]
         return ret_data
 
+    ## pop front as buffer object
+    def popBuffer(self, size):
+        return self.pop( size )
+
+    ## drop front without reading data
+    def skip(self, size):
+        self.data = self.data[ size: ]
+
     ## pop int from front
     def popInt32(self) -> int:
         raw = self.pop(4)
@@ -64,11 +78,8 @@ class BytesContainer:
         return proper_data
 
     def popInt32Items(self, items_number) -> List[ int ]:
-        retList = []
-        for _ in range(0, items_number):
-            value = self.popInt32()
-            retList.append( value )
-        return retList
+        raw = self.pop( 4 * items_number )
+        return list( struct.unpack( f"<{items_number}i", raw ) )
 
     def popInt64(self) -> int:
         raw = self.pop(8)
@@ -82,11 +93,8 @@ class BytesContainer:
         return proper_data
 
     def popInt64Items(self, items_number) -> List[ int ]:
-        retList = []
-        for _ in range(0, items_number):
-            value = self.popInt64()
-            retList.append( value )
-        return retList
+        raw = self.pop( 8 * items_number )
+        return list( struct.unpack( f"<{items_number}q", raw ) )
 
     def popFloat32(self) -> float:
         raw = self.pop(4)
@@ -95,11 +103,8 @@ class BytesContainer:
         return proper_data
 
     def popFloat32Items(self, items_number) -> List[ float ]:
-        retList = []
-        for _ in range(0, items_number):
-            value = self.popFloat32()
-            retList.append( value )
-        return retList
+        raw = self.pop( 4 * items_number )
+        return list( struct.unpack( f"<{items_number}f", raw ) )
 
     def popFloat64(self) -> float:
         raw = self.pop(8)
@@ -108,11 +113,15 @@ class BytesContainer:
         return proper_data
 
     def popFloat64Items(self, items_number) -> List[ float ]:
-        retList = []
-        for _ in range(0, items_number):
-            value = self.popFloat64()
-            retList.append( value )
-        return retList
+        raw = self.pop( 8 * items_number )
+        return list( struct.unpack( f"<{items_number}d", raw ) )
+
+    ## pop values of given 'struct.Struct' format
+    def popStruct(self, items_struct) -> tuple:
+        raw = self.pop( items_struct.size )
+        if len( raw ) < items_struct.size:
+            raise ValueError( f"invalid packet -- too short: {len( raw )} < {items_struct.size}" )
+        return items_struct.unpack( raw )
 
     def popStringRaw(self, string_len: int) -> str:
         data_string = self.pop( string_len )
@@ -123,6 +132,7 @@ class BytesContainer:
             string_len = self.popInt32()
         if string_len < 1:
             return ""
+        self._checkString( string_len )
         proper_data = self. popStringRaw( string_len )
         remaining = string_len % 4
         if remaining > 0:
@@ -131,6 +141,28 @@ class BytesContainer:
             self.pop( padding )
         return proper_data
 
+    ## pop string as raw encoded bytes (without padding)
+    def popStringBuffer(self, string_len: int = -1 ):
+        if string_len < 0:
+            string_len = self.popInt32()
+        if string_len < 1:
+            return b""
+        self._checkString( string_len )
+        raw = self.popBuffer( string_len )
+        remaining = string_len % 4
+        if remaining > 0:
+            ## skip remaining padding (zero bytes)
+            self.skip( 4 - remaining )
+        return raw
+
+    ## check string size read from message before reading the string
+    def _checkString(self, string_len: int):
+        data_len = self.size()
+        if string_len > data_len:
+            raise ValueError( f"invalid packet -- too short: {data_len} < {string_len}" )
+        if self.guard is not None:
+            self.guard.checkString( string_len )
+
     ## pop from front
     def popFlagsType(self) -> int:
         raw = self.popInt32()
@@ -146,10 +178,7 @@ class BytesContainer:
     def pushZeros( self, number: int ):
         if number < 1:
             return
-        zeros = bytes()
-        for _ in range( 0, number ):
-            zeros = zeros + b'\x00'
-        self.data = self.data + zeros
+        self.data = self.data + bytes( number )
 
     ## push back value
     def pushInt32( self, value: int ):
@@ -161,8 +190,8 @@ class BytesContainer:
         self.push( raw )
 
     def pushInt32Items(self, value_array: List[int] ):
-        for item in value_array:
-            self.pushInt32( item )
+        raw = struct.pack( f"<{len(value_array)}i", *value_array )
+        self.push( raw )
 
     ## push back value
     def pushInt64( self, value: int ):
@@ -174,24 +203,24 @@ class BytesContainer:
         self.push( raw )
 
     def pushInt64Items(self, value_array: List[int] ):
-        for item in value_array:
-            self.pushInt64( item )
+        raw = struct.pack( f"<{len(value_array)}q", *value_array )
+        self.push( raw )
 
     def pushFloat32(self, value: float):
         raw = struct.pack( "<f", value )
         self.push( raw )
 
     def pushFloat32Items(self, value_array: List[float] ):
-        for item in value_array:
-            self.pushFloat32( item )
+        raw = struct.pack( f"<{len(value_array)}f", *value_array )
+        self.push( raw )
 
     def pushFloat64(self, value: float):
         raw = struct.pack( "<d", value )
         self.push( raw )
 
     def pushFloat64Items(self, value_array: List[float] ):
-        for item in value_array:
-            self.pushFloat64( item )
+        raw = struct.pack( f"<{len(value_array)}d", *value_array )
+        self.push( raw )
 
     def pushStringRaw(self, value: str):
         raw = value.encode("utf-8")
@@ -215,3 +244,479 @@ class BytesContainer:
 
     def __str__(self):
         return str( self.data )
+
+
+## =====================================================
+
+
+_INT32_STRUCT   = struct.Struct( "<i" )
+_UINT32_STRUCT  = struct.Struct( "<I" )
+_INT64_STRUCT   = struct.Struct( "<q" )
+_UINT64_STRUCT  = struct.Struct( "<Q" )
+_FLOAT32_STRUCT = struct.Struct( "<f" )
+_FLOAT64_STRUCT = struct.Struct( "<d" )
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+## read-only cursor over immutable buffer
+## 'pop' methods advance read offset instead of copying remaining data,
+## so reading whole buffer is linear to its size
+## provides the same reading interface as BytesContainer
+class BytesReader:
+
+    def __init__(self, data=None, start: int = 0, end: int = None, codec=None):
+        if data is None:
+            data = bytes()
+        view = memoryview( data )
+        if view.format != "B":
+            view = view.cast( "B" )
+        self.view   = view[ start:end ]
+        self.offset = 0
+        self.codec  = codec         ## configuration used for nested types (None means global configuration)
+        self.guard  = None          ## decode limits state (see 'commontypes.LimitsGuard')
+        self.shapes = None          ## cache of Dictionary shapes (see 'commontypes.ShapeCache')
+        self.intern = None          ## table of interned strings (see 'commontypes.InternTable')
+
+    def __len__(self):
+        return len( self.view ) - self.offset
+
+    def size(self):
+        return len( self.view ) - self.offset
+
+    ## release underlying buffer (allows to resize source 'bytearray')
+    def release(self):
+        self.view.release()
+
+    ## =====================================================
+
+    ## pop front
+    def pop(self, size) -> bytes:
+        start = self.offset
+        stop  = min( start + size, len( self.view ) )
+        self.offset = stop
+        return bytes( self.view[ start:stop ] )
+
+    ## pop front as buffer object
+    ## returns 'memoryview' without copying if underlying data is immutable, otherwise copy of data
+    def popBuffer(self, size):
+        start = self.offset
+        stop  = min( start + size, len( self.view ) )
+        self.offset = stop
+        if self.view.readonly:
+            return self.view[ start:stop ]
+        return bytes( self.view[ start:stop ] )
+
+    ## move read offset forward without reading data
+    def skip(self, size):
+        self.offset = min( self.offset + size, len( self.view ) )
+
+    ## pop int from front
+    def popInt32(self) -> int:
+        try:
+            value = _INT32_STRUCT.unpack_from( self.view, self.offset )[0]
+        except struct.error as exc:
+            raise self._tooShort( 4 ) from exc
+        self.offset += 4
+        return value
+
+    def popInt32Items(self, items_number) -> List[ int ]:
+        return self._popItems( "i", items_number )
+
+    def popInt64(self) -> int:
+        try:
+            value = _INT64_STRUCT.unpack_from( self.view, self.offset )[0]
+        except struct.error as exc:
+            raise self._tooShort( 8 ) from exc
+        self.offset += 8
+        return value
+
+    def popInt64Items(self, items_number) -> List[ int ]:
+        return self._popItems( "q", items_number )
+
+    def popFloat32(self) -> float:
+        try:
+            value = _FLOAT32_STRUCT.unpack_from( self.view, self.offset )[0]
+        except struct.error as exc:
+            raise self._tooShort( 4 ) from exc
+        self.offset += 4
+        return value
+
+    def popFloat32Items(self, items_number) -> List[ float ]:
+        return self._popItems( "f", items_number )
+
+    def popFloat64(self) -> float:
+        try:
+            value = _FLOAT64_STRUCT.unpack_from( self.view, self.offset )[0]
+        except struct.error as exc:
+            raise self._tooShort( 8 ) from exc
+        self.offset += 8
+        return value
+
+    def popFloat64Items(self, items_number) -> List[ float ]:
+        return self._popItems( "d", items_number )
+
+    ## pop values of given 'struct.Struct' format
+    def popStruct(self, items_struct) -> tuple:
+        start = self.offset
+        stop  = start + items_struct.size
+        if stop > len( self.view ):
+            raise ValueError( f"invalid packet -- too short: {len( self.view ) - start} < {items_struct.size}" )
+        self.offset = stop
+        return items_struct.unpack_from( self.view, start )
+
+    ## bulk read of 'items_number' values of given 'array' type code
+    def _popItems(self, typecode: str, items_number: int) -> list:
+        values = array.array( typecode )
+        start  = self.offset
+        stop   = start + values.itemsize * items_number
+        if stop > len( self.view ):
+            raise ValueError( f"invalid packet -- too short: {len( self.view ) - start} < {stop - start}" )
+        values.frombytes( self.view[ start:stop ] )
+        if _BIG_ENDIAN:
+            values.byteswap()
+        self.offset = stop
+        return values.tolist()
+
+    def popStringRaw(self, string_len: int) -> str:
+        start = self.offset
+        stop  = min( start + string_len, len( self.view ) )
+        self.offset = stop
+        return str( self.view[ start:stop ], "utf-8" )
+
+    def popString(self, string_len: int = -1 ) -> str:
+        if string_len < 0:
+            string_len = self.popInt32()
+        if string_len < 1:
+            return ""
+        if string_len > len( self.view ) - self.offset or self.guard is not None:
+            self._checkString( string_len )
+        proper_data = self.popStringRaw( string_len )
+        remaining = string_len % 4
+        if remaining > 0:
+            padding = 4 - remaining
+            ## skip remaining padding (zero bytes)
+            self.skip( padding )
+        return proper_data
+
+    ## pop string as raw encoded bytes (without padding)
+    ## returns 'memoryview' without copying if underlying data is immutable, otherwise copy of data
+    def popStringBuffer(self, string_len: int = -1 ):
+        if string_len < 0:
+            string_len = self.popInt32()
+        if string_len < 1:
+            return b""
+        if string_len > len( self.view ) - self.offset or self.guard is not None:
+            self._checkString( string_len )
+        start = self.offset
+        stop  = start + string_len
+        ## skip padding (zero bytes)
+        self.offset = min( stop + (-string_len % 4), len( self.view ) )
+        if self.view.readonly:
+            return self.view[ start:stop ]
+        return bytes( self.view[ start:stop ] )
+
+    ## check string size read from message before reading the string
+    def _checkString(self, string_len: int):
+        data_len = self.size()
+        if string_len > data_len:
+            raise ValueError( f"invalid packet -- too short: {data_len} < {string_len}" )
+        if self.guard is not None:
+            self.guard.checkString( string_len )
+
+    ## pop from front
+    def popFlagsType(self) -> int:
+        try:
+            raw = _UINT32_STRUCT.unpack_from( self.view, self.offset )[0]
+        except struct.error as exc:
+            raise self._tooShort( 4 ) from exc
+        self.offset += 4
+        data_type  = raw & 0xFF
+        data_flags = (raw >> 16) & 0xFF
+        return ( data_flags, data_type )
+
+    ## error of reading 'size' bytes past end of data
+    def _tooShort(self, size: int) -> ValueError:
+        return ValueError( f"invalid packet -- too short: {self.size()} < {size}" )
+
+    ## =====================================================
+
+    def __str__(self):
+        return str( bytes( self.view[ self.offset: ] ) )
+
+
+## =====================================================
+
+
+## append-only writer
+## appends into growable 'bytearray' (amortized constant time)
+## instead of reallocating whole data on every push
+## provides the same writing interface as BytesContainer
+class BytesWriter:
+
+    def __init__(self, codec=None):
+        self.data  = bytearray()
+        self.codec = codec          ## configuration used for nested types (None means global configuration)
+
+    def __len__(self):
+        return len( self.data )
+
+    def size(self):
+        return len( self.data )
+
+    ## return copy of written data
+    def getBytes(self) -> bytes:
+        return bytes( self.data )
+
+    ## =====================================================
+
+    ## append given number of zero bytes and return offset of reserved space
+    ## reserved space can be filled later using 'set' methods
+    def reserve(self, number: int) -> int:
+        offset = len( self.data )
+        self.pushZeros( number )
+        return offset
+
+    ## overwrite already written int at given offset
+    def setInt32(self, offset: int, value: int):
+        if value < 0:
+            value += 0x100000000
+        _UINT32_STRUCT.pack_into( self.data, offset, value )
+
+    ## =====================================================
+
+    def push( self, value: bytes ):
+        self.data += value
+
+    def pushZeros( self, number: int ):
+        if number < 1:
+            return
+        self.data += bytes( number )
+
+    ## push back value
+    def pushInt32( self, value: int ):
+        if value < 0:
+            value += 0x100000000
+        self.data += _UINT32_STRUCT.pack( value )
+
+    def pushInt32Items(self, value_array: List[int] ):
+        self.data += struct.pack( f"<{len(value_array)}i", *value_array )
+
+    ## push back value
+    def pushInt64( self, value: int ):
+        if value < 0:
+            value += 0x10000000000000000
+        self.data += _UINT64_STRUCT.pack( value )
+
+    def pushInt64Items(self, value_array: List[int] ):
+        self.data += struct.pack( f"<{len(value_array)}q", *value_array )
+
+    def pushFloat32(self, value: float):
+        self.data += _FLOAT32_STRUCT.pack( value )
+
+    def pushFloat32Items(self, value_array: List[float] ):
+        self.data += struct.pack( f"<{len(value_array)}f", *value_array )
+
+    def pushFloat64(self, value: float):
+        self.data += _FLOAT64_STRUCT.pack( value )
+
+    def pushFloat64Items(self, value_array: List[float] ):
+        self.data += struct.pack( f"<{len(value_array)}d", *value_array )
+
+    def pushStringRaw(self, value: str):
+        self.data += value.encode("utf-8")
+
+    def pushString(self, value: str):
+        str_len = len( value )
+        self.pushInt32( str_len )
+        self.pushStringRaw( value )
+        remaining = str_len % 4
+        if remaining > 0:
+            padding = 4 - remaining
+            self.pushZeros( padding )
+
+    ## push back value
+    def pushFlagsType( self, flags: int, data_type: int ):
+        value = ((flags & 0xFF) << 16) | ( data_type & 0xFF )
+        self.data += _UINT32_STRUCT.pack( value )
+
+    ## =====================================================
+
+    def __str__(self):
+        return str( bytes( self.data ) )
+
+
+## =====================================================
+
+
+## writer into caller-supplied buffer ('bytearray' or writable 'memoryview')
+## writes data directly at current offset using 'struct.pack_into'
+## provides the same writing interface as BytesContainer
+class BufferWriter:
+
+    def __init__(self, buffer, offset: int = 0, codec=None):
+        view = memoryview( buffer )
+        if view.format != "B":
+            view = view.cast( "B" )
+        self.view   = view
+        self.offset = offset
+        self.codec  = codec         ## configuration used for nested types (None means global configuration)
+
+    def __len__(self):
+        return self.offset
+
+    ## return offset of next byte to write
+    def size(self):
+        return self.offset
+
+    ## =====================================================
+
+    def push( self, value: bytes ):
+        value_len = len( value )
+        self.view[ self.offset:self.offset + value_len ] = value
+        self.offset += value_len
+
+    def pushZeros( self, number: int ):
+        if number < 1:
+            return
+        self.push( bytes( number ) )
+
+    ## push back value
+    def pushInt32( self, value: int ):
+        if value < 0:
+            value += 0x100000000
+        _UINT32_STRUCT.pack_into( self.view, self.offset, value )
+        self.offset += 4
+
+    def pushInt32Items(self, value_array: List[int] ):
+        items_number = len( value_array )
+        struct.pack_into( f"<{items_number}i", self.view, self.offset, *value_array )
+        self.offset += 4 * items_number
+
+    ## push back value
+    def pushInt64( self, value: int ):
+        if value < 0:
+            value += 0x10000000000000000
+        _UINT64_STRUCT.pack_into( self.view, self.offset, value )
+        self.offset += 8
+
+    def pushInt64Items(self, value_array: List[int] ):
+        items_number = len( value_array )
+        struct.pack_into( f"<{items_number}q", self.view, self.offset, *value_array )
+        self.offset += 8 * items_number
+
+    def pushFloat32(self, value: float):
+        _FLOAT32_STRUCT.pack_into( self.view, self.offset, value )
+        self.offset += 4
+
+    def pushFloat32Items(self, value_array: List[float] ):
+        items_number = len( value_array )
+        struct.pack_into( f"<{items_number}f", self.view, self.offset, *value_array )
+        self.offset += 4 * items_number
+
+    def pushFloat64(self, value: float):
+        _FLOAT64_STRUCT.pack_into( self.view, self.offset, value )
+        self.offset += 8
+
+    def pushFloat64Items(self, value_array: List[float] ):
+        items_number = len( value_array )
+        struct.pack_into( f"<{items_number}d", self.view, self.offset, *value_array )
+        self.offset += 8 * items_number
+
+    def pushStringRaw(self, value: str):
+        self.push( value.encode("utf-8") )
+
+    def pushString(self, value: str):
+        str_len = len( value )
+        self.pushInt32( str_len )
+        self.pushStringRaw( value )
+        remaining = str_len % 4
+        if remaining > 0:
+            padding = 4 - remaining
+            self.pushZeros( padding )
+
+    ## push back value
+    def pushFlagsType( self, flags: int, data_type: int ):
+        value = ((flags & 0xFF) << 16) | ( data_type & 0xFF )
+        _UINT32_STRUCT.pack_into( self.view, self.offset, value )
+        self.offset += 4
+
+    ## =====================================================
+
+    def __str__(self):
+        return str( bytes( self.view[ :self.offset ] ) )
+
+
+## =====================================================
+
+
+## counts bytes that would be written without storing any data
+## provides the same writing interface as BytesContainer
+class BytesCounter:
+
+    def __init__(self, codec=None):
+        self.counter = 0
+        self.codec   = codec        ## configuration used for nested types (None means global configuration)
+
+    def __len__(self):
+        return self.counter
+
+    def size(self):
+        return self.counter
+
+    ## =====================================================
+
+    def push( self, value: bytes ):
+        self.counter += len( value )
+
+    def pushZeros( self, number: int ):
+        if number < 1:
+            return
+        self.counter += number
+
+    def pushInt32( self, _: int ):
+        self.counter += 4
+
+    def pushInt32Items(self, value_array: List[int] ):
+        self.counter += 4 * len( value_array )
+
+    def pushInt64( self, _: int ):
+        self.counter += 8
+
+    def pushInt64Items(self, value_array: List[int] ):
+        self.counter += 8 * len( value_array )
+
+    def pushFloat32(self, _: float):
+        self.counter += 4
+
+    def pushFloat32Items(self, value_array: List[float] ):
+        self.counter += 4 * len( value_array )
+
+    def pushFloat64(self, _: float):
+        self.counter += 8
+
+    def pushFloat64Items(self, value_array: List[float] ):
+        self.counter += 8 * len( value_array )
+
+    def pushStringRaw(self, value: str):
+        if value.isascii():
+            self.counter += len( value )
+            return
+        self.counter += len( value.encode("utf-8") )
+
+    def pushString(self, value: str):
+        str_len = len( value )
+        self.pushInt32( str_len )
+        self.pushStringRaw( value )
+        remaining = str_len % 4
+        if remaining > 0:
+            padding = 4 - remaining
+            self.pushZeros( padding )
+
+    def pushFlagsType( self, _: int, _2: int ):
+        self.counter += 4
+
+    ## =====================================================
+
+    def __str__(self):
+        return f"<{self.counter} bytes>"
@@ -0,0 +1,134 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+import struct
+from functools import lru_cache
+
+from . import commontypes as ct
+from . import query
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+## build dispatch tables of given configuration
+## tables are built once for each configuration and shared between codecs using the same configuration
+@lru_cache( maxsize=None )
+def prepare_codec_tables( config_tuple, module ):
+    deserialization_map, serialization_map = ct.prepare_config_dicts( config_tuple, module )
+    deserialization_list, serializers = ct.prepare_dispatch_tables( deserialization_map, serialization_map )
+    skip_list    = ct.prepare_skip_table( deserialization_list )
+    trusted_list = ct.prepare_trusted_table( deserialization_list )
+    run_map      = ct.prepare_run_table( deserialization_list )
+    return ( deserialization_map, serialization_map, deserialization_list, serializers, skip_list, trusted_list,
+             run_map )
+
+
+##
+## Serialization configuration of one version of Godot's binary API.
+##
+## Codec keeps its own dispatch tables built from CONFIG_LIST (see 'binaryapiv4.CONFIG_LIST'),
+## so codecs of different API versions can be used at the same time (also from many threads).
+## Nested values are dispatched through codec assigned to data container.
+##
+class Codec:
+
+    def __init__(self, config_list, module=ct):
+        self.config_list = config_list
+        tables = prepare_codec_tables( tuple( config_list ), module )
+        self.deserialization_map  = tables[0]
+        self.serialization_map    = tables[1]
+        self.deserialization_list = tables[2]
+        self.serializers          = tables[3]
+        self.skip_list            = tables[4]
+        self.trusted_list         = tables[5]
+        self.run_map              = tables[6]
+        self.validation_table     = None        ## built on first validation (see 'validation.validate()')
+
+    ## =====================================================
+
+    ## 'limits' is optional 'commontypes.DecodeLimits'
+    ## 'shapes' is optional 'commontypes.ShapeCache' shared between calls (by default shapes are not cached)
+    ## 'intern' is optional 'commontypes.InternTable' shared between calls
+    def deserialize( self, message: bytes, limits: ct.DecodeLimits = None, shapes: ct.ShapeCache = None,
+                     intern: ct.InternTable = None ):
+        return ct.deserialize_custom( message, ct.deserialize_type, self, limits, shapes, intern )
+
+    ## decode message from trusted source -- leaf values are decoded without bounds checks
+    ## invalid message still raises 'ValueError'
+    def deserialize_trusted( self, message: bytes, limits: ct.DecodeLimits = None, shapes: ct.ShapeCache = None,
+                             intern: ct.InternTable = None ):
+        try:
+            return ct.deserialize_custom( message, ct.deserialize_trusted_type, self, limits, shapes, intern )
+        except struct.error as exc:
+            raise ValueError( f"invalid packet -- too short: {exc}" ) from exc
+
+    ## decode message returning lazy proxies of Dictionary and Array (see 'lazy.deserialize_lazy()')
+    def deserialize_lazy( self, message: bytes ):
+        from .lazy import deserialize_lazy
+        return deserialize_lazy( message, self )
+
+    ## decode using explicit stack instead of recursion (see 'iterative.deserialize_iterative()')
+    def deserialize_iterative( self, message: bytes, max_depth: int = None, limits: ct.DecodeLimits = None ):
+        from .iterative import deserialize_iterative
+        return deserialize_iterative( message, self, max_depth, limits )
+
+    def serialize_iterative( self, value, max_depth: int = None ) -> bytes:
+        from .iterative import serialize_iterative
+        return serialize_iterative( value, self, max_depth )
+
+    ## iterate over events of message given as buffer or file object (see 'pullparser.iter_events()')
+    def iter_events( self, source, read_size: int = 64 * 1024 ):
+        from .pullparser import iter_events
+        return iter_events( source, self, read_size )
+
+    ## check structure of message without decoding (see 'validation.validate()')
+    def validate( self, message: bytes, max_depth: int = None ):
+        from .validation import validate
+        return validate( message, self, max_depth )
+
+    ## decode only value addressed by 'path' (see 'query.extract()')
+    def extract( self, message: bytes, path, default=query.MISSING ):
+        return query.extract( message, path, self, default )
+
+    def serialize( self, value ) -> bytes:
+        return ct.serialize_custom( value, ct.serialize_type, self )
+
+    def serialize_into( self, value, buffer, offset: int = 0 ) -> int:
+        return ct.serialize_into_custom( value, buffer, offset, ct.serialize_type, self )
+
+    def encoded_size( self, value ) -> int:
+        return ct.encoded_size_custom( value, ct.serialize_type, self )
+
+    ## =====================================================
+
+    ## returns stream decoding messages using the codec
+    def create_deserialization_stream( self, data: bytes = None, limits: ct.DecodeLimits = None ):
+        from .deserializationstream import DeserializationStream
+        return DeserializationStream( self, data, limits )
+
+    ## returns stream encoding messages using the codec
+    def create_serialization_stream( self ):
+        from .serializationstream import SerializationStream
+        return SerializationStream( self )
@@ -24,20 +24,40 @@
 # pylint: disable=invalid-name
 # pylint: disable=too-many-lines
 
+import sys
 import logging
+import struct
+import array
+import numbers
 from dataclasses import dataclass, field
+from itertools import chain
+from collections import namedtuple, OrderedDict
+from functools import partial
 
-import numpy
-
-from typing import List, Tuple
+from typing import List, Tuple, TYPE_CHECKING
 from typing import Dict, Callable, Any
 from types import FunctionType
 
-from .bytescontainer import BytesContainer
+if TYPE_CHECKING:
+    import numpy
+
+from .bytescontainer import BytesContainer, BytesReader, BytesWriter, BufferWriter, BytesCounter
 
 
 _LOGGER = logging.getLogger(__name__)
 
+## formats of math types components
+_INT32x2_STRUCT      = struct.Struct( "<2i" )
+_INT32x3_STRUCT      = struct.Struct( "<3i" )
+_INT32x4_STRUCT      = struct.Struct( "<4i" )
+_FLOAT32x2_STRUCT    = struct.Struct( "<2f" )
+_FLOAT32x3_STRUCT    = struct.Struct( "<3f" )
+_FLOAT32x4_STRUCT    = struct.Struct( "<4f" )
+_FLOAT32x6_STRUCT    = struct.Struct( "<6f" )
+_FLOAT32x9_STRUCT    = struct.Struct( "<9f" )
+_FLOAT32x12_STRUCT   = struct.Struct( "<12f" )
+_FLOAT32x16_STRUCT   = struct.Struct( "<16f" )
+
 
 def deserialize( message: bytes ):
     return deserialize_custom( message, deserialize_type )
@@ -57,13 +77,24 @@ def deserialize( message: bytes ):
     # return deserialize_type( data )
 
 
-def deserialize_custom( message: bytes, deserialize_function ):
+## 'shapes' is optional 'ShapeCache' used for decoding Dictionaries (requires 'codec')
+## 'intern' is optional 'InternTable' used for decoding strings
+def deserialize_custom( message: bytes, deserialize_function, codec=None, limits: 'DecodeLimits' = None,
+                        shapes: 'ShapeCache' = None, intern: 'InternTable' = None ):
     mess_len = len( message )
     if mess_len < 4:
         _LOGGER.error( "invalid packet -- too short: %s", message )
         raise ValueError( f"invalid packet -- too short: {mess_len} < 4 for {message!r}" )
 
-    data = BytesContainer( message )
+    data = BytesReader( message, codec=codec )
+    if limits is not None:
+        limits.checkMessageSize( mess_len )
+        data.guard = LimitsGuard( limits )
+    if shapes is not None:
+        if codec is None:
+            raise ValueError( "shapes cache requires codec" )
+        data.shapes = shapes
+    data.intern = intern
     expected_size = data.popInt32()
     message_size  = data.size()
     if message_size != expected_size:
@@ -92,22 +123,55 @@ def serialize( value ) -> bytes:
     # return message.data
 
 
-def serialize_custom( value, serialize_function ) -> bytes:
-    data = BytesContainer()
+def serialize_custom( value, serialize_function, codec=None ) -> bytes:
+    data = BytesWriter( codec )
+    header_offset = data.reserve( 4 )     ## header is set after serialization
+    serialize_function( value, data )
+    data_size = data.size() - 4
+    if data_size < 1:
+        ## failed to serialize data
+        raise ValueError( "failed to serialize: empty output data" )
+    data.setInt32( header_offset, data_size )
+    return data.getBytes()
+
+
+## return exact size in bytes of message produced by 'serialize()' (including header)
+def encoded_size( value ) -> int:
+    return encoded_size_custom( value, serialize_type )
+
+
+def encoded_size_custom( value, serialize_function, codec=None ) -> int:
+    data = BytesCounter( codec )
     serialize_function( value, data )
     data_size = data.size()
     if data_size < 1:
         ## failed to serialize data
         raise ValueError( "failed to serialize: empty output data" )
-    message = BytesContainer()
-    message.pushInt32( data_size )        ## set header
-    message.push( data.data )
-    return message.data
+    return data_size + 4
+
+
+## serialize 'value' directly into given 'buffer' ('bytearray' or writable 'memoryview') starting at 'offset'
+## raises ValueError (before encoding) if message does not fit into buffer
+## returns offset just after written message
+def serialize_into( value, buffer, offset: int = 0 ) -> int:
+    return serialize_into_custom( value, buffer, offset, serialize_type )
+
+
+def serialize_into_custom( value, buffer, offset, serialize_function, codec=None ) -> int:
+    message_size = encoded_size_custom( value, serialize_function, codec )
+    data = BufferWriter( buffer, offset, codec )
+    buffer_size  = len( data.view )
+    if offset + message_size > buffer_size:
+        raise ValueError( f"buffer too small: {message_size} bytes required at offset {offset},"
+                          f" buffer size {buffer_size}" )
+    data.pushInt32( message_size - 4 )          ## set header
+    serialize_function( value, data )
+    return data.size()
 
 
 ## read header value of message and return it
 def get_message_length( data: bytes ):
-    container = BytesContainer( data )
+    container = BytesReader( data, 0, 4 )
     if container.size() < 4:
         _LOGGER.error( "message is too short: %s", data )
         return None
@@ -131,6 +195,271 @@ def check_message_size( buffer: bytes ):
     return curr_size - expected_size
 
 
+## ======================================================================
+
+
+##
+## Limits of resources used by decoding single message (None means no limit).
+##
+## Limits are checked before allocation of decoded items, so hostile message
+## can not force decoder to spend excessive CPU time or memory.
+##
+@dataclass
+class DecodeLimits():
+    max_elements: int = None            ## total number of items of all containers and packed arrays
+    max_string_bytes: int = None        ## size of single string
+    max_depth: int = None               ## nesting depth of Dictionary and Array
+    max_message_size: int = None        ## size of message (including header)
+
+    def checkMessageSize( self, message_size: int ):
+        if self.max_message_size is not None and message_size > self.max_message_size:
+            raise ValueError( f"decode limit exceeded -- message size: {message_size} > {self.max_message_size}" )
+
+
+## state of limits during decoding of single message
+## assigned to data container as 'guard' attribute
+class LimitsGuard:
+
+    def __init__(self, limits: DecodeLimits):
+        self.limits   = limits
+        self.elements = 0
+        self.depth    = 0
+
+    def addElements( self, items_number: int ):
+        self.elements += items_number
+        max_elements = self.limits.max_elements
+        if max_elements is not None and self.elements > max_elements:
+            raise ValueError( f"decode limit exceeded -- number of elements: {self.elements} > {max_elements}" )
+
+    def checkString( self, string_len: int ):
+        max_string_bytes = self.limits.max_string_bytes
+        if max_string_bytes is not None and string_len > max_string_bytes:
+            raise ValueError( f"decode limit exceeded -- string size: {string_len} > {max_string_bytes}" )
+
+    def enter( self ):
+        self.depth += 1
+        max_depth = self.limits.max_depth
+        if max_depth is not None and self.depth > max_depth:
+            raise ValueError( f"decode limit exceeded -- nesting depth: {self.depth} > {max_depth}" )
+
+    def leave( self ):
+        self.depth -= 1
+
+    ## empty container counts to nesting depth as well (the same as in iterative decoder)
+    def checkEmpty( self ):
+        max_depth = self.limits.max_depth
+        if max_depth is not None and self.depth >= max_depth:
+            raise ValueError( f"decode limit exceeded -- nesting depth: {self.depth + 1} > {max_depth}" )
+
+
+## check number of items of container (read from message) before allocating them
+## each item takes at least 'item_size' bytes of remaining data
+def check_items( data: BytesContainer, items_number: int, item_size: int ):
+    data_len = data.size()
+    if items_number * item_size > data_len:
+        raise ValueError( f"invalid packet -- too short: {data_len} bytes for {items_number} items" )
+    guard = data.guard
+    if guard is not None:
+        guard.addElements( items_number )
+
+
+## ======================================================================
+
+
+##
+## Cache of shapes (sets of keys) of Dictionaries.
+##
+## Messages often contain many Dictionaries with the same string keys (e.g. Array of entities).
+## Raw bytes of keys are compared with cached shape, so on match keys are reused and only values
+## are decoded. Shape is stored on second occurrence of Dictionary of given size and first key.
+## Cache can be shared by many messages (e.g. by deserialization stream), but not between threads.
+## At most 'max_shapes' shapes is stored and at most 'max_shapes' shapes seen once is remembered.
+##
+## If 'record' is True, then Dictionaries with string keys (up to MAX_KEYS items) are decoded as named
+## tuples (namedtuple of shape, keys not being valid identifiers are renamed). Shape is then stored on
+## first occurrence.
+##
+class ShapeCache:
+
+    ## Dictionaries of more items are not cached
+    MAX_KEYS = 64
+
+    def __init__(self, record: bool = False, max_shapes: int = 1024):
+        self.record     = record
+        self.max_shapes = max_shapes
+        self.shapes     = {}        ## ( size, raw first key ) -> DictShape
+        self.seen       = set()     ## shapes seen once
+        self.hits       = 0
+        self.misses     = 0
+
+    def hitRate( self ) -> float:
+        total = self.hits + self.misses
+        if total < 1:
+            return 0.0
+        return self.hits / total
+
+    def clear( self ):
+        self.shapes.clear()
+        self.seen.clear()
+        self.hits   = 0
+        self.misses = 0
+
+
+@dataclass
+class DictShape():
+    keys: tuple                 ## decoded keys
+    raw_keys: tuple             ## encoded keys (including header)
+    record_type: type = None    ## namedtuple of keys (if records are enabled)
+
+
+## decode Dictionary of 'list_size' items using shapes cache assigned to 'data'
+## returns None if Dictionary does not start with string key
+def deserialize_dict_shape( data: BytesReader, list_size: int, deserialize_item ):
+    shapes = data.shapes
+    view   = data.view
+    offset = data.offset
+    if len( view ) - offset < 8:
+        return None
+    key_header, string_len = _SHAPE_KEY_STRUCT.unpack_from( view, offset )
+    if key_header >> 16 != 0 or data.codec.deserialization_list[ key_header & 0xFF ] is not deserialize_string:
+        return None
+    if string_len < 0 or string_len > len( view ) - offset - 8:
+        return None
+    shape_id = ( list_size, view[ offset:offset + 8 + string_len + (-string_len % 4) ].tobytes() )
+    shape    = shapes.shapes.get( shape_id )
+
+    if shape is not None:
+        values = []
+        for raw_key in shape.raw_keys:
+            end = offset + len( raw_key )
+            if view[ offset:end ] != raw_key:
+                ## different key -- decode remaining items regularly
+                shapes.misses += 1
+                proper_data = dict( zip( shape.keys, values ) )
+                data.offset = offset
+                for _ in range( len( values ), list_size ):
+                    key_value = deserialize_item( data )
+                    proper_data[ key_value ] = deserialize_item( data )
+                if len( proper_data ) != list_size:
+                    return proper_data
+                return make_dict_record( proper_data, key_header, shapes.record )
+            data.offset = end
+            values.append( deserialize_item( data ) )
+            offset = data.offset
+        shapes.hits += 1
+        if shape.record_type is not None:
+            return shape.record_type._make( values )
+        return dict( zip( shape.keys, values ) )
+
+    shapes.misses += 1
+    proper_data = {}
+    for _ in range( 0, list_size ):
+        key_value = deserialize_item( data )
+        proper_data[ key_value ] = deserialize_item( data )
+    if len( proper_data ) != list_size:
+        ## duplicated keys
+        return proper_data
+
+    if len( shapes.shapes ) < shapes.max_shapes:
+        if shapes.record or shape_id in shapes.seen:
+            shape = make_dict_shape( proper_data, key_header, shapes.record )
+            if shape is not None:
+                shapes.shapes[ shape_id ] = shape
+            shapes.seen.discard( shape_id )
+        elif len( shapes.seen ) < shapes.max_shapes:
+            shapes.seen.add( shape_id )
+    if shape is not None and shape.record_type is not None:
+        return shape.record_type._make( proper_data.values() )
+    return make_dict_record( proper_data, key_header, shapes.record )
+
+
+## create shape of Dictionary with string keys, returns None if shape can not be created
+def make_dict_shape( value: dict, key_header: int, record: bool ):
+    raw_keys = []
+    for key_value in value:
+        if type( key_value ) is not str:
+            return None
+        key_bytes = key_value.encode( "utf-8" )
+        key_len   = len( key_bytes )
+        raw_keys.append( _SHAPE_KEY_STRUCT.pack( key_header, key_len ) + key_bytes + bytes( -key_len % 4 ) )
+    keys = tuple( value.keys() )
+    record_type = None
+    if record:
+        record_type = namedtuple( "ShapeRecord", keys, rename=True )
+    return DictShape( keys, tuple( raw_keys ), record_type )
+
+
+## convert Dictionary not matching cached shape to named tuple (if records are enabled)
+## so type of decoded value does not depend on state of cache
+def make_dict_record( value: dict, key_header: int, record: bool ):
+    if not record:
+        return value
+    shape = make_dict_shape( value, key_header, record )
+    if shape is None:
+        return value
+    return shape.record_type._make( value.values() )
+
+
+_SHAPE_KEY_STRUCT = struct.Struct( "<Ii" )
+
+
+## ======================================================================
+
+
+##
+## Table of interned strings, StringName and NodePath values.
+##
+## Decoded values are kept under raw encoded bytes, so repeated value is not decoded again
+## and decoded state shares single object instead of many equal copies. Table keeps at most
+## 'max_size' recently used values, strings longer than 'max_length' bytes are not interned.
+##
+## Note that StringName and NodePath objects are shared, so they should not be modified.
+##
+class InternTable:
+
+    def __init__(self, max_size: int = 1024, max_length: int = 256):
+        self.max_size   = max_size
+        self.max_length = max_length
+        self.values     = OrderedDict()     ## ( value type, raw bytes ) -> value
+        self.hits       = 0
+        self.misses     = 0
+
+    def __len__(self):
+        return len( self.values )
+
+    ## get value of type 'value_type' (str, StringName or NodePath) of given encoded string
+    def getValue( self, value_type, raw ):
+        if len( raw ) > self.max_length:
+            value = str( raw, "utf-8" )
+            return value if value_type is str else value_type( value )
+        key   = ( value_type, raw )
+        value = self.values.get( key )
+        if value is not None:
+            self.values.move_to_end( key )
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = str( raw, "utf-8" )
+        if value_type is not str:
+            value = value_type( value )
+        self.values[ ( value_type, bytes( raw ) ) ] = value
+        if len( self.values ) > self.max_size:
+            ## drop least recently used
+            self.values.popitem( last=False )
+        return value
+
+    def clear( self ):
+        self.values.clear()
+        self.hits   = 0
+        self.misses = 0
+
+
+## pop string from 'data' as interned value of type 'value_type'
+def pop_interned( data: BytesContainer, value_type, string_len: int = -1 ):
+    raw = data.popStringBuffer( string_len )
+    return data.intern.getValue( value_type, raw )
+
+
 ## ======================================================================
 ## ======================================================================
 
@@ -143,7 +472,11 @@ def deserialize_type( data: BytesContainer ):
 
     data_flags, gd_type_id = data.popFlagsType()
 
-    deserialize_function = get_deserialization_function( gd_type_id )
+    codec = data.codec
+    if codec is None:
+        deserialize_function = get_deserialization_function( gd_type_id )
+    else:
+        deserialize_function = codec.deserialization_list[ gd_type_id ]
     if deserialize_function is None:
         raise ValueError( f"unable to get deserialization info for Godot type {gd_type_id}" )
 
@@ -154,8 +487,17 @@ def deserialize_type( data: BytesContainer ):
 def serialize_type( value, data: BytesContainer ):
     value_type = type( value )
 
+    codec = data.codec
+    if codec is not None:
+        serializer = codec.serializers.get( value_type, None )
+        if serializer is None:
+            serializer = resolve_serializer( codec.serializers, value_type )
+            if serializer is None:
+                raise ValueError( f"unable to serialize data: {value} {type(value)}" )
+        serializer( value, data )
+        return
+
     serialize_config = get_serialization_config( value_type )
-#     serialize_config = SERIALIZATION_MAP.get( value_type, None )
     if serialize_config is None:
         #_LOGGER.warning( "unable to serialize data: %s %s", value, type(value) )
         raise ValueError( f"unable to serialize data: {value} {type(value)}" )
@@ -166,6 +508,25 @@ def serialize_type( value, data: BytesContainer ):
     serialize_function( gd_type_id, value, data )
 
 
+## find serializer for subclass of configured type (e.g. IntEnum, OrderedDict)
+## or for number registered in 'numbers' module (e.g. numpy scalars)
+## found serializer is cached in 'serializers', so next lookup of the type is single dict hit
+def resolve_serializer( serializers, value_type: type ):
+    serializer = None
+    for base_type in value_type.__mro__[ 1: ]:
+        serializer = serializers.get( base_type, None )
+        if serializer is not None:
+            break
+    else:
+        if issubclass( value_type, numbers.Integral ):
+            serializer = serializers.get( int, None )
+        elif issubclass( value_type, numbers.Real ):
+            serializer = serializers.get( float, None )
+    if serializer is not None:
+        serializers[ value_type ] = serializer
+    return serializer
+
+
 ## =========================================================
 
 
@@ -174,6 +535,8 @@ def serialize_type( value, data: BytesContainer ):
 ## where Any depends on 'gd_type_id'.
 ## Example of returned function 'deserialize_float'.
 ##
+## Used only if container does not have codec assigned.
+##
 def get_deserialization_function( gd_type_id: int ):
     raise NotImplementedError( "stub function: implement and import proper function" )
 
@@ -183,6 +546,8 @@ def get_deserialization_function( gd_type_id: int ):
 ## consists on pair containing Godot type ID and serialization function.
 ## Example of returned function 'serialize_float'.
 ##
+## Used only if container does not have codec assigned.
+##
 def get_serialization_config( py_type: type ):
     raise NotImplementedError( "stub function: implement and import proper function" )
 
@@ -275,6 +640,8 @@ def deserialize_string( _: int, data: BytesContainer ) -> str:
     data_len = data.size()
     if data_len < 4:
         raise ValueError( f"invalid packet -- too short: {data}" )
+    if data.intern is not None:
+        return pop_interned( data, str )
     return data.popString()
 
 
@@ -294,24 +661,33 @@ def serialize_string( gd_type_id: int, value: str, data: BytesContainer ):
 
 @dataclass
 class Vector2():
-    x: float = 0.0
-    y: float = 0.0
+    __slots__ = ( "x", "y" )
+
+    x: float
+    y: float
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0.0, 0.0 )
         if len(data_array) != 2:
             raise ValueError( f"invalid array size: {data_array}" )
         self.x = data_array[0]
         self.y = data_array[1]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, x, y ):
+        value = cls.__new__( cls )
+        value.x = x
+        value.y = y
+        return value
+
     def getDataArray(self):
         return [ self.x, self.y ]
 
 
 def deserialize_Vector2( _: int, data: BytesContainer ) -> Vector2:
-    data = data.popFloat32Items(2)
-    return Vector2( data )
+    return Vector2.fromComponents( *data.popStruct( _FLOAT32x2_STRUCT ) )
 
 
 def serialize_Vector2( gd_type_id: int, value: Vector2, data: BytesContainer ):
@@ -325,24 +701,33 @@ def serialize_Vector2( gd_type_id: int, value: Vector2, data: BytesContainer ):
 
 @dataclass
 class Vector2i():
-    x: int = 0
-    y: int = 0
+    __slots__ = ( "x", "y" )
+
+    x: int
+    y: int
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0, 0 )
         if len(data_array) != 2:
             raise ValueError( f"invalid array size: {data_array}" )
         self.x = data_array[0]
         self.y = data_array[1]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, x, y ):
+        value = cls.__new__( cls )
+        value.x = x
+        value.y = y
+        return value
+
     def getDataArray(self):
         return [ self.x, self.y ]
 
 
 def deserialize_Vector2i( _: int, data: BytesContainer ) -> Vector2i:
-    data = data.popInt32Items(2)
-    return Vector2i( data )
+    return Vector2i.fromComponents( *data.popStruct( _INT32x2_STRUCT ) )
 
 
 def serialize_Vector2i( gd_type_id: int, value: Vector2i, data: BytesContainer ):
@@ -356,14 +741,16 @@ def serialize_Vector2i( gd_type_id: int, value: Vector2i, data: BytesContainer )
 
 @dataclass
 class Rect2():
-    x_coord: float = 0.0
-    y_coord: float = 0.0
-    x_size: float  = 0.0
-    y_size: float  = 0.0
+    __slots__ = ( "x_coord", "y_coord", "x_size", "y_size" )
+
+    x_coord: float
+    y_coord: float
+    x_size: float
+    y_size: float
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0.0, 0.0, 0.0, 0.0 )
         if len(data_array) != 4:
             raise ValueError( f"invalid array size: {data_array}" )
         self.x_coord = data_array[0]
@@ -371,13 +758,22 @@ class Rect2():
         self.x_size  = data_array[2]
         self.y_size  = data_array[3]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, x_coord, y_coord, x_size, y_size ):
+        value = cls.__new__( cls )
+        value.x_coord = x_coord
+        value.y_coord = y_coord
+        value.x_size  = x_size
+        value.y_size  = y_size
+        return value
+
     def getDataArray(self):
         return [ self.x_coord, self.y_coord, self.x_size, self.y_size ]
 
 
 def deserialize_Rect2( _: int, data: BytesContainer ) -> Rect2:
-    data = data.popFloat32Items(4)
-    return Rect2( data )
+    return Rect2.fromComponents( *data.popStruct( _FLOAT32x4_STRUCT ) )
 
 
 def serialize_Rect2( gd_type_id: int, value: Rect2, data: BytesContainer ):
@@ -391,14 +787,16 @@ def serialize_Rect2( gd_type_id: int, value: Rect2, data: BytesContainer ):
 
 @dataclass
 class Rect2i():
-    x_coord: int = 0
-    y_coord: int = 0
-    x_size: int  = 0
-    y_size: int  = 0
+    __slots__ = ( "x_coord", "y_coord", "x_size", "y_size" )
+
+    x_coord: int
+    y_coord: int
+    x_size: int
+    y_size: int
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0, 0, 0, 0 )
         if len(data_array) != 4:
             raise ValueError( f"invalid array size: {data_array}" )
         self.x_coord = data_array[0]
@@ -406,13 +804,22 @@ class Rect2i():
         self.x_size  = data_array[2]
         self.y_size  = data_array[3]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, x_coord, y_coord, x_size, y_size ):
+        value = cls.__new__( cls )
+        value.x_coord = x_coord
+        value.y_coord = y_coord
+        value.x_size  = x_size
+        value.y_size  = y_size
+        return value
+
     def getDataArray(self):
         return [ self.x_coord, self.y_coord, self.x_size, self.y_size ]
 
 
 def deserialize_Rect2i( _: int, data: BytesContainer ) -> Rect2i:
-    data = data.popInt32Items(4)
-    return Rect2i( data )
+    return Rect2i.fromComponents( *data.popStruct( _INT32x4_STRUCT ) )
 
 
 def serialize_Rect2i( gd_type_id: int, value: Rect2i, data: BytesContainer ):
@@ -426,27 +833,37 @@ def serialize_Rect2i( gd_type_id: int, value: Rect2i, data: BytesContainer ):
 
 @dataclass
 class Vector3():
-    x: float = 0.0
-    y: float = 0.0
-    z: float = 0.0
+    __slots__ = ( "x", "y", "z" )
+
+    x: float
+    y: float
+    z: float
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0.0, 0.0, 0.0 )
         if len(data_array) != 3:
             raise ValueError( f"invalid array size: {data_array}" )
         self.x = data_array[0]
         self.y = data_array[1]
         self.z = data_array[2]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, x, y, z ):
+        value = cls.__new__( cls )
+        value.x = x
+        value.y = y
+        value.z = z
+        return value
+
     def getDataArray(self):
         return [ self.x, self.y, self.z ]
 
 
 # def deserialize_vector3( data_flags: int, data: BytesContainer ):
 def deserialize_Vector3( _: int, data: BytesContainer ) -> Vector3:
-    data = data.popFloat32Items(3)
-    return Vector3( data )
+    return Vector3.fromComponents( *data.popStruct( _FLOAT32x3_STRUCT ) )
 
 
 def serialize_Vector3( gd_type_id: int, value: Vector3, data: BytesContainer ):
@@ -460,26 +877,36 @@ def serialize_Vector3( gd_type_id: int, value: Vector3, data: BytesContainer ):
 
 @dataclass
 class Vector3i():
-    x: int = 0
-    y: int = 0
-    z: int = 0
+    __slots__ = ( "x", "y", "z" )
+
+    x: int
+    y: int
+    z: int
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0, 0, 0 )
         if len(data_array) != 3:
             raise ValueError( f"invalid array size: {data_array}" )
         self.x = data_array[0]
         self.y = data_array[1]
         self.z = data_array[2]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, x, y, z ):
+        value = cls.__new__( cls )
+        value.x = x
+        value.y = y
+        value.z = z
+        return value
+
     def getDataArray(self):
         return [ self.x, self.y, self.z ]
 
 
 def deserialize_Vector3i( _: int, data: BytesContainer ) -> Vector3i:
-    data = data.popInt32Items(3)
-    return Vector3i( data )
+    return Vector3i.fromComponents( *data.popStruct( _INT32x3_STRUCT ) )
 
 
 def serialize_Vector3i( gd_type_id: int, value: Vector3i, data: BytesContainer ):
@@ -493,12 +920,14 @@ def serialize_Vector3i( gd_type_id: int, value: Vector3i, data: BytesContainer )
 
 @dataclass
 class Transform2D():
+    __slots__ = ( "values", )
+
     ## has 2 rows and 3 columns
     values: list
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            self.values: list = [ 0.0 ] * 6
+            self.values = [ 0.0 ] * 6
             return
         if len(data_array) != 6:
             raise ValueError( f"invalid array size: {data_array}" )
@@ -510,13 +939,21 @@ class Transform2D():
     def get( self, row, col ):
         return self.values[ col + row * 2 ]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, *values ):
+        if len(values) != 6:
+            raise ValueError( f"invalid array size: {values}" )
+        value = cls.__new__( cls )
+        value.values = list( values )
+        return value
+
     def getDataArray(self):
         return list( self.values )
 
 
 def deserialize_Transform2D( _: int, data: BytesContainer ) -> Transform2D:
-    data = data.popFloat32Items(6)
-    return Transform2D( data )
+    return Transform2D.fromComponents( *data.popStruct( _FLOAT32x6_STRUCT ) )
 
 
 def serialize_Transform2D( gd_type_id: int, value: Transform2D, data: BytesContainer ):
@@ -530,14 +967,16 @@ def serialize_Transform2D( gd_type_id: int, value: Transform2D, data: BytesConta
 
 @dataclass
 class Vector4():
-    w: float = 0.0
-    x: float = 0.0
-    y: float = 0.0
-    z: float = 0.0
+    __slots__ = ( "w", "x", "y", "z" )
+
+    w: float
+    x: float
+    y: float
+    z: float
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0.0, 0.0, 0.0, 0.0 )
         if len(data_array) != 4:
             raise ValueError( f"invalid array size: {data_array}" )
         self.w = data_array[0]
@@ -545,14 +984,23 @@ class Vector4():
         self.y = data_array[2]
         self.z = data_array[3]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, w, x, y, z ):
+        value = cls.__new__( cls )
+        value.w = w
+        value.x = x
+        value.y = y
+        value.z = z
+        return value
+
     def getDataArray(self):
         return [ self.w, self.x, self.y, self.z ]
 
 
 # def deserialize_vector3( data_flags: int, data: BytesContainer ):
 def deserialize_Vector4( _: int, data: BytesContainer ) -> Vector4:
-    data = data.popFloat32Items(4)
-    return Vector4( data )
+    return Vector4.fromComponents( *data.popStruct( _FLOAT32x4_STRUCT ) )
 
 
 def serialize_Vector4( gd_type_id: int, value: Vector4, data: BytesContainer ):
@@ -566,14 +1014,16 @@ def serialize_Vector4( gd_type_id: int, value: Vector4, data: BytesContainer ):
 
 @dataclass
 class Vector4i():
-    w: int = 0
-    x: int = 0
-    y: int = 0
-    z: int = 0
+    __slots__ = ( "w", "x", "y", "z" )
+
+    w: int
+    x: int
+    y: int
+    z: int
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0, 0, 0, 0 )
         if len(data_array) != 4:
             raise ValueError( f"invalid array size: {data_array}" )
         self.w = data_array[0]
@@ -581,13 +1031,22 @@ class Vector4i():
         self.y = data_array[2]
         self.z = data_array[3]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, w, x, y, z ):
+        value = cls.__new__( cls )
+        value.w = w
+        value.x = x
+        value.y = y
+        value.z = z
+        return value
+
     def getDataArray(self):
         return [ self.w, self.x, self.y, self.z ]
 
 
 def deserialize_Vector4i( _: int, data: BytesContainer ) -> Vector4i:
-    data = data.popInt32Items(4)
-    return Vector4i( data )
+    return Vector4i.fromComponents( *data.popStruct( _INT32x4_STRUCT ) )
 
 
 def serialize_Vector4i( gd_type_id: int, value: Vector3i, data: BytesContainer ):
@@ -601,14 +1060,16 @@ def serialize_Vector4i( gd_type_id: int, value: Vector3i, data: BytesContainer )
 
 @dataclass
 class Plane():
-    x: float = 0.0
-    y: float = 0.0
-    z: float = 0.0
-    d: float = 0.0
+    __slots__ = ( "x", "y", "z", "d" )
+
+    x: float
+    y: float
+    z: float
+    d: float
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0.0, 0.0, 0.0, 0.0 )
         if len(data_array) != 4:
             raise ValueError( f"invalid array size: {data_array}" )
         self.x = data_array[0]
@@ -616,13 +1077,22 @@ class Plane():
         self.z = data_array[2]
         self.d = data_array[3]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, x, y, z, d ):
+        value = cls.__new__( cls )
+        value.x = x
+        value.y = y
+        value.z = z
+        value.d = d
+        return value
+
     def getDataArray(self):
         return [ self.x, self.y, self.z, self.d ]
 
 
 def deserialize_Plane( _: int, data: BytesContainer ) -> Plane:
-    data = data.popFloat32Items(4)
-    return Plane( data )
+    return Plane.fromComponents( *data.popStruct( _FLOAT32x4_STRUCT ) )
 
 
 def serialize_Plane( gd_type_id: int, value: Plane, data: BytesContainer ):
@@ -636,14 +1106,16 @@ def serialize_Plane( gd_type_id: int, value: Plane, data: BytesContainer ):
 
 @dataclass
 class Quaternion():
-    x: float = 0.0
-    y: float = 0.0
-    z: float = 0.0
-    w: float = 1.0
+    __slots__ = ( "x", "y", "z", "w" )
+
+    x: float
+    y: float
+    z: float
+    w: float
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0.0, 0.0, 0.0, 1.0 )
         if len(data_array) != 4:
             raise ValueError( f"invalid array size: {data_array}" )
         self.x = data_array[0]
@@ -651,13 +1123,22 @@ class Quaternion():
         self.z = data_array[2]
         self.w = data_array[3]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, x, y, z, w ):
+        value = cls.__new__( cls )
+        value.x = x
+        value.y = y
+        value.z = z
+        value.w = w
+        return value
+
     def getDataArray(self):
         return [ self.x, self.y, self.z, self.w ]
 
 
 def deserialize_Quaternion( _: int, data: BytesContainer ) -> Quaternion:
-    data = data.popFloat32Items(4)
-    return Quaternion( data )
+    return Quaternion.fromComponents( *data.popStruct( _FLOAT32x4_STRUCT ) )
 
 
 def serialize_Quaternion( gd_type_id: int, value: Quaternion, data: BytesContainer ):
@@ -671,16 +1152,18 @@ def serialize_Quaternion( gd_type_id: int, value: Quaternion, data: BytesContain
 
 @dataclass
 class AABB():
-    x_coord: float = 0.0
-    y_coord: float = 0.0
-    z_coord: float = 0.0
-    x_size: float  = 0.0
-    y_size: float  = 0.0
-    z_size: float  = 0.0
+    __slots__ = ( "x_coord", "y_coord", "z_coord", "x_size", "y_size", "z_size" )
+
+    x_coord: float
+    y_coord: float
+    z_coord: float
+    x_size: float
+    y_size: float
+    z_size: float
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0.0, 0.0, 0.0, 0.0, 0.0, 0.0 )
         if len(data_array) != 6:
             raise ValueError( f"invalid array size: {data_array}" )
         self.x_coord = data_array[0]
@@ -690,13 +1173,24 @@ class AABB():
         self.y_size  = data_array[4]
         self.z_size  = data_array[5]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, x_coord, y_coord, z_coord, x_size, y_size, z_size ):
+        value = cls.__new__( cls )
+        value.x_coord = x_coord
+        value.y_coord = y_coord
+        value.z_coord = z_coord
+        value.x_size  = x_size
+        value.y_size  = y_size
+        value.z_size  = z_size
+        return value
+
     def getDataArray(self):
         return [ self.x_coord, self.y_coord, self.z_coord, self.x_size, self.y_size, self.z_size ]
 
 
 def deserialize_AABB( _: int, data: BytesContainer ) -> AABB:
-    data = data.popFloat32Items(6)
-    return AABB( data )
+    return AABB.fromComponents( *data.popStruct( _FLOAT32x6_STRUCT ) )
 
 
 def serialize_AABB( gd_type_id: int, value: AABB, data: BytesContainer ):
@@ -710,23 +1204,34 @@ def serialize_AABB( gd_type_id: int, value: AABB, data: BytesContainer ):
 
 @dataclass
 class Basis():
+    __slots__ = ( "values", )
+
     ## has 3 rows and 3 columns
     values: list
 
     def __init__( self, data_array=None ):
         if data_array is None:
+            self.values = [ 0.0 ] * 9
             return
         if len(data_array) != 9:
             raise ValueError( f"invalid array size: {data_array}" )
         self.values = list( data_array )    ## copy
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, *values ):
+        if len(values) != 9:
+            raise ValueError( f"invalid array size: {values}" )
+        value = cls.__new__( cls )
+        value.values = list( values )
+        return value
+
     def getDataArray(self):
         return list( self.values )
 
 
 def deserialize_Basis( _: int, data: BytesContainer ) -> Basis:
-    data = data.popFloat32Items(9)
-    return Basis( data )
+    return Basis.fromComponents( *data.popStruct( _FLOAT32x9_STRUCT ) )
 
 
 def serialize_Basis( gd_type_id: int, value: Basis, data: BytesContainer ):
@@ -740,12 +1245,14 @@ def serialize_Basis( gd_type_id: int, value: Basis, data: BytesContainer ):
 
 @dataclass
 class Transform3D():
+    __slots__ = ( "values", )
+
     ## has 3 rows and 4 columns
     values: list
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            self.values: list = [ 0.0 ] * 12
+            self.values = [ 0.0 ] * 12
             return
         if len(data_array) != 12:
             raise ValueError( f"invalid array size: {data_array}" )
@@ -757,14 +1264,22 @@ class Transform3D():
     def get( self, row, col ):
         return self.values[ col + row * 3 ]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, *values ):
+        if len(values) != 12:
+            raise ValueError( f"invalid array size: {values}" )
+        value = cls.__new__( cls )
+        value.values = list( values )
+        return value
+
     def getDataArray(self):
         return list( self.values )
 
 
 # def deserialize_vector3( data_flags: int, data: BytesContainer ):
 def deserialize_Transform3D( _: int, data: BytesContainer ) -> Transform3D:
-    data = data.popFloat32Items(12)
-    return Transform3D( data )
+    return Transform3D.fromComponents( *data.popStruct( _FLOAT32x12_STRUCT ) )
 
 
 def serialize_Transform3D( gd_type_id: int, value: Transform3D, data: BytesContainer ):
@@ -778,12 +1293,14 @@ def serialize_Transform3D( gd_type_id: int, value: Transform3D, data: BytesConta
 
 @dataclass
 class Projection():
+    __slots__ = ( "values", )
+
     ## has 4 rows and 4 columns
     values: list
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            self.values: list = [ 0.0 ] * 16
+            self.values = [ 0.0 ] * 16
             return
         if len(data_array) != 16:
             raise ValueError( f"invalid array size: {data_array}" )
@@ -795,13 +1312,21 @@ class Projection():
     def get( self, row, col ):
         return self.values[ col + row * 4 ]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, *values ):
+        if len(values) != 16:
+            raise ValueError( f"invalid array size: {values}" )
+        value = cls.__new__( cls )
+        value.values = list( values )
+        return value
+
     def getDataArray(self):
         return list( self.values )
 
 
 def deserialize_Projection( _: int, data: BytesContainer ) -> Projection:
-    data = data.popFloat32Items(16)
-    return Projection( data )
+    return Projection.fromComponents( *data.popStruct( _FLOAT32x16_STRUCT ) )
 
 
 def serialize_Projection( gd_type_id: int, value: Projection, data: BytesContainer ):
@@ -815,14 +1340,16 @@ def serialize_Projection( gd_type_id: int, value: Projection, data: BytesContain
 
 @dataclass
 class Color():
-    red: float   = 0.0
-    green: float = 0.0
-    blue: float  = 0.0
-    alpha: float = 0.0
+    __slots__ = ( "red", "green", "blue", "alpha" )
+
+    red: float
+    green: float
+    blue: float
+    alpha: float
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = ( 0.0, 0.0, 0.0, 0.0 )
         if len(data_array) != 4:
             raise ValueError( f"invalid array size: {data_array}" )
         self.red   = data_array[0]
@@ -830,6 +1357,16 @@ class Color():
         self.blue  = data_array[2]
         self.alpha = data_array[3]
 
+    ## create from components without intermediate list
+    @classmethod
+    def fromComponents( cls, red, green, blue, alpha ):
+        value = cls.__new__( cls )
+        value.red   = red
+        value.green = green
+        value.blue  = blue
+        value.alpha = alpha
+        return value
+
     def getDataArray(self):
         return [ self.red, self.green, self.blue, self.alpha ]
 
@@ -837,8 +1374,7 @@ class Color():
 # def deserialize_Color( data_flags: int, data: BytesContainer ):
 def deserialize_Color( _: int, data: BytesContainer ) -> Color:
     ## RGBA
-    data = data.popFloat32Items(4)
-    return Color( data )
+    return Color.fromComponents( *data.popStruct( _FLOAT32x4_STRUCT ) )
 
 
 def serialize_Color( gd_type_id: int, value: Color, data: BytesContainer ):
@@ -860,6 +1396,8 @@ def deserialize_StringName( _: int, data: BytesContainer ) -> StringName:
     data_len = data.size()
     if data_len < 4:
         raise ValueError( f"invalid packet -- too short: {data}" )
+    if data.intern is not None:
+        return pop_interned( data, StringName )
     proper_data = data.popString()
     return StringName( proper_data )
 
@@ -886,6 +1424,8 @@ def deserialize_NodePath( _: int, data: BytesContainer ) -> NodePath:
     header_value = data_header & 0x7FFFFFFF
     if data_header & 0x80000000 == 0:
         ## old format
+        if data.intern is not None:
+            return pop_interned( data, NodePath, header_value )
         proper_data = data.popString( header_value )
         return NodePath( proper_data )
     ## new format
@@ -936,13 +1476,27 @@ def deserialize_dict( _: int, data: BytesContainer ):
     list_size   = data_header & 0x7FFFFFFF
 #         shared_flag = data_header & 0x80000000
     if list_size < 1:
+        if data.guard is not None:
+            data.guard.checkEmpty()
         return {}
-
-    proper_data = {}
-    for _ in range(0, list_size):
-        key_value  = deserialize_type( data )
-        item_value = deserialize_type( data )
-        proper_data[ key_value ] = item_value
+    check_items( data, list_size, 8 )
+
+    guard = data.guard
+    if guard is not None:
+        guard.enter()
+
+    proper_data = None
+    if data.shapes is not None and list_size <= ShapeCache.MAX_KEYS:
+        proper_data = deserialize_dict_shape( data, list_size, deserialize_type )
+    if proper_data is None:
+        proper_data = {}
+        for _ in range(0, list_size):
+            key_value  = deserialize_type( data )
+            item_value = deserialize_type( data )
+            proper_data[ key_value ] = item_value
+
+    if guard is not None:
+        guard.leave()
     return proper_data
 
 
@@ -970,12 +1524,47 @@ def deserialize_list( _: int, data: BytesContainer ):
     list_size   = data_header & 0x7FFFFFFF
 #         shared_flag = data_header & 0x80000000
     if list_size < 1:
+        if data.guard is not None:
+            data.guard.checkEmpty()
         return []
+    check_items( data, list_size, 4 )
+
+    guard = data.guard
+    if guard is not None:
+        guard.enter()
 
     proper_data = []
-    for _ in range(0, list_size):
-        item_value = deserialize_type( data )
-        proper_data.append( item_value )
+    if data.codec is None or not isinstance( data, BytesReader ):
+        for _ in range(0, list_size):
+            item_value = deserialize_type( data )
+            proper_data.append( item_value )
+    else:
+        ## dispatch inlined, runs of the same fixed size type are decoded at once
+        deserialization_list = data.codec.deserialization_list
+        run_map = data.codec.run_map
+        view    = data.view
+        index   = 0
+        previous_raw = -1
+        while index < list_size:
+            if len( view ) - data.offset < 4:
+                raise ValueError( f"invalid packet -- too short: {data}" )
+            raw = _TRUSTED_UINT32.unpack_from( view, data.offset )[0]
+            if raw == previous_raw and raw in run_map:
+                ## second item of the same type -- try to decode the rest of run at once
+                run_size = deserialize_run( data, list_size - index, proper_data )
+                if run_size > 0:
+                    index += run_size
+                    continue
+            previous_raw = raw
+            data.offset += 4
+            deserialize_function = deserialization_list[ raw & 0xFF ]
+            if deserialize_function is None:
+                raise ValueError( f"unable to get deserialization info for Godot type {raw & 0xFF}" )
+            proper_data.append( deserialize_function( (raw >> 16) & 0xFF, data ) )
+            index += 1
+
+    if guard is not None:
+        guard.leave()
     return proper_data
 
 
@@ -1010,11 +1599,12 @@ class ByteArray():
         return self.values[ index ]
 
     def toNumpy(self):
+        numpy = import_numpy()
         return numpy.array( self.values )
         # return numpy.array([ point for point in self.values ])
 
     @staticmethod
-    def fromNumpy(data_array: numpy.ndarray):
+    def fromNumpy(data_array: 'numpy.ndarray'):
         point_list = [ int(point) for point in data_array ]
         return ByteArray( point_list )
 
@@ -1027,6 +1617,7 @@ def deserialize_ByteArray( _: int, data: BytesContainer ):
     list_size   = data_header
     if list_size < 1:
         return ByteArray()
+    check_items( data, list_size, 1 )
     bytes_data = data.pop( list_size )
     return ByteArray( bytes_data )
 
@@ -1042,15 +1633,75 @@ def serialize_ByteArray( gd_type_id: int, value: ByteArray, data: BytesContainer
 ## =========================================================
 
 
+## import numpy on first use (numpy is needed only for numpy-related functionality)
+def import_numpy():
+    import numpy
+    return numpy
+
+
+## check if value is 'numpy.ndarray' without importing numpy
+## (if numpy is not imported yet then value cannot be ndarray)
+def is_ndarray( value ) -> bool:
+    numpy = sys.modules.get( "numpy", None )
+    return numpy is not None and isinstance( value, numpy.ndarray )
+
+
+## compare values of packed arrays (list or 'numpy.ndarray')
+def values_equal( values, other_values ) -> bool:
+    if not is_ndarray( values ) and not is_ndarray( other_values ):
+        return values == other_values
+    if len( values ) != len( other_values ):
+        return False
+    if len( values ) == 0:
+        return True
+    numpy = import_numpy()
+    return bool( numpy.array_equal( numpy.asarray( values ), numpy.asarray( other_values ) ) )
+
+
+## get item of 'numpy.ndarray' of shape (N, k) the same as item of list storage (tuple of components)
+def get_rows_item( items, index ):
+    item = items[ index ].tolist()
+    if isinstance( index, slice ):
+        return [ tuple( row ) for row in item ]
+    return tuple( item )
+
+
+## read 'items_number' values of given 'dtype' into 'numpy.ndarray'
+def pop_numpy_items( data: BytesContainer, dtype: str, items_number: int ):
+    numpy = import_numpy()
+    data_type = numpy.dtype( dtype )
+    data_size = data_type.itemsize * items_number
+    raw_data  = data.popBuffer( data_size )
+    if len( raw_data ) < data_size:
+        raise ValueError( f"invalid packet -- too short: {len( raw_data )} < {data_size}" )
+    return numpy.frombuffer( raw_data, dtype=data_type, count=items_number )
+
+
+## write content of 'numpy.ndarray' as values of given 'dtype'
+def push_numpy_items( data: BytesContainer, data_array, dtype: str ):
+    numpy = import_numpy()
+    data_array = numpy.asarray( data_array, dtype=dtype )
+    data.push( data_array.tobytes() )
+
+
+## =========================================================
+
+
 @dataclass
 class Int32Array():
+    ## list of values or typed 'numpy.ndarray' (dtype '<i4')
     values: List[ int ] = field(default_factory=list)
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = []
         self.values = data_array
 
+    def __eq__( self, other ):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return values_equal( self.values, other.values )
+
     def __len__(self):
         return len( self.values )
 
@@ -1058,16 +1709,23 @@ class Int32Array():
         return self.values[ index ]
 
     def append( self, value ):
+        if is_ndarray( self.values ):
+            numpy = import_numpy()
+            self.values = numpy.append( self.values, numpy.array( [ value ], dtype=self.values.dtype ) )
+            return
         self.values.append( value )
 
     def toNumpy(self):
+        numpy = import_numpy()
+        if is_ndarray( self.values ):
+            return self.values
         return numpy.array( self.values )
         # return numpy.array([ point for point in self.values ])
 
     @staticmethod
-    def fromNumpy(data_array: numpy.ndarray):
-        point_list = [ int(point) for point in data_array ]
-        return Int32Array( point_list )
+    def fromNumpy(data_array: 'numpy.ndarray'):
+        numpy = import_numpy()
+        return Int32Array( numpy.asarray( data_array, dtype="<i4" ) )
 
 
 def deserialize_Int32Array( _: int, data: BytesContainer ):
@@ -1078,16 +1736,34 @@ def deserialize_Int32Array( _: int, data: BytesContainer ):
     list_size   = data_header
     if list_size < 1:
         return Int32Array()
+    check_items( data, list_size, 4 )
     data_list = data.popInt32Items( list_size )
     return Int32Array( data_list )
 
 
+## decode values into 'numpy.ndarray'
+## array shares memory with message if message is immutable (then array is read-only)
+def deserialize_Int32Array_numpy( _: int, data: BytesContainer ):
+    data_len = data.size()
+    if data_len < 4:
+        raise ValueError( f"invalid packet -- too short: {data}" )
+    data_header = data.popInt32()
+    list_size   = max( data_header, 0 )
+    check_items( data, list_size, 4 )
+    data_array  = pop_numpy_items( data, "<i4", list_size )
+    return Int32Array( data_array )
+
+
 def serialize_Int32Array( gd_type_id: int, value: Int32Array, data: BytesContainer ):
     data.pushFlagsType( 0, gd_type_id )
     list_size = len( value )
     data_header = list_size
     data.pushInt32( data_header )
-    data.pushInt32Items( value.values )
+    values = value.values
+    if is_ndarray( values ):
+        push_numpy_items( data, values, "<i4" )
+        return
+    data.pushInt32Items( values )
 
 
 ## =========================================================
@@ -1095,13 +1771,19 @@ def serialize_Int32Array( gd_type_id: int, value: Int32Array, data: BytesContain
 
 @dataclass
 class Int64Array():
+    ## list of values or typed 'numpy.ndarray' (dtype '<i8')
     values: List[ int ] = field(default_factory=list)
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = []
         self.values = data_array
 
+    def __eq__( self, other ):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return values_equal( self.values, other.values )
+
     def __len__(self):
         return len( self.values )
 
@@ -1109,16 +1791,23 @@ class Int64Array():
         return self.values[ index ]
 
     def append( self, value ):
+        if is_ndarray( self.values ):
+            numpy = import_numpy()
+            self.values = numpy.append( self.values, numpy.array( [ value ], dtype=self.values.dtype ) )
+            return
         self.values.append( value )
 
     def toNumpy(self):
+        numpy = import_numpy()
+        if is_ndarray( self.values ):
+            return self.values
         return numpy.array( self.values )
         # return numpy.array([ point for point in self.values ])
 
     @staticmethod
-    def fromNumpy(data_array: numpy.ndarray):
-        point_list = [ int(point) for point in data_array ]
-        return Int64Array( point_list )
+    def fromNumpy(data_array: 'numpy.ndarray'):
+        numpy = import_numpy()
+        return Int64Array( numpy.asarray( data_array, dtype="<i8" ) )
 
 
 def deserialize_Int64Array( _: int, data: BytesContainer ):
@@ -1129,16 +1818,34 @@ def deserialize_Int64Array( _: int, data: BytesContainer ):
     list_size   = data_header
     if list_size < 1:
         return Int64Array()
+    check_items( data, list_size, 8 )
     data_list = data.popInt64Items( list_size )
     return Int64Array( data_list )
 
 
+## decode values into 'numpy.ndarray'
+## array shares memory with message if message is immutable (then array is read-only)
+def deserialize_Int64Array_numpy( _: int, data: BytesContainer ):
+    data_len = data.size()
+    if data_len < 4:
+        raise ValueError( f"invalid packet -- too short: {data}" )
+    data_header = data.popInt32()
+    list_size   = max( data_header, 0 )
+    check_items( data, list_size, 8 )
+    data_array  = pop_numpy_items( data, "<i8", list_size )
+    return Int64Array( data_array )
+
+
 def serialize_Int64Array( gd_type_id: int, value: Int64Array, data: BytesContainer ):
     data.pushFlagsType( 0, gd_type_id )
     list_size = len( value )
     data_header = list_size
     data.pushInt32( data_header )
-    data.pushInt64Items( value.values )
+    values = value.values
+    if is_ndarray( values ):
+        push_numpy_items( data, values, "<i8" )
+        return
+    data.pushInt64Items( values )
 
 
 ## =========================================================
@@ -1146,13 +1853,19 @@ def serialize_Int64Array( gd_type_id: int, value: Int64Array, data: BytesContain
 
 @dataclass
 class Float32Array():
+    ## list of values or typed 'numpy.ndarray' (dtype '<f4')
     values: List[ float ] = field(default_factory=list)
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = []
         self.values = data_array
 
+    def __eq__( self, other ):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return values_equal( self.values, other.values )
+
     def __len__(self):
         return len( self.values )
 
@@ -1160,16 +1873,23 @@ class Float32Array():
         return self.values[ index ]
 
     def append( self, value ):
+        if is_ndarray( self.values ):
+            numpy = import_numpy()
+            self.values = numpy.append( self.values, numpy.array( [ value ], dtype=self.values.dtype ) )
+            return
         self.values.append( value )
 
     def toNumpy(self):
+        numpy = import_numpy()
+        if is_ndarray( self.values ):
+            return self.values
         return numpy.array( self.values )
         # return numpy.array([ point for point in self.values ])
 
     @staticmethod
-    def fromNumpy(data_array: numpy.ndarray):
-        point_list = [ point for point in data_array ]
-        return Float32Array( point_list )
+    def fromNumpy(data_array: 'numpy.ndarray'):
+        numpy = import_numpy()
+        return Float32Array( numpy.asarray( data_array, dtype="<f4" ) )
 
 
 def deserialize_Float32Array( _: int, data: BytesContainer ):
@@ -1180,16 +1900,34 @@ def deserialize_Float32Array( _: int, data: BytesContainer ):
     list_size   = data_header
     if list_size < 1:
         return Float32Array()
+    check_items( data, list_size, 4 )
     data_list = data.popFloat32Items( list_size )
     return Float32Array( data_list )
 
 
+## decode values into 'numpy.ndarray'
+## array shares memory with message if message is immutable (then array is read-only)
+def deserialize_Float32Array_numpy( _: int, data: BytesContainer ):
+    data_len = data.size()
+    if data_len < 4:
+        raise ValueError( f"invalid packet -- too short: {data}" )
+    data_header = data.popInt32()
+    list_size   = max( data_header, 0 )
+    check_items( data, list_size, 4 )
+    data_array  = pop_numpy_items( data, "<f4", list_size )
+    return Float32Array( data_array )
+
+
 def serialize_Float32Array( gd_type_id: int, value: Float32Array, data: BytesContainer ):
     data.pushFlagsType( 0, gd_type_id )
     list_size = len( value )
     data_header = list_size
     data.pushInt32( data_header )
-    data.pushFloat32Items( value.values )
+    values = value.values
+    if is_ndarray( values ):
+        push_numpy_items( data, values, "<f4" )
+        return
+    data.pushFloat32Items( values )
 
 
 ## =========================================================
@@ -1197,13 +1935,19 @@ def serialize_Float32Array( gd_type_id: int, value: Float32Array, data: BytesCon
 
 @dataclass
 class Float64Array():
+    ## list of values or typed 'numpy.ndarray' (dtype '<f8')
     values: List[ float ] = field(default_factory=list)
 
     def __init__( self, data_array=None ):
         if data_array is None:
-            return
+            data_array = []
         self.values = data_array
 
+    def __eq__( self, other ):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return values_equal( self.values, other.values )
+
     def __len__(self):
         return len( self.values )
 
@@ -1211,16 +1955,23 @@ class Float64Array():
         return self.values[ index ]
 
     def append( self, value ):
+        if is_ndarray( self.values ):
+            numpy = import_numpy()
+            self.values = numpy.append( self.values, numpy.array( [ value ], dtype=self.values.dtype ) )
+            return
         self.values.append( value )
 
     def toNumpy(self):
+        numpy = import_numpy()
+        if is_ndarray( self.values ):
+            return self.values
         return numpy.array( self.values )
         # return numpy.array([ point for point in self.items ])
 
     @staticmethod
-    def fromNumpy(data_array: numpy.ndarray):
-        point_list = [ point for point in data_array ]
-        return Float64Array( point_list )
+    def fromNumpy(data_array: 'numpy.ndarray'):
+        numpy = import_numpy()
+        return Float64Array( numpy.asarray( data_array, dtype="<f8" ) )
 
 
 def deserialize_Float64Array( _: int, data: BytesContainer ):
@@ -1231,16 +1982,34 @@ def deserialize_Float64Array( _: int, data: BytesContainer ):
     list_size   = data_header
     if list_size < 1:
         return Float64Array()
+    check_items( data, list_size, 8 )
     data_list = data.popFloat64Items( list_size )
     return Float64Array( data_list )
 
 
+## decode values into 'numpy.ndarray'
+## array shares memory with message if message is immutable (then array is read-only)
+def deserialize_Float64Array_numpy( _: int, data: BytesContainer ):
+    data_len = data.size()
+    if data_len < 4:
+        raise ValueError( f"invalid packet -- too short: {data}" )
+    data_header = data.popInt32()
+    list_size   = max( data_header, 0 )
+    check_items( data, list_size, 8 )
+    data_array  = pop_numpy_items( data, "<f8", list_size )
+    return Float64Array( data_array )
+
+
 def serialize_Float64Array( gd_type_id: int, value: Float64Array, data: BytesContainer ):
     data.pushFlagsType( 0, gd_type_id )
     list_size = len( value )
     data_header = list_size
     data.pushInt32( data_header )
-    data.pushFloat64Items( value.values )
+    values = value.values
+    if is_ndarray( values ):
+        push_numpy_items( data, values, "<f8" )
+        return
+    data.pushFloat64Items( values )
 
 
 ## =========================================================
@@ -1274,9 +2043,13 @@ def deserialize_StringArray( _: int, data: BytesContainer ):
     list_size   = data_header
     if list_size < 1:
         return StringArray()
+    check_items( data, list_size, 4 )
 
     proper_data = StringArray()
     for _ in range(0, list_size):
+        ## count only bounds number of items -- check header of each string
+        if data.size() < 4:
+            raise ValueError( f"invalid packet -- too short: {data.size()} < 4" )
         val = data.popString()
         proper_data.append( val )
     return proper_data
@@ -1297,25 +2070,42 @@ def serialize_StringArray( gd_type_id: int, value: StringArray, data: BytesConta
 
 @dataclass
 class Vector2Array():
+    ## list of tuples or 'numpy.ndarray' of shape (N, 2) (dtype '<f4')
     items: List[ Tuple[float, float] ] = field(default_factory=list)        ## list of tuples(x, y)
 
+    def __eq__( self, other ):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return values_equal( self.items, other.items )
+
     def __len__(self):
         return len( self.items )
 
+    ## item is tuple of components (also for 'numpy.ndarray' storage)
     def __getitem__( self, index ):
+        if is_ndarray( self.items ):
+            return get_rows_item( self.items, index )
         return self.items[ index ]
 
     def append( self, xcoord, ycoord ):
+        if is_ndarray( self.items ):
+            numpy = import_numpy()
+            new_item   = numpy.array( [ (xcoord, ycoord) ], dtype=self.items.dtype )
+            self.items = numpy.append( self.items, new_item, axis=0 )
+            return
         self.items.append( (xcoord, ycoord) )
 
     def toNumpy(self):
+        numpy = import_numpy()
+        if is_ndarray( self.items ):
+            return self.items
         return numpy.array( self.items )
         # return numpy.array([ [point[0], point[1]] for point in self.items ])
 
     @staticmethod
-    def fromNumpy(data_array: numpy.ndarray):
-        point_list = [ [point[0], point[1]] for point in data_array ]
-        return Vector2Array( point_list )
+    def fromNumpy(data_array: 'numpy.ndarray'):
+        numpy = import_numpy()
+        return Vector2Array( numpy.asarray( data_array, dtype="<f4" ).reshape( -1, 2 ) )
 
 
 # def deserialize_list( data_flags: int, data: BytesContainer ):
@@ -1327,13 +2117,23 @@ def deserialize_Vector2Array( _: int, data: BytesContainer ):
     list_size   = data_header
     if list_size < 1:
         return Vector2Array()
+    check_items( data, list_size, 8 )
 
-    proper_data = Vector2Array()
-    for _ in range(0, list_size):
-        x_val = data.popFloat32()
-        y_val = data.popFloat32()
-        proper_data.append( x_val, y_val )
-    return proper_data
+    coords = data.popFloat32Items( 2 * list_size )
+    return Vector2Array( group_items( coords, 2 ) )
+
+
+## decode items into 'numpy.ndarray' of shape (N, 2)
+## array shares memory with message if message is immutable (then array is read-only)
+def deserialize_Vector2Array_numpy( _: int, data: BytesContainer ):
+    data_len = data.size()
+    if data_len < 4:
+        raise ValueError( f"invalid packet -- too short: {data}" )
+    data_header = data.popInt32()
+    list_size   = max( data_header, 0 )
+    check_items( data, list_size, 8 )
+    data_array  = pop_numpy_items( data, "<f4", 2 * list_size )
+    return Vector2Array( data_array.reshape( -1, 2 ) )
 
 
 def serialize_Vector2Array( gd_type_id: int, value: Vector2Array, data: BytesContainer ):
@@ -1343,10 +2143,14 @@ def serialize_Vector2Array( gd_type_id: int, value: Vector2Array, data: BytesCon
 #             data_header = shared_flag & list_size & 0x7FFFFFFF
     data_header = list_size
     data.pushInt32( data_header )
-    for i in range(0, list_size):
-        item = value[ i ]
-        data.pushFloat32( item[0] )
-        data.pushFloat32( item[1] )
+    items = value.items
+    if is_ndarray( items ):
+        if items.shape != ( list_size, 2 ):
+            raise ValueError( f"invalid items shape, expected ({list_size}, 2): {items.shape}" )
+        push_numpy_items( data, items, "<f4" )
+        return
+    coords = flatten_items( items, 2 )
+    data.pushFloat32Items( coords )
 
 
 ## =========================================================
@@ -1354,25 +2158,42 @@ def serialize_Vector2Array( gd_type_id: int, value: Vector2Array, data: BytesCon
 
 @dataclass
 class Vector3Array():
+    ## list of tuples or 'numpy.ndarray' of shape (N, 3) (dtype '<f4')
     items: List[ Tuple[float, float, float] ] = field(default_factory=list)        ## list of tuples(x, y, z)
 
+    def __eq__( self, other ):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return values_equal( self.items, other.items )
+
     def __len__(self):
         return len( self.items )
 
+    ## item is tuple of components (also for 'numpy.ndarray' storage)
     def __getitem__( self, index ):
+        if is_ndarray( self.items ):
+            return get_rows_item( self.items, index )
         return self.items[ index ]
 
     def append( self, xcoord, ycoord, zcoord ):
+        if is_ndarray( self.items ):
+            numpy = import_numpy()
+            new_item   = numpy.array( [ (xcoord, ycoord, zcoord) ], dtype=self.items.dtype )
+            self.items = numpy.append( self.items, new_item, axis=0 )
+            return
         self.items.append( (xcoord, ycoord, zcoord) )
 
     def toNumpy(self):
+        numpy = import_numpy()
+        if is_ndarray( self.items ):
+            return self.items
         return numpy.array( self.items )
         # return numpy.array([ [point[0], point[1], point[2]] for point in self.items ])
 
     @staticmethod
-    def fromNumpy(data_array: numpy.ndarray):
-        point_list = [ [point[0], point[1], point[2]] for point in data_array ]
-        return Vector3Array( point_list )
+    def fromNumpy(data_array: 'numpy.ndarray'):
+        numpy = import_numpy()
+        return Vector3Array( numpy.asarray( data_array, dtype="<f4" ).reshape( -1, 3 ) )
 
 
 # def deserialize_list( data_flags: int, data: BytesContainer ):
@@ -1384,14 +2205,23 @@ def deserialize_Vector3Array( _: int, data: BytesContainer ):
     list_size   = data_header
     if list_size < 1:
         return Vector3Array()
+    check_items( data, list_size, 12 )
 
-    proper_data = Vector3Array()
-    for _ in range(0, list_size):
-        x_val = data.popFloat32()
-        y_val = data.popFloat32()
-        z_val = data.popFloat32()
-        proper_data.append( x_val, y_val, z_val )
-    return proper_data
+    coords = data.popFloat32Items( 3 * list_size )
+    return Vector3Array( group_items( coords, 3 ) )
+
+
+## decode items into 'numpy.ndarray' of shape (N, 3)
+## array shares memory with message if message is immutable (then array is read-only)
+def deserialize_Vector3Array_numpy( _: int, data: BytesContainer ):
+    data_len = data.size()
+    if data_len < 4:
+        raise ValueError( f"invalid packet -- too short: {data}" )
+    data_header = data.popInt32()
+    list_size   = max( data_header, 0 )
+    check_items( data, list_size, 12 )
+    data_array  = pop_numpy_items( data, "<f4", 3 * list_size )
+    return Vector3Array( data_array.reshape( -1, 3 ) )
 
 
 def serialize_Vector3Array( gd_type_id: int, value, data: BytesContainer ):
@@ -1401,11 +2231,14 @@ def serialize_Vector3Array( gd_type_id: int, value, data: BytesContainer ):
 #             data_header = shared_flag & list_size & 0x7FFFFFFF
     data_header = list_size
     data.pushInt32( data_header )
-    for i in range(0, list_size):
-        item = value[ i ]
-        data.pushFloat32( item[0] )
-        data.pushFloat32( item[1] )
-        data.pushFloat32( item[2] )
+    items = value.items
+    if is_ndarray( items ):
+        if items.shape != ( list_size, 3 ):
+            raise ValueError( f"invalid items shape, expected ({list_size}, 3): {items.shape}" )
+        push_numpy_items( data, items, "<f4" )
+        return
+    coords = flatten_items( items, 3 )
+    data.pushFloat32Items( coords )
 
 
 ## =========================================================
@@ -1413,25 +2246,42 @@ def serialize_Vector3Array( gd_type_id: int, value, data: BytesContainer ):
 
 @dataclass
 class ColorArray():
+    ## list of tuples or 'numpy.ndarray' of shape (N, 4) (dtype '<f4')
     items: List[ Tuple[float, float, float, float] ] = field(default_factory=list)        ## list of tuples(r, g, b, a)
 
+    def __eq__( self, other ):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return values_equal( self.items, other.items )
+
     def __len__(self):
         return len( self.items )
 
+    ## item is tuple of components (also for 'numpy.ndarray' storage)
     def __getitem__( self, index ):
+        if is_ndarray( self.items ):
+            return get_rows_item( self.items, index )
         return self.items[ index ]
 
     def append( self, red_val, green_val, blue_val, alpha_val ):
+        if is_ndarray( self.items ):
+            numpy = import_numpy()
+            new_item   = numpy.array( [ (red_val, green_val, blue_val, alpha_val) ], dtype=self.items.dtype )
+            self.items = numpy.append( self.items, new_item, axis=0 )
+            return
         self.items.append( (red_val, green_val, blue_val, alpha_val) )
 
     def toNumpy(self):
+        numpy = import_numpy()
+        if is_ndarray( self.items ):
+            return self.items
         return numpy.array( self.items )
         # return numpy.array([ [point[0], point[1], point[2], point[3]] for point in self.items ])
 
     @staticmethod
-    def fromNumpy(data_array: numpy.ndarray):
-        point_list = [ [point[0], point[1], point[2], point[3]] for point in data_array ]
-        return ColorArray( point_list )
+    def fromNumpy(data_array: 'numpy.ndarray'):
+        numpy = import_numpy()
+        return ColorArray( numpy.asarray( data_array, dtype="<f4" ).reshape( -1, 4 ) )
 
 
 # def deserialize_list( data_flags: int, data: BytesContainer ):
@@ -1443,15 +2293,23 @@ def deserialize_ColorArray( _: int, data: BytesContainer ):
     list_size   = data_header
     if list_size < 1:
         return ColorArray()
+    check_items( data, list_size, 16 )
 
-    proper_data = ColorArray()
-    for _ in range(0, list_size):
-        red_val   = data.popFloat32()
-        green_val = data.popFloat32()
-        blue_val  = data.popFloat32()
-        alpha_val = data.popFloat32()
-        proper_data.append( red_val, green_val, blue_val, alpha_val )
-    return proper_data
+    coords = data.popFloat32Items( 4 * list_size )
+    return ColorArray( group_items( coords, 4 ) )
+
+
+## decode items into 'numpy.ndarray' of shape (N, 4)
+## array shares memory with message if message is immutable (then array is read-only)
+def deserialize_ColorArray_numpy( _: int, data: BytesContainer ):
+    data_len = data.size()
+    if data_len < 4:
+        raise ValueError( f"invalid packet -- too short: {data}" )
+    data_header = data.popInt32()
+    list_size   = max( data_header, 0 )
+    check_items( data, list_size, 16 )
+    data_array  = pop_numpy_items( data, "<f4", 4 * list_size )
+    return ColorArray( data_array.reshape( -1, 4 ) )
 
 
 def serialize_ColorArray( gd_type_id: int, value: ColorArray, data: BytesContainer ):
@@ -1461,12 +2319,31 @@ def serialize_ColorArray( gd_type_id: int, value: ColorArray, data: BytesContain
 #             data_header = shared_flag & list_size & 0x7FFFFFFF
     data_header = list_size
     data.pushInt32( data_header )
-    for i in range(0, list_size):
-        item = value[ i ]
-        data.pushFloat32( item[0] )
-        data.pushFloat32( item[1] )
-        data.pushFloat32( item[2] )
-        data.pushFloat32( item[3] )
+    items = value.items
+    if is_ndarray( items ):
+        if items.shape != ( list_size, 4 ):
+            raise ValueError( f"invalid items shape, expected ({list_size}, 4): {items.shape}" )
+        push_numpy_items( data, items, "<f4" )
+        return
+    coords = flatten_items( items, 4 )
+    data.pushFloat32Items( coords )
+
+
+## ======================================================================
+
+
+## convert flat list of coordinates into list of tuples of size 'item_size'
+def group_items( coords, item_size: int ):
+    coords_iter = iter( coords )
+    return list( zip( *[ coords_iter ] * item_size ) )
+
+
+## convert container of items of size 'item_size' into flat list of coordinates
+def flatten_items( items, item_size: int ):
+    coords = list( chain.from_iterable( items ) )
+    if len( coords ) != item_size * len( items ):
+        raise ValueError( f"invalid items size, expected {item_size} coordinates per item: {items}" )
+    return coords
 
 
 ## ======================================================================
@@ -1505,3 +2382,502 @@ def prepare_config_dicts( config_list, module ):
         SERIALIZATION_MAP[ config_py_type ] = ( config_gd_type, serialize_func )
 
     return ( DESERIALIZATION_MAP, SERIALIZATION_MAP )
+
+
+##
+## Prepare tables for fast dispatch:
+##     DESERIALIZATION_LIST: List[ <deserialize_function> ] indexed by Godot_Type_Id (None for unsupported types)
+##     SERIALIZER_MAP:       Dict[ Python_Type, <serializer> ]
+## where <serializer> is ( Any, BytesContainer ) -> void with Godot_Type_Id already bound.
+##
+def prepare_dispatch_tables( deserialization_map, serialization_map ):
+    DESERIALIZATION_LIST: List[ Callable[[int, BytesContainer], Any] ] = [ None ] * 256
+    for gd_type_id, deserialize_func in deserialization_map.items():
+        if gd_type_id < 0 or gd_type_id > 0xFF:
+            raise ValueError( f"invalid CONFIG_LIST: Godot type {gd_type_id} out of range" )
+        DESERIALIZATION_LIST[ gd_type_id ] = deserialize_func
+
+    SERIALIZER_MAP: Dict[ object, Callable[[Any, BytesContainer], Any] ] = {}
+    for py_type, ( gd_type_id, serialize_func ) in serialization_map.items():
+        SERIALIZER_MAP[ py_type ] = partial( serialize_func, gd_type_id )
+
+    return ( DESERIALIZATION_LIST, SERIALIZER_MAP )
+
+
+## ======================================================================
+## skipping values
+## ======================================================================
+
+
+## move 'data' past one encoded value without building Python object
+def skip_type( data: BytesContainer ):
+    data_len = data.size()
+    if data_len < 4:
+        raise ValueError( f"invalid packet -- too short: {data}" )
+
+    data_flags, gd_type_id = data.popFlagsType()
+
+    codec = data.codec
+    if codec is None:
+        skip_function = get_deserialization_function( gd_type_id )
+        skip_function = SKIP_FUNCTIONS.get( skip_function, skip_function )
+    else:
+        skip_function = codec.skip_list[ gd_type_id ]
+    if skip_function is None:
+        raise ValueError( f"unable to get deserialization info for Godot type {gd_type_id}" )
+
+    skip_function( data_flags, data )
+
+
+def skip_bytes( size: int, _: int, data: BytesContainer ):
+    data_len = data.size()
+    if data_len < size:
+        raise ValueError( f"invalid packet -- too short: {data_len} < {size}" )
+    data.skip( size )
+
+
+def skip_float( data_flags: int, data: BytesContainer ):
+    encoded_64 = (data_flags & 1) == 1
+    if encoded_64:
+        skip_bytes( 8, data_flags, data )
+    else:
+        skip_bytes( 4, data_flags, data )
+
+
+def skip_string( data_flags: int, data: BytesContainer ):
+    string_len = max( pop_header( data ), 0 )
+    padding    = -string_len % 4
+    skip_bytes( string_len + padding, data_flags, data )
+
+
+def skip_NodePath( data_flags: int, data: BytesContainer ):
+    data_header = pop_header( data )
+    if data_header & 0x80000000 != 0:
+        ## new format
+        raise ValueError( f"NodePath new format not supported: {data}" )
+    string_len = data_header & 0x7FFFFFFF
+    padding    = -string_len % 4
+    skip_bytes( string_len + padding, data_flags, data )
+
+
+def skip_dict( data_flags: int, data: BytesContainer ):
+    list_size = pop_header( data ) & 0x7FFFFFFF
+    for _ in range(0, 2 * list_size):
+        skip_type( data )
+
+
+def skip_list( data_flags: int, data: BytesContainer ):
+    list_size = pop_header( data ) & 0x7FFFFFFF
+    for _ in range(0, list_size):
+        skip_type( data )
+
+
+## skip packed array of items of size 'item_size'
+def skip_items( item_size: int, data_flags: int, data: BytesContainer ):
+    list_size = max( pop_header( data ), 0 )
+    skip_bytes( item_size * list_size, data_flags, data )
+
+
+def skip_StringArray( data_flags: int, data: BytesContainer ):
+    list_size = max( pop_header( data ), 0 )
+    for _ in range(0, list_size):
+        skip_string( data_flags, data )
+
+
+def pop_header( data: BytesContainer ) -> int:
+    data_len = data.size()
+    if data_len < 4:
+        raise ValueError( f"invalid packet -- too short: {data}" )
+    return data.popInt32()
+
+
+##
+## Skip functions of deserialization functions: Dict[ <deserialize_function>, <skip_function> ]
+## where <skip_function> is ( int, BytesContainer ) -> void.
+## Values of deserialization functions not present in the dict are skipped by decoding and discarding them.
+##
+SKIP_FUNCTIONS: Dict[ Callable[[int, BytesContainer], Any], Callable[[int, BytesContainer], Any] ] = {
+    deserialize_none:                   partial( skip_bytes, 0 ),
+    deserialize_bool:                   partial( skip_bytes, 4 ),
+    deserialize_int:                    partial( skip_bytes, 4 ),
+    deserialize_float:                  skip_float,
+    deserialize_string:                 skip_string,
+    deserialize_Vector2:                partial( skip_bytes, 8 ),
+    deserialize_Vector2i:               partial( skip_bytes, 8 ),
+    deserialize_Rect2:                  partial( skip_bytes, 16 ),
+    deserialize_Rect2i:                 partial( skip_bytes, 16 ),
+    deserialize_Vector3:                partial( skip_bytes, 12 ),
+    deserialize_Vector3i:               partial( skip_bytes, 12 ),
+    deserialize_Transform2D:            partial( skip_bytes, 24 ),
+    deserialize_Vector4:                partial( skip_bytes, 16 ),
+    deserialize_Vector4i:               partial( skip_bytes, 16 ),
+    deserialize_Plane:                  partial( skip_bytes, 16 ),
+    deserialize_Quaternion:             partial( skip_bytes, 16 ),
+    deserialize_AABB:                   partial( skip_bytes, 24 ),
+    deserialize_Basis:                  partial( skip_bytes, 36 ),
+    deserialize_Transform3D:            partial( skip_bytes, 48 ),
+    deserialize_Projection:             partial( skip_bytes, 64 ),
+    deserialize_Color:                  partial( skip_bytes, 16 ),
+    deserialize_StringName:             skip_string,
+    deserialize_RID:                    partial( skip_bytes, 8 ),
+    deserialize_NodePath:               skip_NodePath,
+    deserialize_dict:                   skip_dict,
+    deserialize_list:                   skip_list,
+    deserialize_StringArray:            skip_StringArray
+}
+
+##
+## Sizes of items of packed arrays: Dict[ <deserialize_function>, int ]
+##
+PACKED_ITEM_SIZES: Dict[ Callable[[int, BytesContainer], Any], int ] = {
+    deserialize_ByteArray:              1,
+    deserialize_Int32Array:             4,
+    deserialize_Int32Array_numpy:       4,
+    deserialize_Int64Array:             8,
+    deserialize_Int64Array_numpy:       8,
+    deserialize_Float32Array:           4,
+    deserialize_Float32Array_numpy:     4,
+    deserialize_Float64Array:           8,
+    deserialize_Float64Array_numpy:     8,
+    deserialize_Vector2Array:           8,
+    deserialize_Vector2Array_numpy:     8,
+    deserialize_Vector3Array:           12,
+    deserialize_Vector3Array_numpy:     12,
+    deserialize_ColorArray:             16,
+    deserialize_ColorArray_numpy:       16
+}
+
+SKIP_FUNCTIONS.update( { func: partial( skip_items, item_size ) for func, item_size in PACKED_ITEM_SIZES.items() } )
+
+
+## prepare list of skip functions indexed by Godot_Type_Id
+def prepare_skip_table( deserialization_list ):
+    SKIP_LIST = []
+    for deserialize_func in deserialization_list:
+        SKIP_LIST.append( SKIP_FUNCTIONS.get( deserialize_func, deserialize_func ) )
+    return SKIP_LIST
+
+
+## ======================================================================
+## fixed size types
+## ======================================================================
+
+
+##
+## Math types consisting of fixed number of 32-bit components:
+## Dict[ <deserialize_function>, Tuple[ <value_type>, <components number>, <'array' type code> ] ]
+##
+FIXED_ITEM_FORMATS: Dict[ Callable[[int, BytesContainer], Any], Tuple[ type, int, str ] ] = {
+    deserialize_Vector2:                ( Vector2, 2, "f" ),
+    deserialize_Vector2i:               ( Vector2i, 2, "i" ),
+    deserialize_Rect2:                  ( Rect2, 4, "f" ),
+    deserialize_Rect2i:                 ( Rect2i, 4, "i" ),
+    deserialize_Vector3:                ( Vector3, 3, "f" ),
+    deserialize_Vector3i:               ( Vector3i, 3, "i" ),
+    deserialize_Transform2D:            ( Transform2D, 6, "f" ),
+    deserialize_Vector4:                ( Vector4, 4, "f" ),
+    deserialize_Vector4i:               ( Vector4i, 4, "i" ),
+    deserialize_Plane:                  ( Plane, 4, "f" ),
+    deserialize_Quaternion:             ( Quaternion, 4, "f" ),
+    deserialize_AABB:                   ( AABB, 6, "f" ),
+    deserialize_Basis:                  ( Basis, 9, "f" ),
+    deserialize_Transform3D:            ( Transform3D, 12, "f" ),
+    deserialize_Projection:             ( Projection, 16, "f" ),
+    deserialize_Color:                  ( Color, 4, "f" )
+}
+
+
+## ======================================================================
+## trusted decoding
+## ======================================================================
+
+
+##
+## Decoding of messages from trusted source.
+##
+## Leaf values are read directly from 'BytesReader' without checking remaining size of data,
+## bounds are verified once per container (number of items against remaining data).
+## Reading past end of data raises 'struct.error', which is converted to 'ValueError' by caller.
+##
+def deserialize_trusted_type( data: BytesReader ):
+    raw = _TRUSTED_UINT32.unpack_from( data.view, data.offset )[0]
+    data.offset += 4
+    deserialize_function = data.codec.trusted_list[ raw & 0xFF ]
+    if deserialize_function is None:
+        raise ValueError( f"unable to get deserialization info for Godot type {raw & 0xFF}" )
+    return deserialize_function( (raw >> 16) & 0xFF, data )
+
+
+def deserialize_bool_trusted( _: int, data: BytesReader ):
+    value = _TRUSTED_INT32.unpack_from( data.view, data.offset )[0]
+    data.offset += 4
+    return value > 0
+
+
+def deserialize_int_trusted( _: int, data: BytesReader ):
+    value = _TRUSTED_INT32.unpack_from( data.view, data.offset )[0]
+    data.offset += 4
+    return value
+
+
+def deserialize_float_trusted( data_flags: int, data: BytesReader ) -> float:
+    if data_flags & 1 == 1:
+        value = _TRUSTED_FLOAT64.unpack_from( data.view, data.offset )[0]
+        data.offset += 8
+        return value
+    value = _TRUSTED_FLOAT32.unpack_from( data.view, data.offset )[0]
+    data.offset += 4
+    return value
+
+
+def deserialize_string_trusted( _: int, data: BytesReader ) -> str:
+    if data.intern is not None:
+        return pop_interned( data, str )
+    view   = data.view
+    offset = data.offset
+    string_len = _TRUSTED_INT32.unpack_from( view, offset )[0]
+    offset += 4
+    if string_len < 1:
+        data.offset = offset
+        return ""
+    end = offset + string_len
+    if end > len( view ):
+        raise ValueError( f"invalid packet -- too short: {len( view ) - offset} < {string_len}" )
+    if data.guard is not None:
+        data.guard.checkString( string_len )
+    data.offset = end + (-string_len % 4)
+    return str( view[ offset:end ], "utf-8" )
+
+
+def deserialize_StringName_trusted( data_flags: int, data: BytesReader ) -> StringName:
+    if data.intern is not None:
+        return pop_interned( data, StringName )
+    return StringName( deserialize_string_trusted( data_flags, data ) )
+
+
+## decode math type consisting of fixed number of components
+def deserialize_items_trusted( value_type, items_struct, _: int, data: BytesReader ):
+    items = items_struct.unpack_from( data.view, data.offset )
+    data.offset += items_struct.size
+    return value_type.fromComponents( *items )
+
+
+def deserialize_dict_trusted( _: int, data: BytesReader ):
+    list_size = _TRUSTED_INT32.unpack_from( data.view, data.offset )[0] & 0x7FFFFFFF
+    data.offset += 4
+    if list_size < 1:
+        if data.guard is not None:
+            data.guard.checkEmpty()
+        return {}
+    check_items( data, list_size, 8 )
+    guard = data.guard
+    if guard is not None:
+        guard.enter()
+
+    proper_data = None
+    if data.shapes is not None and list_size <= ShapeCache.MAX_KEYS:
+        proper_data = deserialize_dict_shape( data, list_size, deserialize_trusted_type )
+    if proper_data is None:
+        proper_data = {}
+        for _ in range(0, list_size):
+            key_value = deserialize_trusted_type( data )
+            proper_data[ key_value ] = deserialize_trusted_type( data )
+
+    if guard is not None:
+        guard.leave()
+    return proper_data
+
+
+def deserialize_list_trusted( _: int, data: BytesReader ):
+    list_size = _TRUSTED_INT32.unpack_from( data.view, data.offset )[0] & 0x7FFFFFFF
+    data.offset += 4
+    if list_size < 1:
+        if data.guard is not None:
+            data.guard.checkEmpty()
+        return []
+    check_items( data, list_size, 4 )
+    guard = data.guard
+    if guard is not None:
+        guard.enter()
+
+    ## dispatch inlined
+    trusted_list  = data.codec.trusted_list
+    run_map       = data.codec.run_map
+    unpack_header = _TRUSTED_UINT32.unpack_from
+    view = data.view
+    proper_data = []
+    index = 0
+    previous_raw = -1
+    while index < list_size:
+        raw = unpack_header( view, data.offset )[0]
+        if raw == previous_raw and raw in run_map:
+            run_size = deserialize_run( data, list_size - index, proper_data )
+            if run_size > 0:
+                index += run_size
+                continue
+        previous_raw = raw
+        index += 1
+        data.offset += 4
+        deserialize_function = trusted_list[ raw & 0xFF ]
+        if deserialize_function is None:
+            raise ValueError( f"unable to get deserialization info for Godot type {raw & 0xFF}" )
+        proper_data.append( deserialize_function( (raw >> 16) & 0xFF, data ) )
+
+    if guard is not None:
+        guard.leave()
+    return proper_data
+
+
+_TRUSTED_INT32   = struct.Struct( "<i" )
+_TRUSTED_UINT32  = struct.Struct( "<I" )
+_TRUSTED_FLOAT32 = struct.Struct( "<f" )
+_TRUSTED_FLOAT64 = struct.Struct( "<d" )
+
+
+##
+## Trusted variants of deserialization functions: Dict[ <deserialize_function>, <deserialize_function> ]
+## Deserialization functions not present in the dict are used directly.
+##
+TRUSTED_FUNCTIONS: Dict[ Callable[[int, BytesContainer], Any], Callable[[int, BytesContainer], Any] ] = {
+    deserialize_bool:                   deserialize_bool_trusted,
+    deserialize_int:                    deserialize_int_trusted,
+    deserialize_float:                  deserialize_float_trusted,
+    deserialize_string:                 deserialize_string_trusted,
+    deserialize_StringName:             deserialize_StringName_trusted,
+    deserialize_dict:                   deserialize_dict_trusted,
+    deserialize_list:                   deserialize_list_trusted
+}
+
+
+TRUSTED_FUNCTIONS.update( {
+    func: partial( deserialize_items_trusted, value_type, struct.Struct( f"<{items_number}{type_code}" ) )
+    for func, ( value_type, items_number, type_code ) in FIXED_ITEM_FORMATS.items()
+} )
+
+
+## prepare list of trusted deserialization functions indexed by Godot_Type_Id
+def prepare_trusted_table( deserialization_list ):
+    TRUSTED_LIST = []
+    for deserialize_func in deserialization_list:
+        TRUSTED_LIST.append( TRUSTED_FUNCTIONS.get( deserialize_func, deserialize_func ) )
+    return TRUSTED_LIST
+
+
+## ======================================================================
+## runs of equal items
+## ======================================================================
+
+
+##
+## Decoding of runs of items of the same fixed size type inside Array.
+##
+## Items of a run have identical flags/type word, so run is found by comparing header words
+## of consecutive items and whole run is decoded in one step instead of dispatching each item.
+## Returns number of decoded items (0 if there is no run at current position).
+##
+def deserialize_run( data: BytesReader, items_number: int, proper_data: list ) -> int:
+    view   = data.view
+    offset = data.offset
+    data_len = len( view ) - offset
+    if data_len < 8:
+        return 0
+    header   = _TRUSTED_UINT32.unpack_from( view, offset )[0]
+    run_info = data.codec.run_map.get( header )
+    if run_info is None:
+        return 0
+    stride, decode_run = run_info
+    items_number = min( items_number, data_len // stride )
+    if items_number < 2 or _TRUSTED_UINT32.unpack_from( view, offset + stride )[0] != header:
+        return 0
+    run_size = count_run( view, offset, stride, items_number )
+    if run_size < 2:
+        return 0
+    end = offset + run_size * stride
+    proper_data.extend( decode_run( view[ offset:end ] ) )
+    data.offset = end
+    return run_size
+
+
+## count consecutive items having the same header word as item at 'offset'
+## header words are compared in growing chunks
+def count_run( view, offset: int, stride: int, items_number: int ) -> int:
+    header = view[ offset:offset + 4 ].tobytes()
+    words  = stride // 4
+    run_size = 1
+    chunk    = 1
+    while run_size < items_number:
+        chunk = min( chunk * 2, items_number - run_size )
+        start = offset + run_size * stride
+        headers = view[ start:start + chunk * stride ].cast( "I" )[ ::words ].tobytes()
+        if headers == header * chunk:
+            run_size += chunk
+            continue
+        for index in range( 0, chunk ):
+            if headers[ index * 4:index * 4 + 4 ] != header:
+                return run_size + index
+    return run_size
+
+
+## decode records of 32-bit words (header word followed by components), returns all words including headers
+def decode_words_run( type_code: str, buffer ) -> list:
+    values = array.array( type_code )
+    values.frombytes( buffer )
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values.tolist()
+
+
+def decode_none_run( buffer ) -> list:
+    return [ None ] * ( len( buffer ) // 4 )
+
+
+def decode_bool_run( buffer ) -> list:
+    return [ value > 0 for value in decode_words_run( "i", buffer )[ 1::2 ] ]
+
+
+def decode_int_run( buffer ) -> list:
+    return decode_words_run( "i", buffer )[ 1::2 ]
+
+
+def decode_float32_run( buffer ) -> list:
+    return decode_words_run( "f", buffer )[ 1::2 ]
+
+
+def decode_float64_run( buffer ) -> list:
+    return [ record[1] for record in _RUN_FLOAT64.iter_unpack( buffer ) ]
+
+
+def decode_items_run( value_type, items_number: int, type_code: str, buffer ) -> list:
+    words  = items_number + 1
+    values = decode_words_run( type_code, buffer )
+    components = [ values[ index::words ] for index in range( 1, words ) ]
+    return list( map( value_type.fromComponents, *components ) )
+
+
+_BIG_ENDIAN  = sys.byteorder == "big"
+_RUN_FLOAT64 = struct.Struct( "<Id" )
+
+
+##
+## Runs of fixed size items: Dict[ <deserialize_function>, List[ Tuple[ <flags>, <item size>, <decode_function> ] ] ]
+## Item size includes header word.
+##
+RUN_FUNCTIONS: Dict[ Callable[[int, BytesContainer], Any], List[ Tuple[ int, int, Callable[[Any], list] ] ] ] = {
+    deserialize_none:                   [ ( 0, 4, decode_none_run ) ],
+    deserialize_bool:                   [ ( 0, 8, decode_bool_run ) ],
+    deserialize_int:                    [ ( 0, 8, decode_int_run ) ],
+    deserialize_float:                  [ ( 0, 8, decode_float32_run ), ( 1, 12, decode_float64_run ) ]
+}
+RUN_FUNCTIONS.update( {
+    func: [ ( 0, 4 + 4 * items_number, partial( decode_items_run, value_type, items_number, type_code ) ) ]
+    for func, ( value_type, items_number, type_code ) in FIXED_ITEM_FORMATS.items()
+} )
+
+
+## prepare dict of run decoders indexed by raw header word (flags and Godot_Type_Id)
+def prepare_run_table( deserialization_list ):
+    RUN_MAP = {}
+    for gd_type_id, deserialize_func in enumerate( deserialization_list ):
+        for flags, item_size, decode_function in RUN_FUNCTIONS.get( deserialize_func, [] ):
+            RUN_MAP[ (flags << 16) | gd_type_id ] = ( item_size, decode_function )
+    return RUN_MAP
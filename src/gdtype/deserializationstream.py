@@ -0,0 +1,235 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+import struct
+
+from . import commontypes as ct
+from .bytescontainer import BytesReader
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_INT32_STRUCT = struct.Struct( "<i" )
+
+
+## decodes stream of messages (e.g. received through TCP/IP) using given codec
+##
+## received data is kept in 'bytearray' with offset of consumed data, so appending data
+## and consuming messages is amortized constant time; consumed data is dropped periodically
+##
+## data can be received directly into stream's buffer, e.g.:
+##     view = stream.getWriteBuffer( 4096 )
+##     size = sock.recv_into( view )
+##     stream.commitWrite( size )
+## or simply by 'stream.receiveFromSocket( sock )'
+class DeserializationStream:
+
+    ## compact buffer if consumed data exceeds given size and half of buffer
+    COMPACT_THRESHOLD = 64 * 1024
+
+    ## default size of single socket read
+    READ_SIZE = 64 * 1024
+
+    ## 'limits' is optional 'commontypes.DecodeLimits' applied to each message
+    ## 'intern' is optional 'commontypes.InternTable' shared by consecutive messages
+    ## 'shapes' is optional 'commontypes.ShapeCache' shared by consecutive messages
+    def __init__(self, codec, data: bytes = None, limits: ct.DecodeLimits = None, intern: ct.InternTable = None,
+                 shapes: ct.ShapeCache = None):
+        self.codec  = codec
+        self.limits = limits
+        self.shapes = shapes
+        self.intern = intern
+        self.buffer = bytearray()
+        self.offset = 0                 ## beginning of not consumed data
+        self.length = 0                 ## end of received data (remaining part of buffer is free space)
+        self._write_view: memoryview = None
+        if data is not None:
+            self.appendData( data )
+
+    def __len__(self):
+        return self.length - self.offset
+
+    def __str__(self):
+        return str( bytes( self.buffer[ self.offset:self.length ] ) )
+
+    def size(self):
+        return self.length - self.offset
+
+    def clear(self):
+        self._releaseWriteView()
+        self.buffer = bytearray()
+        self.offset = 0
+        self.length = 0
+
+    def appendData(self, data: bytes):
+        data_size = len( data )
+        self.buffer[ self.length:self.length + data_size ] = data
+        self.length += data_size
+
+    ## =====================================================
+
+    ## returns writable 'memoryview' of free space of buffer of at least 'min_size' bytes
+    ## view is valid until 'commitWrite()' is called
+    def getWriteBuffer(self, min_size: int) -> memoryview:
+        self._releaseWriteView()
+        self._compact()
+        free_space = len( self.buffer ) - self.length
+        if free_space < min_size:
+            ## grow geometrically
+            self.buffer.extend( bytes( max( min_size - free_space, len( self.buffer ) ) ) )
+        self._write_view = memoryview( self.buffer )[ self.length: ]
+        return self._write_view
+
+    ## mark 'size' bytes written to buffer returned by 'getWriteBuffer()' as received data
+    def commitWrite(self, size: int):
+        if self._write_view is None:
+            raise ValueError( "write buffer not acquired" )
+        if size < 0 or size > len( self._write_view ):
+            raise ValueError( f"invalid commit size: {size}" )
+        self._releaseWriteView()
+        self.length += size
+
+    ## receive data from socket directly into buffer (using 'recv_into')
+    ## returns number of received bytes (0 means connection closed by peer)
+    def receiveFromSocket(self, sock, size: int = None) -> int:
+        if size is None:
+            size = self.READ_SIZE
+        view = self.getWriteBuffer( size )
+        try:
+            received = sock.recv_into( view, size )
+        except BaseException:
+            self._releaseWriteView()
+            raise
+        self.commitWrite( received )
+        return received
+
+    ## read data from binary file object directly into buffer (using 'readinto')
+    ## returns number of read bytes (0 means end of file)
+    def readFromFile(self, file, size: int = None) -> int:
+        if size is None:
+            size = self.READ_SIZE
+        view = self.getWriteBuffer( size )
+        try:
+            received = file.readinto( view[ :size ] )
+        except BaseException:
+            self._releaseWriteView()
+            raise
+        if received is None:
+            ## non-blocking file without data
+            received = 0
+        self.commitWrite( received )
+        return received
+
+    def _releaseWriteView(self):
+        if self._write_view is not None:
+            self._write_view.release()
+            self._write_view = None
+
+    ## =====================================================
+
+    def containsMessage(self):
+        check_size = self._checkMessageSize()
+        return check_size >= 0
+
+    ## size of first not consumed message (including header), -1 if its header is not received yet
+    def messageSize(self) -> int:
+        if self.length - self.offset < 4:
+            return -1
+        return _INT32_STRUCT.unpack_from( self.buffer, self.offset )[0] + 4
+
+    def receive(self):
+        check_size = self._checkMessageSize()
+        if check_size < 0:
+            return (False, check_size)
+        data = self._receiveMessages( 1 )[0]
+        return (True, data)
+
+    def receiveList(self):
+        return self._receiveMessages( -1 )
+
+    ## =====================================================
+
+    ## the same as 'commontypes.check_message_size()' for not consumed data
+    def _checkMessageSize(self):
+        curr_size = self.length - self.offset
+        if curr_size < 4:
+            return -4 + curr_size
+        expected_size = _INT32_STRUCT.unpack_from( self.buffer, self.offset )[0]
+        expected_size += 4                              ## increase by message header
+        if self.limits is not None:
+            ## reject message before receiving it
+            self.limits.checkMessageSize( expected_size )
+        return curr_size - expected_size
+
+    ## receive up to 'limit' messages (all available if negative)
+    def _receiveMessages(self, limit: int):
+        ret_list = []
+        view = memoryview( self.buffer )
+        try:
+            while len( ret_list ) != limit and self._checkMessageSize() >= 0:
+                data = self._deserialize( view )
+                ret_list.append( data )
+        finally:
+            view.release()
+            self._compact()
+        return ret_list
+
+    def _deserialize(self, view: memoryview):
+        expected_size = _INT32_STRUCT.unpack_from( view, self.offset )[0]
+        if expected_size < 0:
+            _LOGGER.error( "invalid packet -- negative message size: %s", expected_size )
+            ## drop invalid header, so following data can be received
+            self.offset += 4
+            raise ValueError( f"invalid message size: {expected_size}" )
+        start = self.offset + 4
+        end   = start + expected_size
+        ## consume message before decoding -- invalid message will be dropped
+        self.offset = end
+        message = BytesReader( view, start, end, self.codec )
+        if self.limits is not None:
+            message.guard = ct.LimitsGuard( self.limits )
+        message.shapes = self.shapes
+        message.intern = self.intern
+        try:
+            return ct.deserialize_type( message )
+        finally:
+            message.release()
+
+    ## drop consumed data
+    def _compact(self):
+        if self.offset < 1:
+            return
+        if self._write_view is not None:
+            ## free space is exported -- data can not be moved
+            return
+        if self.offset == self.length:
+            ## everything consumed -- reuse whole buffer
+            self.offset = 0
+            self.length = 0
+            return
+        if self.offset > self.COMPACT_THRESHOLD and self.offset * 2 > self.length:
+            remaining = self.length - self.offset
+            self.buffer[ :remaining ] = self.buffer[ self.offset:self.length ]
+            self.offset = 0
+            self.length = remaining
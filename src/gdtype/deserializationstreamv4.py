@@ -24,56 +24,13 @@
 import logging
 
 from . import binaryapiv4
-from .bytescontainer import BytesContainer
+from .deserializationstream import DeserializationStream
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class DeserializationStreamV4:
+class DeserializationStreamV4( DeserializationStream ):
 
-    def __init__(self, data: bytes = None):
-        self.buffer = BytesContainer( data )
-
-    def __len__(self):
-        return len( self.buffer )
-
-    def __str__(self):
-        return str( self.buffer )
-
-    def size(self):
-        return len( self.buffer )
-
-    def clear(self):
-        self.buffer = BytesContainer()
-
-    def appendData(self, data: bytes):
-        self.buffer.push( data )
-
-    ## =====================================================
-
-    def containsMessage(self):
-        check_size = binaryapiv4.check_message_size( self.buffer.data )
-        return check_size >= 0
-
-    def receive(self):
-        check_size = binaryapiv4.check_message_size( self.buffer.data )
-        if check_size < 0:
-            return (False, check_size)
-        data = self._deserialize()
-        return (True, data)
-
-    def receiveList(self):
-        ret_list = []
-        while binaryapiv4.check_message_size( self.buffer.data ) >= 0:
-            data = self._deserialize()
-            ret_list.append( data )
-        return ret_list
-
-    def _deserialize(self):
-        expected_size = self.buffer.popInt32()
-        message_size  = self.buffer.size()
-        if message_size < expected_size:
-            _LOGGER.error( "invalid packet -- packet size mismatch data size: %s", self.buffer )
-            raise ValueError( f"message size mismatch: {message_size} < {expected_size} for {self.buffer}" )
-        return binaryapiv4.ct.deserialize_type( self.buffer )
+    def __init__(self, data: bytes = None, limits=None, intern=None, shapes=None):
+        super().__init__( binaryapiv4.CODEC, data, limits, intern, shapes )
@@ -0,0 +1,142 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+from itertools import chain
+from functools import partial
+
+from . import commontypes as ct
+from .bytescontainer import BytesContainer
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+##
+## Non-recursive decoding and encoding.
+##
+## Dictionary and Array are handled using explicit stack instead of recursive calls,
+## so nesting depth is not limited by Python's recursion limit. Optional 'max_depth'
+## limits number of nested containers (exceeding the limit raises 'ValueError').
+##
+def deserialize_iterative( message: bytes, codec, max_depth: int = None, limits: ct.DecodeLimits = None ):
+    if max_depth is None and limits is not None:
+        max_depth = limits.max_depth
+    return ct.deserialize_custom( message, partial( deserialize_iterative_type, max_depth=max_depth ), codec, limits )
+
+
+def serialize_iterative( value, codec, max_depth: int = None ) -> bytes:
+    return ct.serialize_custom( value, partial( serialize_iterative_type, max_depth=max_depth ), codec )
+
+
+## =========================================================
+
+
+def deserialize_iterative_type( data: BytesContainer, max_depth: int = None ):
+    deserialization_list = data.codec.deserialization_list
+    deserialize_dict = ct.deserialize_dict
+    deserialize_list = ct.deserialize_list
+    deserialize_type = ct.deserialize_type
+    if max_depth is None:
+        max_depth = -1
+
+    root  = []
+    stack = [ [ root, 1, False ] ]           ## list of [ container, remaining_items, is_dict ]
+    while stack:
+        frame = stack[-1]
+        container, remaining, is_dict = frame
+        while remaining > 0:
+            if is_dict:
+                key_value = deserialize_type( data )
+            if data.size() < 4:
+                raise ValueError( f"invalid packet -- too short: {data}" )
+            data_flags, gd_type_id = data.popFlagsType()
+            deserialize_function = deserialization_list[ gd_type_id ]
+
+            child_size = 0
+            if deserialize_function is deserialize_dict or deserialize_function is deserialize_list:
+                if len( stack ) - 1 == max_depth:
+                    raise ValueError( f"invalid packet -- nesting depth exceeds {max_depth}" )
+                child_size = ct.pop_header( data ) & 0x7FFFFFFF
+                if deserialize_function is deserialize_dict:
+                    item_value = {}
+                    ct.check_items( data, child_size, 8 )
+                else:
+                    item_value = []
+                    ct.check_items( data, child_size, 4 )
+            elif deserialize_function is None:
+                raise ValueError( f"unable to get deserialization info for Godot type {gd_type_id}" )
+            else:
+                item_value = deserialize_function( data_flags, data )
+
+            if is_dict:
+                container[ key_value ] = item_value
+            else:
+                container.append( item_value )
+            remaining -= 1
+
+            if child_size > 0:
+                ## continue with items of nested container
+                frame[1] = remaining
+                stack.append( [ item_value, child_size, deserialize_function is deserialize_dict ] )
+                break
+        else:
+            stack.pop()
+    return root[0]
+
+
+def serialize_iterative_type( value, data: BytesContainer, max_depth: int = None ):
+    serializers = data.codec.serializers
+    serialize_dict = ct.serialize_dict
+    serialize_list = ct.serialize_list
+    if max_depth is None:
+        max_depth = -1
+
+    stack = [ iter( ( value, ) ) ]          ## list of iterators of items to serialize
+    while stack:
+        for item in stack[-1]:
+            item_type  = type( item )
+            serializer = serializers.get( item_type, None )
+            if serializer is None:
+                serializer = ct.resolve_serializer( serializers, item_type )
+                if serializer is None:
+                    raise ValueError( f"unable to serialize data: {item} {item_type}" )
+
+            serialize_function = getattr( serializer, "func", None )
+            if serialize_function is serialize_dict:
+                items_iter = chain.from_iterable( item.items() )
+            elif serialize_function is serialize_list:
+                items_iter = iter( item )
+            else:
+                serializer( item, data )
+                continue
+
+            if len( stack ) - 1 == max_depth:
+                raise ValueError( f"unable to serialize data: nesting depth exceeds {max_depth}" )
+            data.pushFlagsType( 0, serializer.args[0] )
+            data.pushInt32( len( item ) & 0x7FFFFFFF )
+            ## continue with items of nested container
+            stack.append( items_iter )
+            break
+        else:
+            stack.pop()
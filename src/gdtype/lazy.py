@@ -0,0 +1,206 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+from collections.abc import Mapping, Sequence
+
+from . import commontypes as ct
+from .bytescontainer import BytesReader
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+## decode message lazily
+## (items of proxies are not validated until accessed)
+## Dictionary and Array are returned as read-only proxies decoding items on first access
+## proxies keep reference to 'message', so it must not be modified while proxies are in use
+def deserialize_lazy( message: bytes, codec ):
+    return ct.deserialize_custom( message, deserialize_lazy_type, codec )
+
+
+def deserialize_lazy_type( data: BytesReader ):
+    data_len = data.size()
+    if data_len < 4:
+        raise ValueError( f"invalid packet -- too short: {data}" )
+
+    data_flags, gd_type_id = data.popFlagsType()
+
+    codec = data.codec
+    deserialize_function = codec.deserialization_list[ gd_type_id ]
+    if deserialize_function is None:
+        raise ValueError( f"unable to get deserialization info for Godot type {gd_type_id}" )
+
+    if deserialize_function is ct.deserialize_dict:
+        return LazyDict( data.view, data.offset, codec )
+    if deserialize_function is ct.deserialize_list:
+        return LazyList( data.view, data.offset, codec )
+    return deserialize_function( data_flags, data )
+
+
+## decode value at given offset of 'view'
+def decode_lazy_value( view: memoryview, offset: int, codec ):
+    data = BytesReader( view, codec=codec )
+    data.offset = offset
+    return deserialize_lazy_type( data )
+
+
+## ======================================================================
+
+
+##
+## Read-only proxy of encoded Dictionary.
+##
+## Encoded items are scanned on demand: keys are decoded and values are skipped
+## (positions of values are remembered). Value is decoded on first access.
+##
+class LazyDict( Mapping ):
+
+    def __init__(self, view: memoryview, offset: int, codec):
+        self._view   = view
+        self._offset = offset           ## position of Dictionary header
+        self._codec  = codec
+        self._index  = {}               ## key -> position of encoded value
+        self._values = {}               ## decoded values
+        self._scan_offset = -1          ## position of first not scanned item
+        self._remaining   = -1          ## number of not scanned items
+
+    def __getitem__(self, key):
+        value = self._values.get( key, _MISSING )
+        if value is not _MISSING:
+            return value
+        offset = self._index.get( key, None )
+        if offset is None:
+            self._scan( key )
+            offset = self._index.get( key, None )
+            if offset is None:
+                raise KeyError( key )
+        value = decode_lazy_value( self._view, offset, self._codec )
+        self._values[ key ] = value
+        return value
+
+    def __contains__(self, key):
+        if key in self._index:
+            return True
+        self._scan( key )
+        return key in self._index
+
+    def __iter__(self):
+        self._scan()
+        return iter( self._index )
+
+    def __len__(self):
+        self._scan()
+        return len( self._index )
+
+    def __repr__(self):
+        return f"LazyDict({dict( self.items() )})"
+
+    ## decode whole Dictionary
+    def decode(self) -> dict:
+        data = BytesReader( self._view, codec=self._codec )
+        data.offset = self._offset
+        return ct.deserialize_dict( 0, data )
+
+    ## index items until 'key' is found (or all items if key is not given)
+    def _scan(self, key=None):
+        data = BytesReader( self._view, codec=self._codec )
+        if self._remaining < 0:
+            data.offset     = self._offset
+            self._remaining = ct.pop_header( data ) & 0x7FFFFFFF
+        else:
+            data.offset = self._scan_offset
+        while self._remaining > 0:
+            item_key = ct.deserialize_type( data )
+            self._index[ item_key ] = data.offset
+            ct.skip_type( data )
+            self._remaining  -= 1
+            self._scan_offset = data.offset
+            if key is not None and item_key == key:
+                return
+
+
+##
+## Read-only proxy of encoded Array.
+##
+## Positions of items are found by skipping preceding items. Item is decoded on first access.
+##
+class LazyList( Sequence ):
+
+    def __init__(self, view: memoryview, offset: int, codec):
+        self._view    = view
+        self._offset  = offset          ## position of Array header
+        self._codec   = codec
+        self._offsets = []              ## positions of encoded items
+        self._values  = {}              ## decoded items
+        self._size    = -1
+
+    def __getitem__(self, index):
+        if isinstance( index, slice ):
+            return [ self[ i ] for i in range( *index.indices( len( self ) ) ) ]
+        list_size = len( self )
+        if index < 0:
+            index += list_size
+        if index < 0 or index >= list_size:
+            raise IndexError( "list index out of range" )
+        value = self._values.get( index, _MISSING )
+        if value is not _MISSING:
+            return value
+        if index >= len( self._offsets ):
+            self._scan( index )
+        value = decode_lazy_value( self._view, self._offsets[ index ], self._codec )
+        self._values[ index ] = value
+        return value
+
+    def __len__(self):
+        if self._size < 0:
+            data = BytesReader( self._view, codec=self._codec )
+            data.offset = self._offset
+            self._size  = ct.pop_header( data ) & 0x7FFFFFFF
+            self._offsets.append( data.offset )
+        return self._size
+
+    def __eq__(self, other):
+        if isinstance( other, ( list, LazyList ) ):
+            return list( self ) == list( other )
+        return NotImplemented
+
+    def __repr__(self):
+        return f"LazyList({list( self )})"
+
+    ## decode whole Array
+    def decode(self) -> list:
+        data = BytesReader( self._view, codec=self._codec )
+        data.offset = self._offset
+        return ct.deserialize_list( 0, data )
+
+    ## find positions of items up to 'index'
+    def _scan(self, index: int):
+        data = BytesReader( self._view, codec=self._codec )
+        data.offset = self._offsets[ -1 ]
+        while len( self._offsets ) <= index:
+            ct.skip_type( data )
+            self._offsets.append( data.offset )
+
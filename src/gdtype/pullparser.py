@@ -0,0 +1,229 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+import struct
+from enum import IntEnum, unique
+from typing import NamedTuple, Any
+
+from . import commontypes as ct
+from .bytescontainer import BytesReader
+
+
+_LOGGER = logging.getLogger(__name__)
+
+## default size of single read from file
+READ_SIZE = 64 * 1024
+
+
+@unique
+class EventType( IntEnum ):
+    START_DICT      = 0         ## value: number of items
+    KEY             = 1         ## value: decoded key of Dictionary (followed by events of item value)
+    START_ARRAY     = 2         ## value: number of items
+    SCALAR          = 3         ## value: decoded value
+    PACKED_ARRAY    = 4         ## value: 'memoryview' of raw (little-endian) items
+    END             = 5         ## end of Dictionary or Array
+
+
+class Event( NamedTuple ):
+    event: EventType
+    gd_type: int                ## Godot type ID of value
+    value: Any
+
+
+##
+## Iterate over events of message given as buffer ('bytes', 'bytearray', 'memoryview')
+## or as binary file object (positioned at beginning of message).
+##
+## Only one value (or its part) is kept in memory at time, so huge message can be
+## processed in bounded memory. File is read up to end of message.
+##
+def iter_events( source, codec, read_size: int = READ_SIZE ):
+    parser = PullParser( source, codec, read_size )
+    return parser.events()
+
+
+class PullParser:
+
+    def __init__(self, source, codec, read_size: int = READ_SIZE):
+        self.codec     = codec
+        self.read_size = read_size
+        self.file      = None
+        self.remaining = 0              ## size of message not read yet from file
+        if hasattr( source, "read" ):
+            self.file = source
+            source    = bytes()
+        self.data = BytesReader( source, codec=codec )
+
+    def events(self):
+        self._popMessageHeader()
+
+        codec = self.codec
+        stack = []                      ## list of [ remaining_values, expect_key (None for Array), Godot_Type_Id ]
+        while True:
+            if stack:
+                frame = stack[-1]
+                if frame[0] < 1:
+                    stack.pop()
+                    yield Event( EventType.END, frame[2], None )
+                    if not stack:
+                        return
+                    continue
+                if frame[1] is True:
+                    ## Dictionary key
+                    frame[1] = False
+                    gd_type, key_value = self._popValue()
+                    yield Event( EventType.KEY, gd_type, key_value )
+                    continue
+                frame[0] -= 1
+                if frame[1] is False:
+                    frame[1] = True
+
+            self._ensure( 4 )
+            data = self.data
+            if data.size() < 4:
+                raise ValueError( f"invalid packet -- too short: {data}" )
+            data_flags, gd_type_id = data.popFlagsType()
+            deserialize_function = codec.deserialization_list[ gd_type_id ]
+            if deserialize_function is None:
+                raise ValueError( f"unable to get deserialization info for Godot type {gd_type_id}" )
+
+            if deserialize_function is ct.deserialize_dict:
+                dict_size = self._popHeader() & 0x7FFFFFFF
+                self._checkItems( dict_size, 8 )
+                yield Event( EventType.START_DICT, gd_type_id, dict_size )
+                stack.append( [ dict_size, True, gd_type_id ] )
+                continue
+
+            if deserialize_function is ct.deserialize_list:
+                list_size = self._popHeader() & 0x7FFFFFFF
+                self._checkItems( list_size, 4 )
+                yield Event( EventType.START_ARRAY, gd_type_id, list_size )
+                stack.append( [ list_size, None, gd_type_id ] )
+                continue
+
+            item_size = ct.PACKED_ITEM_SIZES.get( deserialize_function, None )
+            if item_size is not None:
+                list_size = max( self._popHeader(), 0 )
+                self._checkItems( list_size, item_size )
+                yield Event( EventType.PACKED_ARRAY, gd_type_id, self._popBuffer( item_size * list_size ) )
+            else:
+                data.offset -= 4
+                _, value = self._popValue()
+                yield Event( EventType.SCALAR, gd_type_id, value )
+
+            if not stack:
+                return
+
+    ## =====================================================
+
+    def _popMessageHeader(self):
+        if self.file is None:
+            if self.data.size() < 4:
+                raise ValueError( f"invalid packet -- too short: {self.data}" )
+            message_size = self.data.popInt32()
+            if message_size != self.data.size():
+                raise ValueError( f"message size mismatch: {self.data.size()} != {message_size}" )
+            return
+        self.remaining = 4
+        self._ensure( 4 )
+        message_size = self._popHeader()
+        if message_size < 0:
+            raise ValueError( f"invalid message size: {message_size}" )
+        self.remaining = message_size
+
+    def _popHeader(self) -> int:
+        self._ensure( 4 )
+        return ct.pop_header( self.data )
+
+    ## check number of items of container against size of message not consumed yet
+    ## (in file mode items are not read into memory before they are parsed)
+    def _checkItems(self, items_number: int, item_size: int):
+        if self.file is None:
+            ct.check_items( self.data, items_number, item_size )
+            return
+        data_len = self.data.size() + self.remaining
+        if items_number * item_size > data_len:
+            raise ValueError( f"invalid packet -- too short: {data_len} bytes for {items_number} items" )
+
+    def _popBuffer(self, size: int):
+        self._ensure( size )
+        data = self.data
+        if data.size() < size:
+            raise ValueError( f"invalid packet -- too short: {data.size()} < {size}" )
+        start = data.offset
+        data.offset += size
+        return data.view[ start:start + size ]
+
+    ## decode value (with type header) and return pair ( Godot_Type_Id, value )
+    def _popValue(self):
+        self._ensure( 4 )
+        data = self.data
+        if data.size() < 4:
+            raise ValueError( f"invalid packet -- too short: {data}" )
+        start = data.offset
+        if self.file is not None:
+            ## find end of value, read more data if needed
+            while True:
+                try:
+                    ct.skip_type( data )
+                    break
+                except ( ValueError, struct.error ) as exc:
+                    if self.remaining < 1:
+                        if isinstance( exc, struct.error ):
+                            raise ValueError( f"invalid packet -- too short: {exc}" ) from exc
+                        raise
+                    data.offset = start
+                    self._ensure( data.size() + max( data.size(), self.read_size ) )
+                    data  = self.data
+                    start = data.offset
+            end = data.offset
+            data.offset = start
+            data = BytesReader( data.view, start, end, self.codec )
+            self.data.offset = end
+        gd_type_id = data.view[ data.offset ]
+        try:
+            value = ct.deserialize_type( data )
+        except struct.error as exc:
+            raise ValueError( f"invalid packet -- too short: {exc}" ) from exc
+        return ( gd_type_id, value )
+
+    ## make sure that at least 'size' bytes is available in memory (if message is read from file)
+    def _ensure(self, size: int):
+        data = self.data
+        available = data.size()
+        if available >= size or self.file is None or self.remaining < 1:
+            return
+        chunks = [ data.view[ data.offset: ] ]
+        read_size = min( max( size - available, self.read_size ), self.remaining )
+        while read_size > 0:
+            chunk = self.file.read( read_size )
+            if not chunk:
+                ## unexpected end of file
+                self.remaining = 0
+                break
+            chunks.append( chunk )
+            read_size      -= len( chunk )
+            self.remaining -= len( chunk )
+        self.data = BytesReader( b"".join( chunks ), codec=self.codec )
@@ -0,0 +1,124 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+
+from . import commontypes as ct
+from .bytescontainer import BytesReader
+
+
+_LOGGER = logging.getLogger(__name__)
+
+## marks not given default value
+MISSING = object()
+
+
+##
+## Extract value addressed by 'path' without decoding whole message.
+##
+## 'path' is string of components separated by '/' (e.g. "players/3/position")
+## or sequence of components (e.g. [ "players", 3, "position" ]).
+## Component addresses key of Dictionary or index of Array. Not matching items are skipped
+## by its size, only addressed value is decoded.
+##
+## Raises 'KeyError' if path does not exist, unless 'default' is given.
+##
+def extract( message: bytes, path, codec, default=MISSING ):
+    components = parse_path( path )
+    try:
+        return ct.deserialize_custom( message, lambda data: extract_type( data, components ), codec )
+    except KeyError:
+        if default is MISSING:
+            raise
+        return default
+
+
+## extract many values from the same message
+def extract_list( message: bytes, paths, codec, default=MISSING ):
+    return [ extract( message, path, codec, default ) for path in paths ]
+
+
+def parse_path( path ):
+    if isinstance( path, str ):
+        return [ component for component in path.split( "/" ) if component ]
+    return list( path )
+
+
+## decode value addressed by 'components' starting from current position of 'data'
+def extract_type( data: BytesReader, components ):
+    codec = data.codec
+    for component in components:
+        data_len = data.size()
+        if data_len < 4:
+            raise ValueError( f"invalid packet -- too short: {data}" )
+        _, gd_type_id = data.popFlagsType()
+        deserialize_function = codec.deserialization_list[ gd_type_id ]
+
+        if deserialize_function is ct.deserialize_dict:
+            dict_size = ct.pop_header( data ) & 0x7FFFFFFF
+            for _ in range(0, dict_size):
+                key_value = ct.deserialize_type( data )
+                if match_key( key_value, component ):
+                    break
+                ct.skip_type( data )
+            else:
+                raise KeyError( f"key not found: {component}" )
+
+        elif deserialize_function is ct.deserialize_list:
+            list_size = ct.pop_header( data ) & 0x7FFFFFFF
+            index     = get_list_index( component, list_size )
+            for _ in range(0, index):
+                ct.skip_type( data )
+
+        else:
+            raise KeyError( f"value is not a container: {component}" )
+
+    return ct.deserialize_type( data )
+
+
+## check if Dictionary key matches path component
+## 'str' and 'StringName' of the same text are equal, string component matches also integer key
+def match_key( key_value, component ) -> bool:
+    if isinstance( component, ct.StringName ):
+        component = component.value
+    if isinstance( key_value, ct.StringName ):
+        key_value = key_value.value
+    if key_value == component:
+        return True
+    if not isinstance( component, str ):
+        return False
+    if isinstance( key_value, int ) and not isinstance( key_value, bool ):
+        return str( key_value ) == component
+    return False
+
+
+def get_list_index( component, list_size: int ) -> int:
+    try:
+        index = int( component )
+    except ValueError as exc:
+        raise KeyError( f"invalid list index: {component}" ) from exc
+    if index < 0:
+        index += list_size
+    if index < 0 or index >= list_size:
+        raise KeyError( f"list index out of range: {component}" )
+    return index
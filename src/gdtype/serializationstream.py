@@ -0,0 +1,102 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+
+from . import commontypes as ct
+from .bytescontainer import BytesWriter
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+## encodes stream of messages (e.g. to be sent through TCP/IP) using given codec
+##
+## values are encoded back-to-back into one contiguous buffer, so many messages
+## can be sent using single 'sendall()' call, e.g.:
+##     stream.appendValue( "DO_STEP" )
+##     stream.appendValue( [ 1, 2 ] )
+##     sock.sendall( stream.popData() )
+class SerializationStream:
+
+    def __init__(self, codec):
+        self.codec  = codec
+        self.writer = BytesWriter( codec )
+
+    def __len__(self):
+        return self.writer.size()
+
+    def __str__(self):
+        return str( self.writer.getBytes() )
+
+    def size(self):
+        return self.writer.size()
+
+    def clear(self):
+        self.writer = BytesWriter( self.codec )
+
+    ## =====================================================
+
+    ## encode value as message and append it to stream
+    ## returns size of appended message (including header)
+    def appendValue(self, value) -> int:
+        data = self.writer
+        header_offset = data.reserve( 4 )     ## header is set after serialization
+        try:
+            ct.serialize_type( value, data )
+        except BaseException:
+            ## drop partially serialized message
+            del data.data[ header_offset: ]
+            raise
+        data_size = data.size() - header_offset - 4
+        if data_size < 1:
+            del data.data[ header_offset: ]
+            raise ValueError( "failed to serialize: empty output data" )
+        data.setInt32( header_offset, data_size )
+        return data_size + 4
+
+    def appendList(self, values):
+        for item in values:
+            self.appendValue( item )
+
+    ## =====================================================
+
+    ## return encoded messages (at most 'max_size' bytes) and remove them from stream
+    def popData(self, max_size: int = None) -> bytes:
+        data = self.writer.data
+        if max_size is None or max_size >= len( data ):
+            self.clear()
+            return bytes( data )
+        chunk = bytes( data[ :max_size ] )
+        del data[ :max_size ]
+        return chunk
+
+    ## send all encoded messages using single 'sendall()' call
+    ## returns number of sent bytes
+    def sendToSocket(self, sock) -> int:
+        data = self.writer.data
+        if not data:
+            return 0
+        sock.sendall( data )
+        self.clear()
+        return len( data )
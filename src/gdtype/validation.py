@@ -0,0 +1,216 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+import struct
+from dataclasses import dataclass
+from functools import partial
+
+from . import commontypes as ct
+from .bytescontainer import BytesReader
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_INT32_STRUCT  = struct.Struct( "<i" )
+_UINT32_STRUCT = struct.Struct( "<I" )
+
+
+@dataclass
+class ValidationResult():
+    valid: bool = False
+    gd_type: int = -1           ## Godot type ID of top-level value
+    size: int = 0               ## size of message (including header)
+    values: int = 0             ## number of encoded values (including nested ones and keys)
+    depth: int = 0              ## nesting depth of containers
+    error: str = None           ## description of problem
+    offset: int = -1            ## position of invalid value in message
+
+    def __bool__(self):
+        return self.valid
+
+
+##
+## Check structure of message without decoding it.
+##
+## Checks message header, type IDs against configuration of codec, number of items against
+## remaining data, sizes of strings with padding and nesting depth (if 'max_depth' is given).
+## Values are skipped by its size, so Python objects of content are not created
+## (except types without skip function in 'commontypes.SKIP_FUNCTIONS').
+##
+## Returns 'ValidationResult' (evaluates to False if message is invalid).
+##
+def validate( message: bytes, codec, max_depth: int = None ) -> ValidationResult:
+    result = ValidationResult( size=len( message ) )
+    if len( message ) < 8:
+        result.error  = f"invalid packet -- too short: {len( message )} < 8"
+        result.offset = 0
+        return result
+
+    data = BytesReader( message, codec=codec )
+    expected_size = data.popInt32()
+    if expected_size != data.size():
+        result.error  = f"message size mismatch: {data.size()} != {expected_size}"
+        result.offset = 0
+        return result
+
+    value_offset = data.offset
+    try:
+        validate_type( data, result, max_depth )
+        if data.size() > 0:
+            value_offset = data.offset
+            raise ValueError( f"invalid packet -- unexpected data after value: {data.size()} bytes" )
+    except ( ValueError, struct.error ) as exc:
+        if result.offset < 0:
+            result.offset = value_offset
+        result.error = str( exc )
+        return result
+
+    result.valid = True
+    return result
+
+
+## kinds of values in validation table
+_UNSUPPORTED = 0
+_FIXED       = 1                    ## parameter: size of value
+_FLOAT       = 2
+_STRING      = 3
+_PACKED      = 4                    ## parameter: size of item
+_DICT        = 5
+_LIST        = 6
+_OTHER       = 7                    ## parameter: skip function
+
+
+##
+## Prepare table indexed by Godot_Type_Id with pairs ( kind, parameter ) describing
+## how to validate value of given type.
+##
+def prepare_validation_table( codec ):
+    validation_table = []
+    for gd_type_id, deserialize_function in enumerate( codec.deserialization_list ):
+        skip_function = codec.skip_list[ gd_type_id ]
+        if deserialize_function is None:
+            validation_table.append( ( _UNSUPPORTED, None ) )
+        elif deserialize_function is ct.deserialize_dict:
+            validation_table.append( ( _DICT, None ) )
+        elif deserialize_function is ct.deserialize_list:
+            validation_table.append( ( _LIST, None ) )
+        elif deserialize_function in ct.PACKED_ITEM_SIZES:
+            validation_table.append( ( _PACKED, ct.PACKED_ITEM_SIZES[ deserialize_function ] ) )
+        elif isinstance( skip_function, partial ) and skip_function.func is ct.skip_bytes:
+            validation_table.append( ( _FIXED, skip_function.args[0] ) )
+        elif skip_function is ct.skip_float:
+            validation_table.append( ( _FLOAT, None ) )
+        elif skip_function is ct.skip_string:
+            validation_table.append( ( _STRING, None ) )
+        else:
+            validation_table.append( ( _OTHER, skip_function ) )
+    return validation_table
+
+
+## skip value (with nested values) at current position of 'data' checking its structure
+def validate_type( data: BytesReader, result: ValidationResult, max_depth: int = None ):
+    codec = data.codec
+    validation_table = codec.validation_table
+    if validation_table is None:
+        ## kept by codec, so table is released together with it
+        validation_table = prepare_validation_table( codec )
+        codec.validation_table = validation_table
+    if max_depth is None:
+        max_depth = -1
+    unpack_header = _UINT32_STRUCT.unpack_from
+    unpack_int    = _INT32_STRUCT.unpack_from
+    view     = data.view
+    offset   = data.offset
+    view_end = len( view )
+    values   = 0
+
+    stack = []                          ## number of not validated items of containers
+    try:
+        while True:
+            result.offset = offset
+            if offset + 4 > view_end:
+                raise ValueError( f"invalid packet -- too short: {view_end - offset} < 4" )
+            raw_header = unpack_header( view, offset )[0]
+            gd_type_id = raw_header & 0xFF
+            offset += 4
+            values += 1
+            if not stack:
+                result.gd_type = gd_type_id
+            kind, param = validation_table[ gd_type_id ]
+
+            if kind == _FIXED:
+                offset += param
+            elif kind == _STRING or kind == _PACKED:
+                if offset + 4 > view_end:
+                    raise ValueError( f"invalid packet -- too short: {view_end - offset} < 4" )
+                items_number = unpack_int( view, offset )[0]
+                if items_number < 0:
+                    raise ValueError( f"invalid packet -- negative size: {items_number}" )
+                if kind == _STRING:
+                    offset += 4 + items_number + (-items_number % 4)
+                else:
+                    offset += 4 + items_number * param
+            elif kind == _DICT or kind == _LIST:
+                if offset + 4 > view_end:
+                    raise ValueError( f"invalid packet -- too short: {view_end - offset} < 4" )
+                items_number = unpack_int( view, offset )[0] & 0x7FFFFFFF
+                offset += 4
+                if kind == _DICT:
+                    items_number *= 2
+                ## each item takes at least 4 bytes
+                if items_number * 4 > view_end - offset:
+                    raise ValueError( f"invalid packet -- too many items: {items_number} "
+                                      f"for {view_end - offset} bytes" )
+                ## empty container counts to nesting depth as well
+                if len( stack ) == max_depth:
+                    raise ValueError( f"invalid packet -- nesting depth exceeds {max_depth}" )
+                result.depth = max( result.depth, len( stack ) + 1 )
+                if items_number > 0:
+                    stack.append( items_number )
+                    continue
+            elif kind == _FLOAT:
+                data_flags = (raw_header >> 16) & 0xFF
+                offset += 8 if data_flags & 1 == 1 else 4
+            elif kind == _OTHER:
+                data.offset = offset
+                param( (raw_header >> 16) & 0xFF, data )
+                offset = data.offset
+            else:
+                raise ValueError( f"unsupported Godot type {gd_type_id}" )
+
+            if offset > view_end:
+                raise ValueError( f"invalid packet -- too short: value exceeds message by {offset - view_end} bytes" )
+
+            ## value validated -- close finished containers
+            while stack:
+                stack[-1] -= 1
+                if stack[-1] > 0:
+                    break
+                stack.pop()
+            if not stack:
+                break
+    finally:
+        result.values = values
+        data.offset   = offset
+    result.offset = -1
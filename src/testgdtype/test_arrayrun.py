@@ -0,0 +1,82 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import struct
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype.commontypes import Vector2, Vector2i, Rect2, Vector3, Vector3i, Transform2D, Vector4i, Quaternion, \
+    AABB, Basis, Transform3D, Projection, Color, StringName
+
+
+class ArrayRunTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_homogeneous(self):
+        values_list = [ [ None ] * 5, [ True, False ] * 5, list( range( -50, 50 ) ), [ 0.5 * i for i in range( 100 ) ],
+                        [ Vector2( [1.0, float(i)] ) for i in range( 20 ) ],
+                        [ Vector3( [1.0, 2.0, float(i)] ) for i in range( 20 ) ],
+                        [ Rect2( [1.0, 2.0, 3.0, 4.0] ) ] * 3, [ Transform2D( [1.0] * 6 ) ] * 3,
+                        [ Quaternion( [1.0] * 4 ) ] * 3, [ AABB( [1.0] * 6 ) ] * 3, [ Basis( [1.0] * 9 ) ] * 3,
+                        [ Transform3D( [1.0] * 12 ) ] * 3, [ Color( [0.5] * 4 ) ] * 3 ]
+        for value in values_list:
+            message = binaryapiv3.serialize( value )
+            self.assertEqual( binaryapiv3.deserialize( message ), value )
+            self.assertEqual( binaryapiv3.deserialize_trusted( message ), value )
+        values_list += [ [ Vector2i( [1, i] ) for i in range( 20 ) ], [ Vector3i( [1, 2, i] ) for i in range( 20 ) ],
+                         [ Vector4i( [1] * 4 ) ] * 3,
+                         [ Projection( [1.0] * 16 ) ] * 3 ]
+        for value in values_list:
+            message = binaryapiv4.serialize( value )
+            self.assertEqual( binaryapiv4.deserialize( message ), value )
+            self.assertEqual( binaryapiv4.deserialize_trusted( message ), value )
+
+    def test_mixed(self):
+        value = [ 1, 2, 3, 1.5, 2.5, "abc", 4, Vector3( [1.0, 2.0, 3.0] ), Vector3( [4.0, 5.0, 6.0] ), 5, 6,
+                  [ 7, 8 ], None, None, StringName( "x" ), 9, 10 ]
+        message = binaryapiv4.serialize( value )
+        self.assertEqual( binaryapiv4.deserialize( message ), value )
+        self.assertEqual( binaryapiv4.deserialize_trusted( message ), value )
+
+    def test_float32(self):
+        ## Godot encodes floats of Array as 32 bit values
+        items  = [ struct.pack( "<If", 3, 0.5 * i ) for i in range( 10 ) ]
+        data   = struct.pack( "<II", 28, 10 ) + b"".join( items )
+        message = struct.pack( "<I", len( data ) ) + data
+        self.assertEqual( binaryapiv4.deserialize( message ), [ 0.5 * i for i in range( 10 ) ] )
+
+    def test_truncated(self):
+        message = binaryapiv4.serialize( [ Vector3( [1.0, 2.0, 3.0] ) ] * 10 )
+        for size in range( 12, len( message ), 4 ):
+            truncated = struct.pack( "<I", size - 4 ) + message[ 4:size ]
+            with self.assertRaises( ValueError ):
+                binaryapiv4.deserialize( truncated )
+            with self.assertRaises( ValueError ):
+                binaryapiv4.deserialize_trusted( truncated )
@@ -0,0 +1,194 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import unittest
+import asyncio
+
+from gdtype.asyncstream import MessageProtocol, MessageWriter, iter_messages
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype.commontypes import DecodeLimits
+
+
+class FakeTransport:
+
+    def __init__(self):
+        self.paused = False
+        self.closed = False
+        self.data   = []
+
+    def pause_reading(self):
+        self.paused = True
+
+    def resume_reading(self):
+        self.paused = False
+
+    def write(self, data):
+        self.data.append( data )
+
+    def close(self):
+        self.closed = True
+
+
+def feed_protocol( protocol, data ):
+    buffer = protocol.get_buffer( -1 )
+    buffer[ :len( data ) ] = data
+    protocol.buffer_updated( len( data ) )
+
+
+class AsyncStreamTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_iter_messages(self):
+        values = [ "DO_STEP", [ 1, 2 ], { "aaa": 1.5 } ] * 100
+
+        async def handle_client( reader, writer ):
+            message_writer = MessageWriter( writer )
+            async for message in iter_messages( reader ):
+                message_writer.write( message )
+            await message_writer.drain()
+            message_writer.close()
+
+        async def run():
+            server = await asyncio.start_server( handle_client, "127.0.0.1", 0 )
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reader, writer = await asyncio.open_connection( "127.0.0.1", port )
+                message_writer = MessageWriter( writer )
+                message_writer.writeList( values )
+                await message_writer.drain()
+                writer.write_eof()
+                received = [ message async for message in iter_messages( reader ) ]
+                writer.close()
+                await writer.wait_closed()
+            return received
+
+        received = asyncio.run( run() )
+        self.assertEqual( received, values )
+
+    def test_protocol(self):
+        values = [ "DO_STEP", 123, [ 1.5, None ] ] * 100
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            protocol = MessageProtocol( binaryapiv3.CODEC, max_buffered=64 )
+
+            async def handle_client( _reader, writer ):
+                message_writer = MessageWriter( writer, binaryapiv3.CODEC )
+                message_writer.writeList( values )
+                await message_writer.drain()
+                message_writer.close()
+
+            server = await asyncio.start_server( handle_client, "127.0.0.1", 0 )
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                transport, _ = await loop.create_connection( lambda: protocol, "127.0.0.1", port )
+                received = []
+                async for message in protocol:
+                    received.append( message )
+                    await asyncio.sleep( 0 )
+                transport.close()
+            return received
+
+        received = asyncio.run( run() )
+        self.assertEqual( received, values )
+
+    def test_protocol_backpressure(self):
+        message = binaryapiv4.serialize( "DO_STEP" )
+        protocol = MessageProtocol( max_buffered=2 * len( message ) )
+        transport = FakeTransport()
+        protocol.connection_made( transport )
+
+        feed_protocol( protocol, message * 2 )
+        self.assertFalse( transport.paused )
+        feed_protocol( protocol, message )
+        self.assertTrue( transport.paused )
+
+        received = asyncio.run( protocol.receive() )
+        self.assertEqual( received, "DO_STEP" )
+        self.assertFalse( transport.paused )
+
+    def test_protocol_large_message(self):
+        ## message of size up to limit is received in parts
+        message = binaryapiv4.serialize( "a" * 100 )
+        protocol = MessageProtocol( max_buffered=len( message ) )
+        transport = FakeTransport()
+        protocol.connection_made( transport )
+        feed_protocol( protocol, message[ :50 ] )
+        self.assertFalse( transport.paused )
+        feed_protocol( protocol, message[ 50: ] )
+        protocol.eof_received()
+        self.assertEqual( asyncio.run( protocol.receive() ), "a" * 100 )
+        with self.assertRaises( EOFError ):
+            asyncio.run( protocol.receive() )
+
+    def test_protocol_message_over_limit(self):
+        ## bigger message is rejected as soon as its header arrives
+        message = binaryapiv4.serialize( "a" * 100 )
+        protocol = MessageProtocol( max_buffered=16 )
+        transport = FakeTransport()
+        protocol.connection_made( transport )
+        feed_protocol( protocol, message[ :8 ] )
+        self.assertTrue( transport.closed )
+        with self.assertRaises( ValueError ):
+            asyncio.run( protocol.receive() )
+
+    def test_protocol_decode_limits(self):
+        ## limits violation is raised by 'receive()' instead of protocol callback
+        small   = binaryapiv4.serialize( "a" )
+        message = binaryapiv4.serialize( "a" * 100 )
+        protocol = MessageProtocol( limits=DecodeLimits( max_message_size=len( message ) - 1 ) )
+        transport = FakeTransport()
+        protocol.connection_made( transport )
+        feed_protocol( protocol, small + message[ :8 ] )
+        self.assertFalse( transport.closed )
+        self.assertEqual( asyncio.run( protocol.receive() ), "a" )
+        self.assertTrue( transport.closed )
+        with self.assertRaises( ValueError ):
+            asyncio.run( protocol.receive() )
+        protocol = MessageProtocol( limits=DecodeLimits( max_message_size=len( message ) - 1 ) )
+        protocol.connection_made( FakeTransport() )
+        feed_protocol( protocol, message[ :8 ] )
+        with self.assertRaises( ValueError ):
+            asyncio.run( protocol.receive() )
+
+    def test_writer_batching(self):
+        transport = FakeTransport()
+
+        async def run():
+            writer = MessageWriter( transport )
+            writer.write( 1 )
+            writer.write( "aaa" )
+            self.assertEqual( transport.data, [] )
+            await asyncio.sleep( 0 )
+            writer.write( 2 )
+            await writer.drain()
+
+        asyncio.run( run() )
+        expected = [ binaryapiv4.serialize( 1 ) + binaryapiv4.serialize( "aaa" ), binaryapiv4.serialize( 2 ) ]
+        self.assertEqual( transport.data, expected )
@@ -22,12 +22,15 @@
 #
 
 import unittest
+import struct
 
 import numpy
 
-from gdtype.binaryapiv4 import deserialize, serialize
-from gdtype.commontypes import Vector3, deserialize_custom, deserialize_type, serialize_custom, serialize_type,\
-    Int32Array, Int64Array, Vector2Array, Vector3Array
+from gdtype.binaryapiv4 import deserialize, serialize, serialize_into, encoded_size, deserialize_iterative, \
+    deserialize_lazy
+from gdtype.deserializationstreamv4 import DeserializationStreamV4
+from gdtype.commontypes import Vector3, NodePath, deserialize_custom, deserialize_type, serialize_custom, serialize_type, \
+    Int32Array, Int64Array, Float32Array, Vector2Array, Vector3Array, ColorArray, StringArray
 
 
 #TODO: add tests for invalid input (check exceptions)
@@ -233,6 +236,59 @@ class DeserializeTest(unittest.TestCase):
         self.assertAlmostEqual( data_list[0][0], 0.5, 4 ) 
         self.assertAlmostEqual( data_list[1][2], -1.1, 4 ) 
 
+    def test_Float32Array_bulk(self):
+        raw_bytes  = serialize( Float32Array( [ float(i) for i in range(1000) ] ) )
+        data_value = deserialize( raw_bytes )
+        self.assertEqual( type(data_value), Float32Array )
+        self.assertEqual( data_value.values, [ float(i) for i in range(1000) ] )
+
+    def test_Int32Array_too_short(self):
+        raw_bytes = b'\x10\x00\x00\x00\x1e\x00\x00\x00\x03\x00\x00\x00\x1f\x00\x00\x00\xe0\xff\xff\xff'
+        with self.assertRaises( ValueError ):
+            deserialize( raw_bytes )
+
+    def test_StringArray_too_short(self):
+        ## declares 2 strings, contains only one
+        raw_bytes = b'\x10\x00\x00\x00"\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00a\x00\x00\x00'
+        with self.assertRaises( ValueError ):
+            deserialize( raw_bytes )
+        with self.assertRaises( ValueError ):
+            deserialize_iterative( raw_bytes )
+        with self.assertRaises( ValueError ):
+            deserialize_lazy( raw_bytes )
+        stream = DeserializationStreamV4( raw_bytes )
+        with self.assertRaises( ValueError ):
+            stream.receive()
+
+    def test_StringArray_hostile(self):
+        message = serialize( { "ab": StringArray( [ "x", "yz" ] ), "c": [ "d", StringArray( [ "efgh" ] ) ] } )
+        ## truncated message
+        for size in range( 8, len( message ) ):
+            raw_bytes = struct.pack( "<I", size - 4 ) + message[ 4:size ]
+            with self.assertRaises( ValueError ):
+                deserialize( raw_bytes )
+        ## increased counts of items (offsets 8, 28, 64, 84) and sizes of strings
+        for offset, added in ( ( 8, 4 ), ( 28, 4 ), ( 64, 4 ), ( 84, 4 ),
+                               ( 16, 1000 ), ( 32, 1000 ), ( 40, 1000 ), ( 52, 1000 ), ( 72, 1000 ), ( 88, 1000 ) ):
+            raw_bytes = bytearray( message )
+            value = struct.unpack_from( "<i", raw_bytes, offset )[0]
+            struct.pack_into( "<i", raw_bytes, offset, value + added )
+            with self.assertRaises( ValueError ):
+                deserialize( bytes( raw_bytes ) )
+
+    def test_NodePath_too_short(self):
+        message = serialize( [ NodePath( "abc/def" ), NodePath( "x" ) ] )
+        for size in range( 8, len( message ) - 3 ):
+            raw_bytes = struct.pack( "<I", size - 4 ) + message[ 4:size ]
+            with self.assertRaises( ValueError ):
+                deserialize( raw_bytes )
+
+    def test_ColorArray(self):
+        raw_bytes = serialize( ColorArray( [ (0.5, 0.25, 1.0, 0.0), (1.0, 1.0, 0.5, 0.5) ] ) )
+        data_value = deserialize( raw_bytes )
+        self.assertEqual( type(data_value), ColorArray )
+        self.assertEqual( data_value.items, [ (0.5, 0.25, 1.0, 0.0), (1.0, 1.0, 0.5, 0.5) ] )
+
 
 ##
 class SerializeTest(unittest.TestCase):
@@ -370,3 +426,45 @@ class SerializeTest(unittest.TestCase):
         data_value = Vector3Array.fromNumpy( data_value )
         data = serialize( data_value )
         self.assertEqual( data, raw_bytes )
+
+    def test_Vector3Array_invalid_item(self):
+        data_value = Vector3Array([[0.5, 0.0, 1.0], [0.6, 0.1]])
+        with self.assertRaises( ValueError ):
+            serialize( data_value )
+
+
+##
+class SerializeIntoTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_encoded_size(self):
+        data_value = { "aaa": [ 1, 2.5, "DO_STEP", Vector3( [1.0, 2.0, 3.0] ) ], 5: Int32Array([31, -32, 33]), "": None }
+        data = serialize( data_value )
+        self.assertEqual( encoded_size( data_value ), len( data ) )
+
+    def test_serialize_into(self):
+        data_value = [ "REG_RESP", 12, Vector3( [11.1, 22.2, 33.3] ) ]
+        raw_bytes  = serialize( data_value )
+        buffer = bytearray( 64 )
+        offset = serialize_into( data_value, buffer, 3 )
+        self.assertEqual( offset, 3 + len( raw_bytes ) )
+        self.assertEqual( bytes( buffer[ 3:offset ] ), raw_bytes )
+        self.assertEqual( buffer[ :3 ], bytearray( 3 ) )
+
+    def test_serialize_into_multiple(self):
+        buffer = memoryview( bytearray( 64 ) )
+        offset = serialize_into( "aaa2", buffer, 0 )
+        offset = serialize_into( 123, buffer, offset )
+        self.assertEqual( bytes( buffer[ :offset ] ), serialize( "aaa2" ) + serialize( 123 ) )
+
+    def test_serialize_into_too_small(self):
+        buffer = bytearray( 10 )
+        with self.assertRaises( ValueError ):
+            serialize_into( "DO_STEP", buffer, 0 )
+        self.assertEqual( buffer, bytearray( 10 ) )
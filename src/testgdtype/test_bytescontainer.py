@@ -0,0 +1,124 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+
+from gdtype.bytescontainer import BytesReader, BytesWriter
+from gdtype import binaryapiv4
+
+
+class BytesReaderTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_popInt32(self):
+        raw_bytes = b'{\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x80'
+        data = BytesReader( raw_bytes )
+        self.assertEqual( data.popInt32(), 123 )
+        self.assertEqual( data.popInt32(), -1 )
+        self.assertEqual( data.popInt32(), -2147483648 )
+        self.assertEqual( data.size(), 0 )
+
+    def test_popInt32_too_short(self):
+        data = BytesReader( b'{\x00\x00' )
+        with self.assertRaises( ValueError ):
+            data.popInt32()
+        with self.assertRaises( ValueError ):
+            data.popFlagsType()
+        with self.assertRaises( ValueError ):
+            data.popFloat64()
+
+    def test_popString_padding(self):
+        raw_bytes = b'\x07\x00\x00\x00DO_STEP\x00\x01\x00\x00\x00'
+        data = BytesReader( raw_bytes )
+        self.assertEqual( data.popString(), "DO_STEP" )
+        self.assertEqual( data.size(), 4 )
+        self.assertEqual( data.popInt32(), 1 )
+
+    def test_popFlagsType(self):
+        raw_bytes = b'\x03\x00\x01\x00'
+        data = BytesReader( raw_bytes )
+        self.assertEqual( data.popFlagsType(), (1, 3) )
+
+    def test_pop(self):
+        raw_bytes = b'\x01\x02\x03\x04\x05'
+        data = BytesReader( raw_bytes )
+        self.assertEqual( data.pop( 2 ), b'\x01\x02' )
+        self.assertEqual( data.pop( 10 ), b'\x03\x04\x05' )
+        self.assertEqual( data.size(), 0 )
+
+    def test_window(self):
+        raw_bytes = b'\x00\x00\x00\x00{\x00\x00\x00\x00\x00\x00\x00'
+        data = BytesReader( raw_bytes, 4, 8 )
+        self.assertEqual( len( data ), 4 )
+        self.assertEqual( data.popInt32(), 123 )
+        self.assertEqual( data.size(), 0 )
+
+    def test_no_copy(self):
+        # pylint: disable=C0301
+        raw_bytes = b'\x03\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00'
+        data = BytesReader( raw_bytes )
+        data_value = binaryapiv4.ct.deserialize_list( 0, data )
+        self.assertEqual( data_value, [1, 2, 3] )
+        self.assertIs( data.view.obj, raw_bytes )
+        self.assertEqual( data.size(), 0 )
+
+
+class BytesWriterTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_pushInt32(self):
+        data = BytesWriter()
+        data.pushInt32( 123 )
+        data.pushInt32( -1 )
+        data.pushInt32( -2147483648 )
+        self.assertEqual( data.getBytes(), b'{\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x80' )
+
+    def test_pushInt64(self):
+        data = BytesWriter()
+        data.pushInt64( -32 )
+        self.assertEqual( data.getBytes(), b'\xe0\xff\xff\xff\xff\xff\xff\xff' )
+
+    def test_pushString_padding(self):
+        data = BytesWriter()
+        data.pushString( "DO_STEP" )
+        self.assertEqual( data.getBytes(), b'\x07\x00\x00\x00DO_STEP\x00' )
+
+    def test_reserve(self):
+        data = BytesWriter()
+        header_offset = data.reserve( 4 )
+        data.pushFlagsType( 0, 2 )
+        data.pushInt32( 123 )
+        data.setInt32( header_offset, data.size() - 4 )
+        self.assertEqual( data.getBytes(), b'\x08\x00\x00\x00\x02\x00\x00\x00{\x00\x00\x00' )
@@ -0,0 +1,148 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import threading
+from collections import OrderedDict
+from enum import IntEnum
+
+import numpy
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype import commontypes as ct
+from gdtype.codec import Codec
+from gdtype.commontypes import Vector3, Int32Array
+
+
+class SampleEnum( IntEnum ):
+    FIRST  = 1
+    SECOND = 2
+
+
+class CacheEnum( IntEnum ):
+    FIRST  = 1
+
+
+class SampleVector3( Vector3 ):
+    pass
+
+
+class CodecTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_both_versions(self):
+        data_value = { "aaa": [ 1, Vector3( [1.0, 2.0, 3.0] ) ] }
+        raw_v4 = binaryapiv4.serialize( data_value )
+        raw_v3 = binaryapiv3.serialize( data_value )
+        self.assertNotEqual( raw_v4, raw_v3 )
+        self.assertEqual( binaryapiv4.deserialize( raw_v4 ), data_value )
+        self.assertEqual( binaryapiv3.deserialize( raw_v3 ), data_value )
+
+    def test_list_type_id(self):
+        raw_v4 = b'\x08\x00\x00\x00\x1c\x00\x00\x00\x00\x00\x00\x00'
+        raw_v3 = b'\x08\x00\x00\x00\x13\x00\x00\x00\x00\x00\x00\x00'
+        self.assertEqual( binaryapiv4.CODEC.deserialize( raw_v4 ), [] )
+        self.assertEqual( binaryapiv3.CODEC.deserialize( raw_v3 ), [] )
+        with self.assertRaises( ValueError ):
+            binaryapiv3.CODEC.deserialize( raw_v4 )
+
+    def test_threads(self):
+        results = []
+
+        def worker( api ):
+            data_value = [ "REG_RESP", { 5: "bbc" }, Vector3( [1.0, 2.0, 3.0] ) ]
+            for _ in range( 200 ):
+                if api.deserialize( api.serialize( data_value ) ) != data_value:
+                    results.append( False )
+                    return
+            results.append( True )
+
+        threads = [ threading.Thread( target=worker, args=( api, ) ) for api in [ binaryapiv3, binaryapiv4 ] * 2 ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual( results, [ True ] * 4 )
+
+    def test_custom_config(self):
+        config_list = [ config for config in binaryapiv4.CONFIG_LIST if config[1] is not Int32Array ]
+        config_list.append( ( binaryapiv4.GodotType.PACKEDINT32ARRAY.value, Int32Array,
+                              ct.deserialize_Int32Array_numpy, ct.serialize_Int32Array ) )
+        codec = Codec( config_list )
+        raw_bytes = binaryapiv4.serialize( [ Int32Array( [31, -32, 33] ) ] )
+        data_value = codec.deserialize( raw_bytes )
+        self.assertEqual( data_value[0].values.tolist(), [31, -32, 33] )
+        self.assertEqual( type( binaryapiv4.deserialize( raw_bytes )[0].values ), list )
+
+    def test_deserialization_stream(self):
+        raw_bytes = binaryapiv3.serialize( "aaa" ) + binaryapiv3.serialize( [ 1 ] )
+        stream = binaryapiv3.CODEC.create_deserialization_stream( raw_bytes )
+        self.assertEqual( stream.receiveList(), [ "aaa", [ 1 ] ] )
+
+    def test_serialization_stream(self):
+        stream = binaryapiv3.CODEC.create_serialization_stream()
+        stream.appendList( [ "aaa", [ 1 ] ] )
+        raw_bytes = binaryapiv3.serialize( "aaa" ) + binaryapiv3.serialize( [ 1 ] )
+        self.assertEqual( stream.popData(), raw_bytes )
+
+    def test_dispatch_tables(self):
+        codec = binaryapiv4.CODEC
+        self.assertEqual( len( codec.deserialization_list ), 256 )
+        self.assertIs( codec.deserialization_list[ binaryapiv4.GodotType.LIST.value ], ct.deserialize_list )
+        self.assertIsNone( codec.deserialization_list[ 200 ] )
+        with self.assertRaises( ValueError ):
+            ct.prepare_dispatch_tables( { 300: ct.deserialize_none }, {} )
+
+    def test_serialize_subclass(self):
+        self.assertEqual( binaryapiv4.serialize( SampleEnum.SECOND ), binaryapiv4.serialize( 2 ) )
+        self.assertEqual( binaryapiv4.serialize( OrderedDict( [ ( "a", 1 ) ] ) ), binaryapiv4.serialize( { "a": 1 } ) )
+        self.assertEqual( binaryapiv4.serialize( SampleVector3( [1.0, 2.0, 3.0] ) ),
+                          binaryapiv4.serialize( Vector3( [1.0, 2.0, 3.0] ) ) )
+
+    def test_serialize_numpy_scalar(self):
+        self.assertEqual( binaryapiv4.serialize( numpy.int64( -9 ) ), binaryapiv4.serialize( -9 ) )
+        self.assertEqual( binaryapiv4.serialize( numpy.float32( 0.5 ) ), binaryapiv4.serialize( 0.5 ) )
+        self.assertEqual( binaryapiv4.serialize( numpy.float64( 0.5 ) ), binaryapiv4.serialize( 0.5 ) )
+
+    def test_serialize_resolved_cache(self):
+        codec = Codec( binaryapiv4.CONFIG_LIST )
+        self.assertNotIn( CacheEnum, codec.serializers )
+        codec.serialize( [ CacheEnum.FIRST ] )
+        self.assertIs( codec.serializers[ CacheEnum ], codec.serializers[ int ] )
+
+    def test_shared_tables(self):
+        codec = Codec( binaryapiv4.CONFIG_LIST )
+        self.assertIs( codec.deserialization_list, binaryapiv4.CODEC.deserialization_list )
+
+    def test_serialize_unsupported(self):
+        with self.assertRaises( ValueError ):
+            binaryapiv4.serialize( object() )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.serialize( ( 1, 2 ) )
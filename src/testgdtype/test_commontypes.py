@@ -22,8 +22,16 @@
 #
 
 import unittest
+import copy
+import pickle
 
-from gdtype.commontypes import Transform3D
+import numpy
+
+from gdtype.bytescontainer import BytesReader, BytesWriter
+from gdtype.commontypes import Vector2, Vector3, Vector4i, Quaternion, Basis, Color, Transform3D, \
+    Int32Array, Float32Array, Vector3Array, \
+    deserialize_Int32Array_numpy, deserialize_Float32Array_numpy, serialize_Float32Array, \
+    deserialize_Vector3Array_numpy, serialize_Vector3Array
 
 
 #TODO: add tests for invalid input (check exceptions)
@@ -52,3 +60,131 @@ class Transform3DTest(unittest.TestCase):
 
         self.assertEqual( data[2], 3 )
         self.assertEqual( data.get(0, 2), 3 )
+
+
+class MathTypesTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_slots(self):
+        data = Vector3( [1.0, 2.0, 3.0] )
+        self.assertFalse( hasattr( data, "__dict__" ) )
+        with self.assertRaises( AttributeError ):
+            data.w = 4.0
+        self.assertFalse( hasattr( Transform3D(), "__dict__" ) )
+
+    def test_defaults(self):
+        self.assertEqual( Vector2().getDataArray(), [ 0.0, 0.0 ] )
+        self.assertEqual( Vector4i().getDataArray(), [ 0, 0, 0, 0 ] )
+        self.assertEqual( Quaternion().getDataArray(), [ 0.0, 0.0, 0.0, 1.0 ] )
+        self.assertEqual( Basis().getDataArray(), [ 0.0 ] * 9 )
+
+    def test_fromComponents(self):
+        self.assertEqual( Vector3.fromComponents( 1.0, 2.0, 3.0 ), Vector3( [1.0, 2.0, 3.0] ) )
+        self.assertEqual( Color.fromComponents( 0.1, 0.2, 0.3, 0.4 ), Color( [0.1, 0.2, 0.3, 0.4] ) )
+        self.assertEqual( Transform3D.fromComponents( *range( 12 ) ), Transform3D( list( range( 12 ) ) ) )
+        with self.assertRaises( ValueError ):
+            Transform3D.fromComponents( 1, 2, 3 )
+
+    def test_copy(self):
+        data = Vector3( [1.0, 2.0, 3.0] )
+        self.assertEqual( copy.copy( data ), data )
+        self.assertEqual( pickle.loads( pickle.dumps( data ) ), data )
+        self.assertEqual( pickle.loads( pickle.dumps( Basis( [1.0] * 9 ) ) ), Basis( [1.0] * 9 ) )
+        self.assertEqual( str( data ), "Vector3(x=1.0, y=2.0, z=3.0)" )
+
+
+class NumpyArrayTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_deserialize_Int32Array_numpy(self):
+        raw_bytes = b'\x03\x00\x00\x00\x1f\x00\x00\x00\xe0\xff\xff\xff\x21\x00\x00\x00'
+        data = BytesReader( raw_bytes )
+        data_value = deserialize_Int32Array_numpy( 0, data )
+        self.assertEqual( type(data_value), Int32Array )
+        self.assertEqual( type(data_value.values), numpy.ndarray )
+        self.assertEqual( data_value.values.dtype, numpy.int32 )
+        self.assertEqual( data_value.values.tolist(), [31, -32, 33] )
+        self.assertEqual( data.size(), 0 )
+        ## shares memory with immutable message
+        self.assertFalse( data_value.values.flags.writeable )
+        self.assertIs( data_value.toNumpy(), data_value.values )
+
+    def test_equal_numpy(self):
+        self.assertEqual( Int32Array.fromNumpy( numpy.arange( 5 ) ), Int32Array.fromNumpy( numpy.arange( 5 ) ) )
+        self.assertEqual( Int32Array( [ 0, 1, 2, 3, 4 ] ), Int32Array.fromNumpy( numpy.arange( 5 ) ) )
+        self.assertNotEqual( Int32Array( [ 0, 1, 2 ] ), Int32Array.fromNumpy( numpy.arange( 5 ) ) )
+        self.assertNotEqual( Float32Array.fromNumpy( numpy.arange( 3 ) ), Float32Array( [ 0.0, 1.0, 5.0 ] ) )
+        self.assertEqual( Int32Array(), Int32Array.fromNumpy( numpy.arange( 0 ) ) )
+
+    def test_equal_Vector3Array_numpy(self):
+        data_array = numpy.array( [ [1.0, 2.0, 3.0], [4.0, 5.0, 6.0] ] )
+        self.assertEqual( Vector3Array.fromNumpy( data_array ), Vector3Array.fromNumpy( data_array ) )
+        self.assertEqual( Vector3Array( [ (1.0, 2.0, 3.0), (4.0, 5.0, 6.0) ] ), Vector3Array.fromNumpy( data_array ) )
+        self.assertNotEqual( Vector3Array( [ (1.0, 2.0, 3.0) ] ), Vector3Array.fromNumpy( data_array ) )
+        self.assertEqual( Vector3Array(), Vector3Array.fromNumpy( numpy.zeros( (0, 3) ) ) )
+        self.assertEqual( Vector3Array.fromNumpy( data_array )[0], (1.0, 2.0, 3.0) )
+        self.assertEqual( list( Vector3Array.fromNumpy( data_array ) ), [ (1.0, 2.0, 3.0), (4.0, 5.0, 6.0) ] )
+
+    def test_deserialize_Float32Array_numpy_copy(self):
+        raw_bytes = bytearray( b'\x02\x00\x00\x00\x00\x00\x00\x3f\x00\x00\x80\x3f' )
+        data_value = deserialize_Float32Array_numpy( 0, BytesReader( raw_bytes ) )
+        raw_bytes[ 4:8 ] = bytes( 4 )
+        self.assertEqual( data_value.values.tolist(), [0.5, 1.0] )
+
+    def test_deserialize_numpy_too_short(self):
+        raw_bytes = b'\x03\x00\x00\x00\x1f\x00\x00\x00'
+        with self.assertRaises( ValueError ):
+            deserialize_Int32Array_numpy( 0, BytesReader( raw_bytes ) )
+
+    def test_fromNumpy(self):
+        data_array = numpy.array( [0.5, 1.0], dtype=numpy.float32 )
+        data_value = Float32Array.fromNumpy( data_array )
+        self.assertIs( data_value.values, data_array )
+        self.assertIs( data_value.toNumpy(), data_array )
+        data_value.append( 2.0 )
+        self.assertEqual( data_value.values.dtype, numpy.float32 )
+        self.assertEqual( data_value.values.tolist(), [0.5, 1.0, 2.0] )
+
+    def test_serialize_numpy(self):
+        data_list  = BytesWriter()
+        serialize_Float32Array( 32, Float32Array( [0.5, 1.0] ), data_list )
+        data_numpy = BytesWriter()
+        serialize_Float32Array( 32, Float32Array.fromNumpy( numpy.array( [0.5, 1.0] ) ), data_numpy )
+        self.assertEqual( data_numpy.getBytes(), data_list.getBytes() )
+
+    def test_deserialize_Vector3Array_numpy(self):
+        # pylint: disable=C0301
+        raw_bytes = b'\x02\x00\x00\x00\x00\x00\x00\x3f\x00\x00\x00\x00\x00\x00\x80\x3f\x9a\x99\x19\x3f\xcd\xcc\xcc\x3d\xcd\xcc\x8c\xbf'
+        data_value = deserialize_Vector3Array_numpy( 0, BytesReader( raw_bytes ) )
+        self.assertEqual( type(data_value), Vector3Array )
+        self.assertEqual( data_value.items.shape, (2, 3) )
+        self.assertEqual( data_value.items.dtype, numpy.float32 )
+        self.assertEqual( len( data_value ), 2 )
+        self.assertAlmostEqual( data_value[0][0], 0.5, 4 )
+        self.assertAlmostEqual( data_value[1][2], -1.1, 4 )
+
+        data_value.append( 1.0, 2.0, 3.0 )
+        self.assertEqual( len( data_value ), 3 )
+        self.assertEqual( data_value[2], (1.0, 2.0, 3.0) )
+        self.assertEqual( data_value[1:], [ data_value[1], (1.0, 2.0, 3.0) ] )
+
+        data = BytesWriter()
+        serialize_Vector3Array( 36, deserialize_Vector3Array_numpy( 0, BytesReader( raw_bytes ) ), data )
+        self.assertEqual( data.getBytes(), b'\x24\x00\x00\x00' + raw_bytes )
+
+    def test_serialize_Vector3Array_invalid_shape(self):
+        data_value = Vector3Array( numpy.zeros( (2, 2), dtype=numpy.float32 ) )
+        with self.assertRaises( ValueError ):
+            serialize_Vector3Array( 36, data_value, BytesWriter() )
@@ -0,0 +1,109 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import unittest
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype.commontypes import DecodeLimits, Int32Array, StringArray
+from gdtype.deserializationstreamv4 import DeserializationStreamV4
+
+
+class DecodeLimitsTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_no_limits(self):
+        value = { "a": [ 1, 2, "abc" ], "b": Int32Array( [ 1, 2, 3 ] ) }
+        message = binaryapiv4.serialize( value )
+        self.assertEqual( binaryapiv4.deserialize( message, DecodeLimits() ), value )
+
+    def test_count_exceeds_data(self):
+        ## 12-byte packets declaring huge number of items
+        for type_id in [ 27, 28, 29, 30, 31, 34, 37 ]:
+            message = bytes( [ 8, 0, 0, 0, type_id, 0, 0, 0, 0xff, 0xff, 0xff, 0x7f ] )
+            with self.assertRaises( ValueError ):
+                binaryapiv4.deserialize( message )
+            with self.assertRaises( ValueError ):
+                binaryapiv4.deserialize_iterative( message )
+
+    def test_string_exceeds_data(self):
+        message = bytes( [ 12, 0, 0, 0, 4, 0, 0, 0, 0xff, 0xff, 0xff, 0x7f, 0x61, 0x61, 0x61, 0x61 ] )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize( message )
+
+    def test_max_elements(self):
+        message = binaryapiv4.serialize( [ [ 1, 2 ], Int32Array( [ 1, 2, 3 ] ) ] )
+        self.assertEqual( len( binaryapiv4.deserialize( message, DecodeLimits( max_elements=7 ) ) ), 2 )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize( message, DecodeLimits( max_elements=6 ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize_iterative( message, limits=DecodeLimits( max_elements=3 ) )
+
+    def test_max_string_bytes(self):
+        message = binaryapiv3.serialize( { "abc": StringArray( [ "x", "abcdef" ] ) } )
+        binaryapiv3.deserialize( message, DecodeLimits( max_string_bytes=6 ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv3.deserialize( message, DecodeLimits( max_string_bytes=5 ) )
+
+    def test_max_depth(self):
+        message = binaryapiv4.serialize( [ { "a": [ 1 ] } ] )
+        binaryapiv4.deserialize( message, DecodeLimits( max_depth=3 ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize( message, DecodeLimits( max_depth=2 ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize_iterative( message, limits=DecodeLimits( max_depth=2 ) )
+
+    def test_max_depth_empty(self):
+        ## empty container counts to nesting depth
+        message = binaryapiv4.serialize( [ { "a": [] } ] )
+        binaryapiv4.deserialize( message, DecodeLimits( max_depth=3 ) )
+        binaryapiv4.deserialize_trusted( message, DecodeLimits( max_depth=3 ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize( message, DecodeLimits( max_depth=2 ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize_trusted( message, DecodeLimits( max_depth=2 ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize_iterative( message, limits=DecodeLimits( max_depth=2 ) )
+
+    def test_max_message_size(self):
+        message = binaryapiv4.serialize( "abcdef" )
+        binaryapiv4.deserialize( message, DecodeLimits( max_message_size=len( message ) ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize( message, DecodeLimits( max_message_size=len( message ) - 1 ) )
+
+    def test_stream(self):
+        limits = DecodeLimits( max_elements=2, max_message_size=32 )
+        stream = DeserializationStreamV4( binaryapiv4.serialize( [ 1, 2 ] ), limits )
+        self.assertEqual( stream.receive(), ( True, [ 1, 2 ] ) )
+        stream.appendData( binaryapiv4.serialize( [ 1, 2, 3 ] ) )
+        with self.assertRaises( ValueError ):
+            stream.receive()
+        ## too big message is rejected after receiving its header
+        stream.appendData( b'\xff\x00\x00\x00' )
+        with self.assertRaises( ValueError ):
+            stream.receive()
@@ -22,8 +22,13 @@
 #
 
 import unittest
+import io
+import socket
 
 from gdtype.deserializationstreamv4 import DeserializationStreamV4
+from gdtype.deserializationstreamv3 import DeserializationStreamV3
+from gdtype.binaryapiv4 import serialize
+from gdtype import binaryapiv3
 
 
 class DeserializationStreamV4Test(unittest.TestCase):
@@ -50,3 +55,100 @@ class DeserializationStreamV4Test(unittest.TestCase):
         self.assertEqual( stream.size(), 2 )
         self.assertEqual( result[0], True )
         self.assertEqual( result[1], 123 )
+
+    def test_size_less(self):
+        raw_bytes = b'\x08\x00\x00\x00\x02\x00\x00\x00{\x00'
+        stream = DeserializationStreamV4( raw_bytes )
+        result = stream.receive()
+        self.assertEqual( stream.size(), 10 )
+        self.assertEqual( result[0], False )
+        self.assertEqual( result[1], -2 )
+        self.assertEqual( stream.containsMessage(), False )
+
+    def test_append_partial(self):
+        raw_bytes = serialize( "DO_STEP" ) + serialize( [ 1, 2 ] )
+        stream = DeserializationStreamV4()
+        received = []
+        for i in range( len( raw_bytes ) ):
+            stream.appendData( raw_bytes[ i:i + 1 ] )
+            received.extend( stream.receiveList() )
+        self.assertEqual( received, [ "DO_STEP", [ 1, 2 ] ] )
+        self.assertEqual( stream.size(), 0 )
+
+    def test_receiveList_compact(self):
+        message = serialize( 123 )
+        stream = DeserializationStreamV4()
+        stream.COMPACT_THRESHOLD = 16
+        stream.appendData( message[ :5 ] )
+        for _ in range( 100 ):
+            stream.appendData( message[ 5: ] + message * 3 + message[ :5 ] )
+            self.assertEqual( stream.receiveList(), [ 123 ] * 4 )
+            self.assertEqual( stream.size(), 5 )
+            self.assertLess( len( stream.buffer ), 8 * len( message ) )
+
+    def test_invalid_message_dropped(self):
+        raw_bytes = b'\x04\x00\x00\x00\xff\x00\x00\x00' + serialize( 123 )
+        stream = DeserializationStreamV4( raw_bytes )
+        with self.assertRaises( ValueError ):
+            stream.receive()
+        self.assertEqual( stream.receiveList(), [ 123 ] )
+
+    def test_negative_size_dropped(self):
+        stream = DeserializationStreamV4( b'\xff\xff\xff\xff' + serialize( 7 ) )
+        with self.assertRaises( ValueError ):
+            stream.receive()
+        self.assertEqual( stream.receive(), (True, 7) )
+        self.assertEqual( stream.size(), 0 )
+
+    def test_writeBuffer(self):
+        raw_bytes = serialize( "DO_STEP" ) + serialize( [ 1, 2 ] )
+        stream = DeserializationStreamV4()
+        view = stream.getWriteBuffer( 8 )
+        self.assertGreaterEqual( len( view ), 8 )
+        view[ :8 ] = raw_bytes[ :8 ]
+        stream.commitWrite( 8 )
+        self.assertEqual( stream.size(), 8 )
+        stream.appendData( raw_bytes[ 8:12 ] )
+        view = stream.getWriteBuffer( 1024 )
+        view[ :len( raw_bytes ) - 12 ] = raw_bytes[ 12: ]
+        stream.commitWrite( len( raw_bytes ) - 12 )
+        self.assertEqual( stream.receiveList(), [ "DO_STEP", [ 1, 2 ] ] )
+        self.assertEqual( stream.size(), 0 )
+
+    def test_writeBuffer_commit_invalid(self):
+        stream = DeserializationStreamV4()
+        with self.assertRaises( ValueError ):
+            stream.commitWrite( 0 )
+        view = stream.getWriteBuffer( 4 )
+        with self.assertRaises( ValueError ):
+            stream.commitWrite( len( view ) + 1 )
+        stream.commitWrite( 0 )
+        ## view is released after commit
+        with self.assertRaises( ValueError ):
+            view[ 0 ] = 1
+
+    def test_receiveFromSocket(self):
+        messages = [ "DO_STEP", [ 1, 2 ], { "aaa": 1.5 } ] * 50
+        raw_bytes = b"".join( serialize( item ) for item in messages )
+        sender, receiver = socket.socketpair()
+        try:
+            sender.sendall( raw_bytes )
+            sender.close()
+            stream = DeserializationStreamV4()
+            received = []
+            while stream.receiveFromSocket( receiver, 100 ) > 0:
+                received.extend( stream.receiveList() )
+        finally:
+            receiver.close()
+        self.assertEqual( received, messages )
+        self.assertEqual( stream.size(), 0 )
+
+    def test_readFromFile(self):
+        messages = [ "DO_STEP", 123 ] * 10
+        raw_bytes = b"".join( binaryapiv3.serialize( item ) for item in messages )
+        file = io.BytesIO( raw_bytes )
+        stream = DeserializationStreamV3()
+        received = []
+        while stream.readFromFile( file, 7 ) > 0:
+            received.extend( stream.receiveList() )
+        self.assertEqual( received, messages )
@@ -0,0 +1,88 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import os
+import sys
+import re
+import subprocess
+import unittest
+import logging
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SRC_DIR = os.path.abspath( os.path.join( os.path.dirname( __file__ ), ".." ) )
+
+
+## run 'python -X importtime' in clean interpreter
+## returns pair: ( dict of cumulative import times in microseconds, list of imported modules )
+def measure_import( module_name: str ):
+    code = f"import sys, {module_name}; print( ','.join( sorted( sys.modules ) ) )"
+    env  = dict( os.environ )
+    env[ "PYTHONPATH" ] = SRC_DIR
+    result = subprocess.run( [ sys.executable, "-X", "importtime", "-c", code ],
+                             capture_output=True, text=True, check=True, env=env )
+    times = {}
+    for line in result.stderr.splitlines():
+        matched = re.match( r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)", line )
+        if matched is None:
+            continue
+        times[ matched.group(4) ] = int( matched.group(2) )
+    modules = result.stdout.strip().split( "," )
+    return ( times, modules )
+
+
+class ImportTimeTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_binaryapiv4(self):
+        times, modules = measure_import( "gdtype.binaryapiv4" )
+        _LOGGER.info( "import time of gdtype.binaryapiv4: %s us", times[ "gdtype.binaryapiv4" ] )
+        self.assertIn( "gdtype.binaryapiv4", times )
+        self.assertNotIn( "numpy", modules )
+
+    def test_binaryapiv3(self):
+        times, modules = measure_import( "gdtype.binaryapiv3" )
+        _LOGGER.info( "import time of gdtype.binaryapiv3: %s us", times[ "gdtype.binaryapiv3" ] )
+        self.assertIn( "gdtype.binaryapiv3", times )
+        self.assertNotIn( "numpy", modules )
+
+    def test_deserializationstreamv4(self):
+        _, modules = measure_import( "gdtype.deserializationstreamv4" )
+        self.assertNotIn( "numpy", modules )
+
+
+## ============================= main section ===================================
+
+
+if __name__ == '__main__':
+    ## print import times
+    for name in [ "gdtype.commontypes", "gdtype.binaryapiv3", "gdtype.binaryapiv4" ]:
+        import_times, _ = measure_import( name )
+        print( f"{name:<30} {import_times[ name ]:8} us" )
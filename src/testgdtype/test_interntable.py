@@ -0,0 +1,89 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype.commontypes import InternTable, StringName, NodePath, DecodeLimits
+from gdtype.deserializationstreamv4 import DeserializationStreamV4
+
+
+class InternTableTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_same_objects(self):
+        value = [ [ "abc", StringName( "abc" ), NodePath( "abc" ) ] for _ in range( 3 ) ]
+        message = binaryapiv4.serialize( value )
+        intern = InternTable()
+        received = binaryapiv4.deserialize( message, intern=intern )
+        self.assertEqual( received, value )
+        self.assertIs( received[0][1], received[2][1] )
+        self.assertIs( received[0][2], received[1][2] )
+        self.assertEqual( intern.misses, 3 )
+        self.assertEqual( intern.hits, 6 )
+        self.assertEqual( len( intern ), 3 )
+
+        received = binaryapiv4.deserialize_trusted( message, intern=intern )
+        self.assertEqual( received, value )
+        self.assertEqual( intern.hits, 15 )
+
+    def test_v3(self):
+        value = { "key": [ "abc", "abc", NodePath( "a/b" ), "" ] }
+        message = binaryapiv3.serialize( value )
+        intern = InternTable()
+        self.assertEqual( binaryapiv3.deserialize( message, intern=intern ), value )
+        self.assertEqual( intern.hits, 1 )
+
+    def test_lru(self):
+        intern = InternTable( max_size=2 )
+        binaryapiv4.deserialize( binaryapiv4.serialize( [ "a", "b", "a", "c", "b" ] ), intern=intern )
+        self.assertEqual( intern.hits, 1 )
+        self.assertEqual( intern.misses, 4 )
+        self.assertEqual( [ key[1] for key in intern.values ], [ b"c", b"b" ] )
+
+    def test_max_length(self):
+        intern = InternTable( max_length=4 )
+        value = [ "abcdef", "abcdef", "abcd", "abcd" ]
+        self.assertEqual( binaryapiv4.deserialize( binaryapiv4.serialize( value ), intern=intern ), value )
+        self.assertEqual( intern.hits, 1 )
+        self.assertEqual( len( intern ), 1 )
+
+    def test_limits(self):
+        message = binaryapiv4.serialize( [ "abcdef" ] )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize( message, DecodeLimits( max_string_bytes=5 ), intern=InternTable() )
+
+    def test_stream(self):
+        intern = InternTable()
+        stream = DeserializationStreamV4( intern=intern )
+        stream.appendData( bytearray( binaryapiv4.serialize( StringName( "abc" ) ) * 2 ) )
+        received = stream.receiveList()
+        self.assertIs( received[0], received[1] )
+        self.assertEqual( intern.hits, 1 )
@@ -0,0 +1,92 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import unittest
+from collections import OrderedDict
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype.commontypes import Vector3, Int32Array
+
+
+def nested_list( depth: int ):
+    value = []
+    for _ in range( depth ):
+        value = [ value ]
+    return value
+
+
+class IterativeTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_same_as_recursive(self):
+        value = { "a": [ 1, 2.5, "abc", { 3: None, "b": [] } ], "c": {}, "d": Vector3( [1.0, 2.0, 3.0] ),
+                  "e": Int32Array( [ 1, 2 ] ), "f": [ [ [ True ] ] ] }
+        for api in [ binaryapiv4, binaryapiv3 ]:
+            message = api.serialize( value )
+            self.assertEqual( api.serialize_iterative( value ), message )
+            self.assertEqual( api.deserialize_iterative( message ), value )
+
+    def test_scalar(self):
+        message = binaryapiv4.serialize( 123 )
+        self.assertEqual( binaryapiv4.serialize_iterative( 123 ), message )
+        self.assertEqual( binaryapiv4.deserialize_iterative( message ), 123 )
+
+    def test_subclass(self):
+        value = OrderedDict( [ ( "a", [ 1, 2 ] ) ] )
+        message = binaryapiv4.serialize_iterative( value )
+        self.assertEqual( message, binaryapiv4.serialize( { "a": [ 1, 2 ] } ) )
+
+    def test_deep(self):
+        value   = nested_list( 10000 )
+        message = binaryapiv4.serialize_iterative( value )
+        with self.assertRaises( RecursionError ):
+            binaryapiv4.deserialize( message )
+        self.assertEqual( len( message ), 4 + 8 * 10001 )
+        result = binaryapiv4.deserialize_iterative( message )
+        depth = 0
+        while result:
+            result = result[0]
+            depth += 1
+        self.assertEqual( depth, 10000 )
+
+    def test_max_depth(self):
+        message = binaryapiv4.serialize( nested_list( 3 ) )
+        self.assertEqual( binaryapiv4.deserialize_iterative( message, 4 ), nested_list( 3 ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize_iterative( message, 3 )
+        self.assertEqual( binaryapiv4.serialize_iterative( nested_list( 3 ), 4 ), message )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.serialize_iterative( nested_list( 3 ), 3 )
+
+    def test_invalid(self):
+        message = binaryapiv4.serialize( [ 1, 2 ] )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize_iterative( message[ :-4 ] )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.serialize_iterative( [ 1, object() ] )
@@ -0,0 +1,130 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import unittest
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype import commontypes as ct
+from gdtype.bytescontainer import BytesReader
+from gdtype.lazy import LazyDict, LazyList
+from gdtype.commontypes import Vector2, Vector3, Color, StringName, NodePath, RID, \
+    Transform3D, Projection, ByteArray, Int32Array, Int64Array, Float64Array, StringArray, \
+    Vector2Array, ColorArray
+
+
+def sample_values():
+    return [ None, True, -7, 1.5, "", "abcde", Vector2( [1.0, 2.0] ), Vector3( [1.0, 2.0, 3.0] ),
+             Color( [0.5, 0.5, 0.5, 1.0] ), StringName( "name" ), NodePath( "a/b" ), RID( 12 ),
+             Transform3D( [ 1.0 ] * 12 ), Projection( [ 2.0 ] * 16 ),
+             ByteArray( b"abc" ), Int32Array( [ 1, 2 ] ), Int64Array( [ 3 ] ), Float64Array( [ 1.5 ] ),
+             StringArray( [ "a", "bcdef" ] ), Vector2Array( [ (1.0, 2.0) ] ), ColorArray( [ (1.0, 1.0, 1.0, 1.0) ] ),
+             [ 1, [ "a", {} ] ], { "a": [ 1, 2 ], 3: { "b": None } } ]
+
+
+class SkipTypeTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_skip_v4(self):
+        for value in sample_values():
+            message = binaryapiv4.serialize( value )
+            data = BytesReader( message, 4, codec=binaryapiv4.CODEC )
+            ct.skip_type( data )
+            self.assertEqual( data.size(), 0, value )
+
+    def test_skip_v3(self):
+        for value in [ None, 2, "abc", Vector3( [1.0, 2.0, 3.0] ), [ 1, { "a": Int32Array( [ 1 ] ) } ] ]:
+            message = binaryapiv3.serialize( value )
+            data = BytesReader( message, 4, codec=binaryapiv3.CODEC )
+            ct.skip_type( data )
+            self.assertEqual( data.size(), 0, value )
+
+    def test_skip_too_short(self):
+        message = binaryapiv4.serialize( [ "abcdef" ] )
+        data = BytesReader( message[ :-4 ], 4, codec=binaryapiv4.CODEC )
+        with self.assertRaises( ValueError ):
+            ct.skip_type( data )
+
+
+class LazyTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_scalar(self):
+        self.assertEqual( binaryapiv4.deserialize_lazy( binaryapiv4.serialize( "abc" ) ), "abc" )
+
+    def test_dict(self):
+        value = { "state": { str( i ): [ i, float( i ) ] for i in range( 100 ) }, "type": "update", "room_id": 12 }
+        result = binaryapiv4.deserialize_lazy( binaryapiv4.serialize( value ) )
+        self.assertIsInstance( result, LazyDict )
+        self.assertEqual( result[ "type" ], "update" )
+        self.assertEqual( result[ "room_id" ], 12 )
+        state = result[ "state" ]
+        self.assertIsInstance( state, LazyDict )
+        self.assertEqual( state[ "42" ], [ 42, 42.0 ] )
+        self.assertEqual( list( state._values.keys() ), [ "42" ] )
+        self.assertEqual( result, value )
+        self.assertEqual( len( result ), 3 )
+        self.assertEqual( result.decode(), value )
+
+    def test_dict_scan_partial(self):
+        value = { "aaa": 1, "bbb": 2, "ccc": 3 }
+        result = binaryapiv4.deserialize_lazy( binaryapiv4.serialize( value ) )
+        self.assertEqual( result[ "aaa" ], 1 )
+        self.assertEqual( list( result._index.keys() ), [ "aaa" ] )
+        self.assertTrue( "ccc" in result )
+        self.assertFalse( "ddd" in result )
+        with self.assertRaises( KeyError ):
+            result[ "ddd" ]             # pylint: disable=W0104
+        self.assertEqual( list( result ), [ "aaa", "bbb", "ccc" ] )
+
+    def test_list(self):
+        value = [ "a", [ 1, { "b": 2 } ], Vector3( [1.0, 2.0, 3.0] ), None ]
+        result = binaryapiv3.deserialize_lazy( binaryapiv3.serialize( value ) )
+        self.assertIsInstance( result, LazyList )
+        self.assertEqual( len( result ), 4 )
+        self.assertEqual( result[ -1 ], None )
+        self.assertIsInstance( result[ 1 ], LazyList )
+        self.assertEqual( result[ 1 ][ 1 ][ "b" ], 2 )
+        self.assertEqual( result[ 1:3 ], value[ 1:3 ] )
+        self.assertEqual( result, value )
+        self.assertEqual( result.decode(), value )
+        with self.assertRaises( IndexError ):
+            result[ 4 ]                 # pylint: disable=W0104
+
+    def test_list_scan_partial(self):
+        value = list( range( 10 ) )
+        result = binaryapiv4.deserialize_lazy( binaryapiv4.serialize( value ) )
+        self.assertEqual( result[ 2 ], 2 )
+        self.assertEqual( len( result._offsets ), 3 )
+        self.assertEqual( list( result ), value )
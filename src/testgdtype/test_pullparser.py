@@ -0,0 +1,111 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import unittest
+import io
+import struct
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype.pullparser import EventType, Event, PullParser
+from gdtype.commontypes import Vector3, Float32Array, StringArray
+
+
+class PullParserTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_scalar(self):
+        events = list( binaryapiv4.iter_events( binaryapiv4.serialize( "abc" ) ) )
+        self.assertEqual( events, [ Event( EventType.SCALAR, 4, "abc" ) ] )
+
+    def test_events(self):
+        value = { "a": [ 1, Vector3( [1.0, 2.0, 3.0] ) ], 3: {}, "b": Float32Array( [ 1.5, 2.5 ] ),
+                  "c": StringArray( [ "x", "yz" ] ) }
+        events = list( binaryapiv4.iter_events( binaryapiv4.serialize( value ) ) )
+        expected = [ Event( EventType.START_DICT, 27, 4 ),
+                     Event( EventType.KEY, 4, "a" ),
+                     Event( EventType.START_ARRAY, 28, 2 ),
+                     Event( EventType.SCALAR, 2, 1 ),
+                     Event( EventType.SCALAR, 9, Vector3( [1.0, 2.0, 3.0] ) ),
+                     Event( EventType.END, 28, None ),
+                     Event( EventType.KEY, 2, 3 ),
+                     Event( EventType.START_DICT, 27, 0 ),
+                     Event( EventType.END, 27, None ),
+                     Event( EventType.KEY, 4, "b" ),
+                     Event( EventType.PACKED_ARRAY, 32, memoryview( struct.pack( "<2f", 1.5, 2.5 ) ) ),
+                     Event( EventType.KEY, 4, "c" ),
+                     Event( EventType.SCALAR, 34, StringArray( [ "x", "yz" ] ) ),
+                     Event( EventType.END, 27, None ) ]
+        self.assertEqual( events, expected )
+        self.assertEqual( events[10].value.cast( "f" ).tolist(), [ 1.5, 2.5 ] )
+
+    def test_file(self):
+        value = [ { "name": "x" * i, "data": list( range( i ) ) } for i in range( 50 ) ]
+        message = binaryapiv3.serialize( value )
+        expected = list( binaryapiv3.iter_events( message ) )
+        file = io.BytesIO( message + binaryapiv3.serialize( 123 ) )
+        events = list( binaryapiv3.iter_events( file, 16 ) )
+        self.assertEqual( events, expected )
+        ## file is read up to end of message
+        self.assertEqual( list( binaryapiv3.iter_events( file ) ), [ Event( EventType.SCALAR, 2, 123 ) ] )
+
+    def test_file_bounded(self):
+        value = [ "a" * 100 ] * 1000
+        file = io.BytesIO( binaryapiv4.serialize( value ) )
+        parser = PullParser( file, binaryapiv4.CODEC, 256 )
+        max_size = 0
+        events_number = 0
+        for _ in parser.events():
+            max_size = max( max_size, len( parser.data.view ) )
+            events_number += 1
+        self.assertEqual( events_number, 1002 )
+        self.assertLess( max_size, 1024 )
+
+    def test_file_truncated(self):
+        message = binaryapiv4.serialize( [ "abc", "def" ] )
+        file = io.BytesIO( message[ :-4 ] )
+        with self.assertRaises( ValueError ):
+            list( binaryapiv4.iter_events( file, 4 ) )
+        with self.assertRaises( ValueError ):
+            list( binaryapiv4.iter_events( message[ :-4 ] ) )
+
+    def test_count_too_big(self):
+        ## Dictionary declaring more items than message contains
+        message = b'\x08\x00\x00\x00\x1b\x00\x00\x00\x00\x00\x00\xa6'
+        with self.assertRaises( ValueError ):
+            list( binaryapiv4.iter_events( message ) )
+        with self.assertRaises( ValueError ):
+            list( binaryapiv4.iter_events( io.BytesIO( message ), 4 ) )
+
+        message = binaryapiv4.serialize( [ "abc", { "a": 1 } ] )
+        for size in range( 4, len( message ) ):
+            truncated = struct.pack( "<i", size - 4 ) + message[ 4:size ]
+            with self.assertRaises( ValueError ):
+                list( binaryapiv4.iter_events( truncated ) )
+            with self.assertRaises( ValueError ):
+                list( binaryapiv4.iter_events( io.BytesIO( truncated ), 4 ) )
@@ -0,0 +1,79 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import unittest
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype.query import extract, extract_list, parse_path
+from gdtype.commontypes import Vector3, StringName
+
+
+class QueryTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_parse_path(self):
+        self.assertEqual( parse_path( "a/3/b" ), [ "a", "3", "b" ] )
+        self.assertEqual( parse_path( "/a/" ), [ "a" ] )
+        self.assertEqual( parse_path( [ "a", 3 ] ), [ "a", 3 ] )
+
+    def test_extract(self):
+        players = [ { "name": f"p{i}", "position": Vector3( [ 1.0, 2.0, float( i ) ] ) } for i in range( 5 ) ]
+        value = { "type": "state", "room_id": 7, "players": players }
+        message = binaryapiv4.serialize( value )
+        self.assertEqual( binaryapiv4.extract( message, "players/3/position" ), Vector3( [ 1.0, 2.0, 3.0 ] ) )
+        self.assertEqual( binaryapiv4.extract( message, [ "players", -1, "name" ] ), "p4" )
+        self.assertEqual( binaryapiv4.extract( message, "players/0" ), players[0] )
+        self.assertEqual( binaryapiv4.extract( message, "" ), value )
+        self.assertEqual( extract_list( message, [ "type", "room_id" ], binaryapiv4.CODEC ), [ "state", 7 ] )
+
+    def test_extract_v3(self):
+        value = { "type": "state", "data": [ 1, { "x": 2 } ] }
+        message = binaryapiv3.serialize( value )
+        self.assertEqual( binaryapiv3.extract( message, "data/1/x" ), 2 )
+        self.assertEqual( extract( message, "type", binaryapiv3.CODEC ), "state" )
+
+    def test_extract_keys(self):
+        value = { 3: "int", "name": "string_name" }
+        message = binaryapiv4.serialize( value )
+        self.assertEqual( binaryapiv4.extract( message, "3" ), "int" )
+        self.assertEqual( binaryapiv4.extract( message, [ 3 ] ), "int" )
+        self.assertEqual( binaryapiv4.extract( message, "name" ), "string_name" )
+        self.assertEqual( binaryapiv4.extract( message, [ StringName( "name" ) ] ), "string_name" )
+
+    def test_extract_missing(self):
+        message = binaryapiv4.serialize( { "aaa": [ 1, 2 ] } )
+        with self.assertRaises( KeyError ):
+            binaryapiv4.extract( message, "bbb" )
+        with self.assertRaises( KeyError ):
+            binaryapiv4.extract( message, "aaa/2" )
+        with self.assertRaises( KeyError ):
+            binaryapiv4.extract( message, "aaa/x" )
+        with self.assertRaises( KeyError ):
+            binaryapiv4.extract( message, "aaa/0/ccc" )
+        self.assertIsNone( binaryapiv4.extract( message, "bbb", None ) )
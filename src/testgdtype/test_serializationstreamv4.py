@@ -0,0 +1,94 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import unittest
+import socket
+
+from gdtype.serializationstreamv4 import SerializationStreamV4
+from gdtype.serializationstreamv3 import SerializationStreamV3
+from gdtype.deserializationstreamv4 import DeserializationStreamV4
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+
+
+class SerializationStreamV4Test(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_appendValue(self):
+        stream = SerializationStreamV4()
+        size = stream.appendValue( 123 )
+        self.assertEqual( size, 12 )
+        stream.appendValue( "DO_STEP" )
+        expected = binaryapiv4.serialize( 123 ) + binaryapiv4.serialize( "DO_STEP" )
+        self.assertEqual( stream.size(), len( expected ) )
+        self.assertEqual( stream.popData(), expected )
+        self.assertEqual( stream.size(), 0 )
+
+    def test_appendValue_v3(self):
+        values = [ 123, "DO_STEP", [ 1.5, None ] ]
+        stream = SerializationStreamV3()
+        stream.appendList( values )
+        expected = b"".join( binaryapiv3.serialize( item ) for item in values )
+        self.assertEqual( stream.popData(), expected )
+
+    def test_appendValue_invalid(self):
+        stream = SerializationStreamV4()
+        stream.appendValue( 123 )
+        with self.assertRaises( ValueError ):
+            stream.appendValue( [ 1, object() ] )
+        ## partial message is dropped
+        self.assertEqual( stream.popData(), binaryapiv4.serialize( 123 ) )
+
+    def test_popData_chunks(self):
+        values = list( range( 10 ) )
+        stream = SerializationStreamV4()
+        stream.appendList( values )
+        expected = stream.writer.getBytes()
+        chunks = []
+        while stream.size() > 0:
+            chunks.append( stream.popData( 7 ) )
+        self.assertTrue( all( len( item ) <= 7 for item in chunks ) )
+        self.assertEqual( b"".join( chunks ), expected )
+
+    def test_sendToSocket(self):
+        values = [ "DO_STEP", [ 1, 2 ], { "aaa": 1.5 } ] * 20
+        stream = SerializationStreamV4()
+        stream.appendList( values )
+        sender, receiver = socket.socketpair()
+        try:
+            sent = stream.sendToSocket( sender )
+            sender.close()
+            self.assertEqual( stream.size(), 0 )
+            self.assertEqual( stream.sendToSocket( sender ), 0 )
+            decoder = DeserializationStreamV4()
+            while decoder.receiveFromSocket( receiver ) > 0:
+                pass
+        finally:
+            receiver.close()
+        self.assertEqual( decoder.size(), sent )
+        self.assertEqual( decoder.receiveList(), values )
@@ -0,0 +1,119 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype.commontypes import ShapeCache, Vector3, DecodeLimits, deserialize_custom, deserialize_type
+from gdtype.deserializationstreamv4 import DeserializationStreamV4
+
+
+class ShapeCacheTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_hits(self):
+        value = [ { "id": i, "pos": Vector3( [1.0, 2.0, 3.0] ), "name": f"e{i}" } for i in range( 10 ) ]
+        message = binaryapiv4.serialize( value )
+        shapes = ShapeCache()
+        self.assertEqual( binaryapiv4.deserialize( message, shapes=shapes ), value )
+        self.assertEqual( shapes.hits, 8 )
+        self.assertEqual( shapes.misses, 2 )
+        self.assertEqual( binaryapiv4.deserialize_trusted( message, shapes=shapes ), value )
+        self.assertEqual( shapes.hits, 18 )
+
+    def test_different_keys(self):
+        value = [ { "a": 1, "b": 2 }, { "a": 3, "b": 4 }, { "a": 5, "c": 6 }, { "a": 7, "b": 8 }, { "b": 9, "a": 10 },
+                  { 1: "a", 2: "b" }, { 1: "c", 2: "d" }, { 1: "e", 2: "f" }, { "a": 1 }, { "a": { "a": 2 } } ]
+        message = binaryapiv3.serialize( value )
+        shapes = ShapeCache()
+        self.assertEqual( binaryapiv3.deserialize( message, shapes=shapes ), value )
+        self.assertEqual( shapes.hits, 1 )
+        self.assertEqual( shapes.misses, 7 )
+
+    def test_record(self):
+        value = [ { "id": i, "class": "x" } for i in range( 3 ) ]
+        message = binaryapiv4.serialize( value )
+        received = binaryapiv4.deserialize( message, shapes=ShapeCache( record=True ) )
+        self.assertEqual( tuple( received[0] ), ( 0, "x" ) )
+        self.assertEqual( tuple( received[1] ), ( 1, "x" ) )
+        self.assertEqual( received[2].id, 2 )
+        self.assertEqual( tuple( received[2] ), ( 2, "x" ) )
+        self.assertEqual( received[2]._fields, ( "id", "_1" ) )
+
+    def test_record_type(self):
+        ## type of decoded value does not depend on state of cache
+        value = [ { "a": 1, "b": 2 } ] * 4 + [ { "a": 1, "c": 2 } ] * 2 + [ { 1: "a" } ] * 2
+        message = binaryapiv4.serialize( value )
+        received = binaryapiv4.deserialize( message, shapes=ShapeCache( record=True, max_shapes=1 ) )
+        for item in received[ :6 ]:
+            self.assertIsInstance( item, tuple )
+        self.assertEqual( [ tuple( item ) for item in received[ :6 ] ], [ ( 1, 2 ) ] * 6 )
+        self.assertEqual( received[4]._fields, ( "a", "c" ) )
+        for item in received[ 6: ]:
+            self.assertIs( type( item ), dict )
+        for item in binaryapiv4.deserialize( message, shapes=ShapeCache() ):
+            self.assertIs( type( item ), dict )
+
+    def test_max_shapes(self):
+        value = [ { f"key{i}": i } for i in range( 10 ) ] * 2
+        message = binaryapiv4.serialize( value )
+        shapes = ShapeCache( max_shapes=4 )
+        self.assertEqual( binaryapiv4.deserialize( message, shapes=shapes ), value )
+        self.assertEqual( len( shapes.shapes ), 4 )
+        self.assertEqual( shapes.hits, 0 )
+
+    def test_seen_bounded(self):
+        shapes = ShapeCache( max_shapes=16 )
+        stream = DeserializationStreamV4( shapes=shapes )
+        for i in range( 1000 ):
+            stream.appendData( binaryapiv4.serialize( { f"k{i}": 1 } ) )
+        self.assertEqual( len( stream.receiveList() ), 1000 )
+        self.assertLessEqual( len( shapes.seen ), 16 )
+        self.assertEqual( len( shapes.shapes ), 0 )
+
+    def test_limits(self):
+        message = binaryapiv4.serialize( [ { "abcdef": 1 } ] * 3 )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize( message, DecodeLimits( max_string_bytes=5 ) )
+
+    def test_stream(self):
+        value = { "id": 1, "name": "abc" }
+        stream = DeserializationStreamV4( shapes=ShapeCache() )
+        for _ in range( 3 ):
+            stream.appendData( binaryapiv4.serialize( value ) )
+        self.assertEqual( stream.receiveList(), [ value ] * 3 )
+        self.assertEqual( stream.shapes.hits, 1 )
+        ## cache is not used by default
+        self.assertIsNone( DeserializationStreamV4().shapes )
+
+    def test_no_codec(self):
+        message = binaryapiv4.serialize( { "a": 1 } )
+        with self.assertRaises( ValueError ):
+            deserialize_custom( message, deserialize_type, shapes=ShapeCache() )
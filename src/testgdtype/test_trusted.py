@@ -0,0 +1,71 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype.commontypes import DecodeLimits, Vector2, Vector2i, Rect2, Rect2i, Vector3, Vector3i, Transform2D, \
+    Vector4, Vector4i, Plane, Quaternion, AABB, Basis, Transform3D, Projection, Color, StringName, NodePath, \
+    Int32Array, Float64Array, StringArray
+
+
+class DeserializeTrustedTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_equal_v4(self):
+        value = [ None, True, False, -7, 1.5, "", "abcde", StringName( "name" ), NodePath( "a/b" ),
+                  Vector2( [1.0, 2.0] ), Vector2i( [1, -2] ), Rect2( [1.0, 2.0, 3.0, 4.0] ), Rect2i( [1, 2, 3, 4] ),
+                  Vector3( [1.5, 2.5, 3.5] ), Vector3i( [1, 2, -3] ), Transform2D( [1.0] * 6 ),
+                  Vector4( [1.0] * 4 ), Vector4i( [1] * 4 ), Plane( [1.0] * 4 ), Quaternion( [1.0] * 4 ),
+                  AABB( [1.0] * 6 ), Basis( [1.0] * 9 ), Transform3D( [1.0] * 12 ), Projection( [1.0] * 16 ),
+                  Color( [0.5] * 4 ), { "a": [ 1, { 2: "b" } ], 3: [] }, {},
+                  Int32Array( [ 1, 2 ] ), Float64Array( [ 1.5 ] ), StringArray( [ "x", "yz" ] ) ]
+        message = binaryapiv4.serialize( value )
+        self.assertEqual( binaryapiv4.deserialize_trusted( message ), binaryapiv4.deserialize( message ) )
+
+    def test_equal_v3(self):
+        value = { "aaa": [ 1, 2.5, "DO_STEP", Vector3( [1.0, 2.0, 3.0] ) ], 5: Int32Array( [31, -32, 33] ), "": None }
+        message = binaryapiv3.serialize( value )
+        self.assertEqual( binaryapiv3.deserialize_trusted( message ), binaryapiv3.deserialize( message ) )
+
+    def test_truncated(self):
+        message = binaryapiv4.serialize( [ 1, "abcdefgh", Vector3( [1.0, 2.0, 3.0] ), 2.5 ] )
+        for size in range( 8, len( message ) ):
+            ## keep length header consistent with truncated data
+            truncated = bytes( [ size - 4, 0, 0, 0 ] ) + message[ 4:size ]
+            with self.assertRaises( ValueError ):
+                binaryapiv4.deserialize_trusted( truncated )
+
+    def test_limits(self):
+        message = binaryapiv4.serialize( [ { "a": [ 1 ] } ] )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize_trusted( message, DecodeLimits( max_depth=2 ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize_trusted( message, DecodeLimits( max_elements=2 ) )
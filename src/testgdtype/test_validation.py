@@ -0,0 +1,136 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import unittest
+import gc
+import weakref
+
+from gdtype import binaryapiv4
+from gdtype import binaryapiv3
+from gdtype.commontypes import Vector3, NodePath, Int32Array, StringArray, ColorArray
+from gdtype.codec import Codec
+
+
+class ValidateTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_valid(self):
+        value = { "a": [ 1, "abc", Vector3( [1.0, 2.0, 3.0] ) ], "b": { "c": NodePath( "x/y" ) },
+                  "d": Int32Array( [ 1, 2 ] ), "e": StringArray( [ "xyz" ] ), "f": [] }
+        message = binaryapiv4.serialize( value )
+        result = binaryapiv4.validate( message )
+        self.assertTrue( result )
+        self.assertEqual( result.gd_type, binaryapiv4.GodotType.DICT.value )
+        self.assertEqual( result.size, len( message ) )
+        self.assertEqual( result.values, 16 )
+        self.assertEqual( result.depth, 2 )
+        self.assertIsNone( result.error )
+        self.assertEqual( result.offset, -1 )
+
+    def test_valid_v3(self):
+        message = binaryapiv3.serialize( [ 1, "abc" ] )
+        result = binaryapiv3.validate( message )
+        self.assertTrue( result )
+        self.assertEqual( result.gd_type, binaryapiv3.GodotType.LIST.value )
+
+    def test_too_short(self):
+        result = binaryapiv4.validate( b'\x04\x00\x00\x00' )
+        self.assertFalse( result )
+        self.assertEqual( result.offset, 0 )
+
+    def test_size_mismatch(self):
+        message = binaryapiv4.serialize( [ 1, "abc" ] )
+        result = binaryapiv4.validate( message[ :-4 ] )
+        self.assertFalse( result )
+        self.assertEqual( result.offset, 0 )
+
+    def test_invalid_type(self):
+        message = bytearray( binaryapiv4.serialize( [ 1, 2 ] ) )
+        message[ 20 ] = 200
+        result = binaryapiv4.validate( message )
+        self.assertFalse( result )
+        self.assertEqual( result.offset, 20 )
+        self.assertIn( "200", result.error )
+        ## Godot 4 type not supported by Godot 3 API
+        self.assertFalse( binaryapiv3.validate( binaryapiv4.serialize( ColorArray( [ (1.0, 1.0, 1.0, 1.0) ] ) ) ) )
+
+    def test_too_many_items(self):
+        ## list declaring 1000000 items
+        message = b'\x0c\x00\x00\x00\x1c\x00\x00\x00\x40\x42\x0f\x00\x00\x00\x00\x00'
+        result = binaryapiv4.validate( message )
+        self.assertFalse( result )
+        self.assertEqual( result.offset, 4 )
+        self.assertIn( "too many items", result.error )
+
+    def test_string_too_long(self):
+        message = bytearray( binaryapiv4.serialize( [ "abcde" ] ) )
+        message[ 16 ] = 9
+        result = binaryapiv4.validate( message )
+        self.assertFalse( result )
+        self.assertEqual( result.offset, 12 )
+
+    def test_negative_size(self):
+        message = b'\x0c\x00\x00\x00\x1e\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00'
+        result = binaryapiv4.validate( message )
+        self.assertFalse( result )
+        self.assertIn( "negative", result.error )
+
+    def test_trailing_data(self):
+        message = binaryapiv4.serialize( 1 )
+        message = b'\x0c' + message[ 1:] + b'\x00\x00\x00\x00'
+        result = binaryapiv4.validate( message )
+        self.assertFalse( result )
+        self.assertEqual( result.offset, 12 )
+
+    def test_max_depth(self):
+        message = binaryapiv4.serialize( [ [ [ 1 ] ] ] )
+        self.assertTrue( binaryapiv4.validate( message, 3 ) )
+        result = binaryapiv4.validate( message, 2 )
+        self.assertFalse( result )
+        self.assertEqual( result.offset, 20 )
+
+    def test_max_depth_empty(self):
+        ## empty container at the limit counts the same as in iterative decoder
+        message = binaryapiv4.serialize( [ [ [] ] ] )
+        result = binaryapiv4.validate( message, 3 )
+        self.assertTrue( result )
+        self.assertEqual( result.depth, 3 )
+        self.assertEqual( binaryapiv4.deserialize_iterative( message, 3 ), [ [ [] ] ] )
+        self.assertFalse( binaryapiv4.validate( message, 2 ) )
+        with self.assertRaises( ValueError ):
+            binaryapiv4.deserialize_iterative( message, 2 )
+
+    def test_codec_released(self):
+        ## validation table is kept by codec, so codec is not kept alive by validation
+        codec = Codec( binaryapiv4.CONFIG_LIST )
+        self.assertTrue( codec.validate( binaryapiv4.serialize( [ 1, "abc" ] ) ) )
+        self.assertIsNotNone( codec.validation_table )
+        codec_ref = weakref.ref( codec )
+        del codec
+        gc.collect()
+        self.assertIsNone( codec_ref() )